@@ -4,3 +4,6 @@ class NominopolitanConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "nominopolitan"
     verbose_name = "Neapolitan"
+
+    def ready(self):
+        from . import checks  # noqa: F401 - registers system checks
@@ -0,0 +1,96 @@
+"""
+This module provides the model version stamps used by nominopolitan's fragment cache.
+
+Each model has a version token in the cache. Cached fragments include the
+tokens of the models they display in their keys, so changing a model's token
+makes every fragment depending on it unreachable; those entries then expire.
+
+Key Components:
+- get_cache: The cache backend holding version stamps and fragments
+- get_model_versions: The current version token of each of a set of models
+- bump_model_version: Invalidate cached fragments which depend on a model
+- watch_models: Bump a model's version whenever it is saved or deleted
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+_watched_models = set()
+
+
+def get_cache():
+    """
+    Get the cache used for version stamps and fragments.
+
+    Returns:
+        BaseCache: caches[settings.NOMINOPOLITAN_CACHE_ALIAS], default 'default'
+    """
+    return caches[getattr(settings, "NOMINOPOLITAN_CACHE_ALIAS", "default")]
+
+
+def get_version_key(model):
+    return f"nominopolitan:version:{model._meta.label_lower}"
+
+
+def get_model_versions(models):
+    """
+    Get the current version token of each model, creating any that are missing.
+
+    Args:
+        models (iterable): Model classes
+
+    Returns:
+        tuple[str, ...]: The version tokens, in the order of the sorted model labels
+    """
+    cache = get_cache()
+    keys = sorted({get_version_key(model) for model in models})
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            token = uuid.uuid4().hex
+            # another process may have created the token in the meantime
+            if not cache.add(key, token, None):
+                token = cache.get(key, token)
+            versions[key] = token
+    return tuple(versions[key] for key in keys)
+
+
+def bump_model_version(model):
+    """
+    Invalidate all cached fragments which depend on a model.
+
+    The token is deleted rather than replaced: the next reader creates a new one,
+    so changes to models nothing is cached for only cost a delete.
+
+    Args:
+        model: The model class (or instance) that changed
+    """
+    get_cache().delete(get_version_key(model))
+
+
+def model_changed(sender, **kwargs):
+    """post_save / post_delete receiver connected by watch_models()."""
+    bump_model_version(sender)
+
+
+def watch_models(models):
+    """
+    Bump the version of each model whenever one of its instances is saved or deleted.
+
+    Receivers are connected per model rather than for all senders, because any
+    post_delete receiver stops Django from fast-deleting that model's rows in
+    cascades.
+
+    Args:
+        models (iterable): Model classes
+    """
+    for model in models:
+        if model in _watched_models:
+            continue
+        label = model._meta.label_lower
+        post_save.connect(model_changed, sender=model, dispatch_uid=f"nominopolitan_saved_{label}")
+        post_delete.connect(model_changed, sender=model, dispatch_uid=f"nominopolitan_deleted_{label}")
+        _watched_models.add(model)
@@ -0,0 +1,329 @@
+"""
+System checks for views using NominopolitanMixin.
+
+Each view class reachable from the root URLconf has its field and property
+configuration resolved at startup, so that mistakes are reported by
+`manage.py check` (and runserver) rather than as errors at request time.
+
+Check IDs:
+- E001: fields / properties configuration cannot be resolved
+- E002: unknown pagination_mode
+- E003: unknown count_strategy
+- E004: unknown export_formats
+- E005: sortable_fields entry is not a displayed field or property
+- E006: search_fields entry is not a field of the model
+- E007: unknown original_target_storage
+- E008: property_annotations entry is not a property of the model
+- E009: unknown bulk_actions
+- E010: import_form_class is not a ModelForm for the view's model
+- E011: sortable property without sort_keys or property_annotations
+- E012: max_sort_columns is less than 1
+- E013: unknown bulk_update_method
+- E014: bulk_update_fields entry is not an editable field
+- E015: import_batch_size is not a positive integer
+- W001: sortable column without a supporting index
+- W002: sortable column with a nullable key in keyset or infinite pagination
+- W003: fragment cache or version stamp ETags kept in a per-process cache backend
+"""
+
+from django.core import checks
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import FieldDoesNotExist
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from nominopolitan.export import EXPORT_FORMATS
+
+
+def _iter_view_classes(patterns):
+    """Yield the view class of every class-based view in the given URL patterns."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_view_classes(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, "view_class", None)
+            if view_class is not None:
+                yield view_class
+
+
+def get_nominopolitan_views():
+    """
+    Return the distinct NominopolitanMixin view classes registered in the root URLconf.
+
+    Returns:
+        list: View classes in URLconf order
+    """
+    from nominopolitan.mixins import NominopolitanMixin
+
+    views = []
+    for view_class in _iter_view_classes(get_resolver().url_patterns):
+        if issubclass(view_class, NominopolitanMixin) and view_class not in views:
+            views.append(view_class)
+    return views
+
+
+@checks.register(checks.Tags.urls)
+def check_view_configuration(app_configs, **kwargs):
+    """Resolve the configuration of every nominopolitan view and report any errors."""
+    errors = []
+    for view_class in get_nominopolitan_views():
+        try:
+            spec = view_class.get_view_spec()
+        except (ValueError, TypeError) as exc:
+            spec = None
+            errors.append(
+                checks.Error(
+                    str(exc),
+                    obj=view_class,
+                    id="nominopolitan.E001",
+                )
+            )
+        if getattr(view_class, "pagination_mode", "page") not in view_class.PAGINATION_MODES:
+            errors.append(
+                checks.Error(
+                    f"pagination_mode must be one of {', '.join(view_class.PAGINATION_MODES)}",
+                    obj=view_class,
+                    id="nominopolitan.E002",
+                )
+            )
+        if getattr(view_class, "count_strategy", "exact") not in view_class.COUNT_STRATEGIES:
+            errors.append(
+                checks.Error(
+                    f"count_strategy must be one of {', '.join(view_class.COUNT_STRATEGIES)}",
+                    obj=view_class,
+                    id="nominopolitan.E003",
+                )
+            )
+        unknown_formats = set(view_class.export_formats) - set(EXPORT_FORMATS)
+        if unknown_formats:
+            errors.append(
+                checks.Error(
+                    f"Unknown export_formats: {', '.join(sorted(unknown_formats))}",
+                    hint=f"Available formats are {', '.join(EXPORT_FORMATS)}",
+                    obj=view_class,
+                    id="nominopolitan.E004",
+                )
+            )
+        if spec is not None:
+            errors.extend(_check_sorting(view_class, spec))
+        errors.extend(_check_search_fields(view_class))
+        errors.extend(_check_property_annotations(view_class))
+        errors.extend(_check_bulk_actions(view_class))
+        errors.extend(_check_import(view_class))
+        errors.extend(_check_cache(view_class))
+        if view_class.original_target_storage not in view_class.ORIGINAL_TARGET_STORAGES:
+            errors.append(
+                checks.Error(
+                    "original_target_storage must be one of "
+                    f"{', '.join(view_class.ORIGINAL_TARGET_STORAGES)}",
+                    obj=view_class,
+                    id="nominopolitan.E007",
+                )
+            )
+    return errors
+
+
+def _check_property_annotations(view_class):
+    """Report property_annotations which do not stand in for a property of the model."""
+    errors = []
+    for name in view_class.property_annotations:
+        if not isinstance(getattr(view_class.model, name, None), property):
+            errors.append(
+                checks.Error(
+                    f"'{name}' in property_annotations is not a property of "
+                    f"{view_class.model._meta.label}",
+                    obj=view_class,
+                    id="nominopolitan.E008",
+                )
+            )
+    return errors
+
+
+def _check_bulk_actions(view_class):
+    """Report unknown bulk actions, and bulk update fields which cannot be edited."""
+    errors = []
+    unknown_actions = set(view_class.bulk_actions) - set(view_class.BULK_ACTIONS)
+    if unknown_actions:
+        errors.append(
+            checks.Error(
+                f"Unknown bulk_actions: {', '.join(sorted(unknown_actions))}",
+                hint=f"Available actions are {', '.join(view_class.BULK_ACTIONS)}",
+                obj=view_class,
+                id="nominopolitan.E009",
+            )
+        )
+    if view_class.bulk_update_method not in view_class.BULK_UPDATE_METHODS:
+        errors.append(
+            checks.Error(
+                f"bulk_update_method must be one of {', '.join(view_class.BULK_UPDATE_METHODS)}",
+                obj=view_class,
+                id="nominopolitan.E013",
+            )
+        )
+    for name in view_class.bulk_update_fields:
+        try:
+            field = view_class.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or not field.editable or field.many_to_many:
+            errors.append(
+                checks.Error(
+                    f"'{name}' in bulk_update_fields is not an editable field of "
+                    f"{view_class.model._meta.label}",
+                    obj=view_class,
+                    id="nominopolitan.E014",
+                )
+            )
+    return errors
+
+
+def _check_import(view_class):
+    """Report an import form for another model, and batch sizes which are not positive."""
+    errors = []
+    if not view_class.use_import:
+        return errors
+    form_class = view_class.import_form_class
+    if form_class is not None and getattr(getattr(form_class, "_meta", None), "model", None) is not view_class.model:
+        errors.append(
+            checks.Error(
+                f"import_form_class must be a ModelForm for {view_class.model._meta.label}",
+                obj=view_class,
+                id="nominopolitan.E010",
+            )
+        )
+    if not isinstance(view_class.import_batch_size, int) or view_class.import_batch_size < 1:
+        errors.append(
+            checks.Error(
+                "import_batch_size must be a positive integer",
+                obj=view_class,
+                id="nominopolitan.E015",
+            )
+        )
+    return errors
+
+
+def _check_cache(view_class):
+    """Report a fragment cache kept in a cache backend that worker processes do not share."""
+    from nominopolitan.cache import get_cache
+
+    if view_class.fragment_cache_timeout is None and not view_class.use_conditional_responses:
+        return []
+    if not isinstance(get_cache(), LocMemCache):
+        return []
+    return [
+        checks.Warning(
+            "The fragment cache's version stamps are kept in a local-memory cache",
+            hint=(
+                "Each worker process has its own local-memory cache, so a change "
+                "made through one process does not invalidate the fragments and "
+                "ETags of the others. Set NOMINOPOLITAN_CACHE_ALIAS to a shared "
+                "cache (Redis, Memcached, database or file based) when running "
+                "several processes."
+            ),
+            obj=view_class,
+            id="nominopolitan.W003",
+        )
+    ]
+
+
+def _check_search_fields(view_class):
+    """Report search_fields which are not fields or relation paths of the model."""
+    errors = []
+    for path in view_class.search_fields:
+        model = view_class.model
+        try:
+            for name in path.split("__"):
+                field = model._meta.get_field(name)
+                model = field.related_model
+        except (FieldDoesNotExist, AttributeError):
+            field = None
+        if field is None or field.is_relation:
+            errors.append(
+                checks.Error(
+                    f"'{path}' in search_fields is not a field of {view_class.model._meta.label}",
+                    hint="Use field names, or paths to fields of related models such as 'author__name'",
+                    obj=view_class,
+                    id="nominopolitan.E006",
+                )
+            )
+    return errors
+
+
+def _check_sorting(view_class, spec):
+    """Report unknown sortable columns, and sortable columns no index or cursor supports well."""
+    from nominopolitan.mixins import sort_key_is_indexed
+    from nominopolitan.pagination import sort_key_is_nullable
+
+    errors = []
+    if view_class.sortable_fields != "__all__":
+        for name in view_class.sortable_fields:
+            if name in spec.properties and name not in view_class.sort_keys and (
+                name not in view_class.property_annotations
+            ):
+                message = (
+                    f"Property '{name}' in sortable_fields needs an entry in sort_keys "
+                    "or property_annotations"
+                )
+                error_id = "nominopolitan.E011"
+            elif name not in spec.fields and name not in spec.properties:
+                message = f"'{name}' in sortable_fields is not a displayed field or property"
+                error_id = "nominopolitan.E005"
+            else:
+                continue
+            errors.append(checks.Error(message, obj=view_class, id=error_id))
+    if view_class.max_sort_columns < 1:
+        errors.append(
+            checks.Error(
+                "max_sort_columns must be at least 1",
+                obj=view_class,
+                id="nominopolitan.E012",
+            )
+        )
+
+    columns = view_class.resolve_sortable_columns(spec.fields, spec.properties)
+    unindexed = [
+        name for name, keys in columns.items()
+        if not sort_key_is_indexed(view_class.model, keys[0])
+    ]
+    if unindexed:
+        if view_class.sort_index_threshold is None:
+            hint = (
+                "Sorting on these columns sorts the whole filtered table. Add an "
+                "index, or set sort_index_threshold to only allow sorting on "
+                "them while the table is small."
+            )
+        else:
+            hint = (
+                "Sorting on these columns sorts the whole filtered table, so it is "
+                f"only offered up to sort_index_threshold ({view_class.sort_index_threshold}) "
+                "rows. Add an index to always offer it."
+            )
+        errors.append(
+            checks.Warning(
+                f"Sortable columns without a supporting index: {', '.join(unindexed)}",
+                hint=hint,
+                obj=view_class,
+                id="nominopolitan.W001",
+            )
+        )
+
+    if getattr(view_class, "pagination_mode", "page") in ("keyset", "infinite"):
+        nullable = [
+            name for name, keys in columns.items()
+            if any(sort_key_is_nullable(view_class.model, key) for key in keys)
+        ]
+        if nullable:
+            errors.append(
+                checks.Warning(
+                    f"Sortable columns with nullable keys in {view_class.pagination_mode} "
+                    f"pagination: {', '.join(nullable)}",
+                    hint=(
+                        "NULLs sort last (first when descending), and pages seek past "
+                        "them with an extra IS NULL condition that an index on the "
+                        "column cannot serve alone. Make the field NOT NULL, or "
+                        "remove it from sortable_fields."
+                    ),
+                    obj=view_class,
+                    id="nominopolitan.W002",
+                )
+            )
+    return errors
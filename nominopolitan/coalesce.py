@@ -0,0 +1,130 @@
+"""
+This module provides single-flight coalescing of identical concurrent requests.
+
+When several threads ask for the same key at once, the first (the leader) runs
+the work and the others wait for its result instead of repeating the same
+queries and rendering. Coalescing is per process: each worker process has its
+own leader.
+
+Key Components:
+- SingleFlight: Runs a function once for concurrent callers with the same key
+- AsyncSingleFlight: The same for coroutines on an event loop
+- list_requests: The SingleFlight shared by nominopolitan list views
+- async_list_requests: The AsyncSingleFlight shared by async list views
+"""
+
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.failed = False
+
+
+class SingleFlight:
+    """
+    Run a function once for concurrent callers with the same key.
+
+    Nothing is cached: once the leader finishes, the next caller with the key
+    becomes a new leader.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key, fn, timeout=None):
+        """
+        Call fn, or wait for a concurrent call with the same key to finish.
+
+        Followers run fn themselves if the leader raised an exception or did not
+        finish within timeout, so a slow or failing leader never fails them.
+
+        Args:
+            key (str): Identifies identical work
+            fn (callable): Called with no arguments
+            timeout (float | None): Seconds a follower waits for the leader
+
+        Returns:
+            tuple: (result, True if the result is the leader's)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if call.done.wait(timeout) and not call.failed:
+                return call.result, True
+            return fn(), False
+
+        try:
+            call.result = fn()
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """
+    Await a coroutine function once for concurrent callers with the same key.
+
+    The asyncio counterpart of SingleFlight: followers await the leader's
+    result without blocking the event loop. Callers on another event loop
+    than the leader's run the function themselves.
+    """
+
+    # the leader's result when it raised an exception
+    _FAILED = object()
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+
+    async def do(self, key, fn, timeout=None):
+        """
+        Await fn(), or the result of a concurrent call with the same key.
+
+        As with SingleFlight.do(), followers call fn themselves if the leader
+        raised an exception or did not finish within timeout.
+
+        Args:
+            key (str): Identifies identical work
+            fn (callable): Coroutine function called with no arguments
+            timeout (float | None): Seconds a follower waits for the leader
+
+        Returns:
+            tuple: (result, True if the result is the leader's)
+        """
+        loop = asyncio.get_running_loop()
+        call = self._calls.get(key)
+        if call is not None:
+            if call.get_loop() is loop:
+                try:
+                    result = await asyncio.wait_for(asyncio.shield(call), timeout)
+                except asyncio.TimeoutError:
+                    result = self._FAILED
+                if result is not self._FAILED:
+                    return result, True
+            return await fn(), False
+
+        call = self._calls[key] = loop.create_future()
+        result = self._FAILED
+        try:
+            result = await fn()
+        finally:
+            del self._calls[key]
+            call.set_result(result)
+        return result, False
+
+
+list_requests = SingleFlight()
+async_list_requests = AsyncSingleFlight()
@@ -0,0 +1,175 @@
+"""
+This module provides the batched CSV import used by the list view's import endpoint.
+
+Rows are read from the uploaded file as they are needed, validated one at a
+time with a ModelForm and inserted with bulk_create() in batches, each batch in
+its own transaction. Invalid rows are reported without stopping the import.
+
+Key Components:
+- read_csv: Iterate over the rows of an uploaded CSV file
+- import_rows: Validate and insert rows in batches
+- ImportResult: Counts and per-row errors of an import
+"""
+
+import csv
+import functools
+import io
+from typing import Iterable, Iterator, NamedTuple
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+# largest number of related objects remembered per field during an import
+MAX_CACHED_CHOICES = 10000
+
+
+class ImportResult(NamedTuple):
+    """
+    The outcome of an import.
+
+    Attributes:
+        rows (int): Data rows read
+        created (int): Objects created
+        failed (int): Rows that were not imported
+        errors (list[tuple[int, str]]): (row number, message) for the first failed rows,
+            counting the header as row 1
+    """
+    rows: int
+    created: int
+    failed: int
+    errors: list[tuple[int, str]]
+
+    @property
+    def errors_truncated(self):
+        return self.failed > len(self.errors)
+
+
+def read_csv(uploaded_file, encoding="utf-8-sig") -> Iterator[dict[str, str]]:
+    """
+    Iterate over the rows of an uploaded CSV file, keyed by the header row.
+
+    The file is decoded as it is read, so it is never held in memory as a whole.
+
+    Args:
+        uploaded_file (UploadedFile): The uploaded file
+        encoding (str): The file's encoding; the default also strips a UTF-8 BOM
+
+    Yields:
+        dict[str, str]: Each row, keyed by column name
+    """
+    text = io.TextIOWrapper(uploaded_file.file, encoding=encoding, newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        # leave the uploaded file open for Django to clean up
+        text.detach()
+
+
+def _cached_to_python(field, cache, value):
+    if value in field.empty_values:
+        return None
+    key = str(value)
+    if key not in cache:
+        try:
+            result = forms.ModelChoiceField.to_python(field, value)
+        except ValidationError as exc:
+            result = exc
+        if len(cache) >= MAX_CACHED_CHOICES:
+            cache.clear()
+        cache[key] = result
+    if isinstance(cache[key], ValidationError):
+        raise cache[key]
+    return cache[key]
+
+
+def _cache_choices(form, caches):
+    # rows mostly refer to the same few related objects, which are then looked up once
+    for name, field in form.fields.items():
+        if isinstance(field, forms.ModelChoiceField) and not isinstance(field, forms.ModelMultipleChoiceField):
+            field.to_python = functools.partial(_cached_to_python, field, caches.setdefault(name, {}))
+
+
+def _form_errors(form):
+    return "; ".join(
+        f"{name}: {' '.join(messages)}" if name != "__all__" else " ".join(messages)
+        for name, messages in form.errors.items()
+    )
+
+
+def import_rows(model, form_class, rows: Iterable[dict], batch_size=500, max_errors=100) -> ImportResult:
+    """
+    Validate rows with a ModelForm and insert the valid ones in batches.
+
+    Each batch is inserted with a single bulk_create() in a transaction. If that
+    fails (eg on a unique constraint between rows of the file), the batch's rows
+    are inserted one at a time, so only the rows at fault are rejected.
+
+    Objects are created with bulk_create(), so save() is not called, no signals
+    are sent and many-to-many fields are not set.
+
+    Args:
+        model: The model class
+        form_class (type[ModelForm]): Validates each row and builds its object
+        rows (Iterable[dict]): Rows keyed by form field name
+        batch_size (int): Objects inserted per batch
+        max_errors (int): Largest number of row errors kept for the result
+
+    Returns:
+        ImportResult: What was imported and the errors of the rows that were not
+    """
+    manager = model._default_manager
+    rows_read = created = failed = 0
+    errors = []
+    batch = []
+    choices = {}
+
+    def reject(line, message):
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append((line, message))
+
+    def flush():
+        nonlocal created
+        try:
+            with transaction.atomic():
+                manager.bulk_create([obj for _, obj in batch], batch_size=batch_size)
+            created += len(batch)
+        except IntegrityError:
+            for line, obj in batch:
+                obj.pk = None
+                try:
+                    with transaction.atomic():
+                        manager.bulk_create([obj])
+                    created += 1
+                except IntegrityError as exc:
+                    reject(line, str(exc))
+        batch.clear()
+
+    rows = iter(rows)
+    # line 1 is the header
+    line = 1
+    while True:
+        line += 1
+        try:
+            row = next(rows)
+        except StopIteration:
+            break
+        except (UnicodeDecodeError, csv.Error) as exc:
+            # the rows read so far are still imported
+            reject(line, f"The file could not be read from here on: {exc}")
+            break
+        rows_read += 1
+        form = form_class(data=row)
+        _cache_choices(form, choices)
+        if form.is_valid():
+            batch.append((line, form.save(commit=False)))
+            if len(batch) >= batch_size:
+                flush()
+        else:
+            reject(line, _form_errors(form))
+    if batch:
+        flush()
+
+    return ImportResult(rows_read, created, failed, errors)
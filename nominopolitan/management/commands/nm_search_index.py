@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError
+
+from nominopolitan.checks import get_nominopolitan_views
+from nominopolitan.search import build_search_index, drop_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Build (or refresh) the full-text search indexes for the search_fields of "
+        "nominopolitan views: FTS5 tables on SQLite, GIN indexes on PostgreSQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            type=str,
+            help="Only index these <app_name.ModelName> models (default: every view with search_fields).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to build the indexes in.",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the search indexes instead, so searches fall back to icontains.",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        labels = {label.lower() for label in options["models"]}
+
+        # the first view of each model decides its search fields
+        views = {}
+        for view_class in get_nominopolitan_views():
+            model = view_class.model
+            if view_class.search_fields and (not labels or model._meta.label_lower in labels):
+                views.setdefault(model, view_class)
+
+        missing = labels - {model._meta.label_lower for model in views}
+        if missing:
+            raise CommandError(f"No view with search_fields for: {', '.join(sorted(missing))}")
+
+        for model, view_class in views.items():
+            if options["drop"]:
+                for name in drop_search_index(model, using):
+                    self.stdout.write(f"Dropped {name} for {model._meta.label}")
+                continue
+            try:
+                name = build_search_index(model, view_class.search_fields, view_class.search_config, using)
+            except NotSupportedError as exc:
+                raise CommandError(str(exc))
+            if name is None:
+                self.stdout.write(f"{model._meta.label}: no search field can be indexed, using icontains")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Built {name} for {model._meta.label}"))
@@ -8,22 +8,45 @@ Key Components:
 """
 
 from django import forms
-from django.db import models
-
-from django.http import Http404
+from django.db import connections, models, router, transaction
+from django.db.models import ProtectedError
+
+from django.core.paginator import InvalidPage
+from django.http import (
+    Http404, HttpResponse, HttpResponseBadRequest, HttpResponseRedirect, StreamingHttpResponse,
+)
+from django.utils.cache import (
+    get_conditional_response, patch_cache_control, patch_vary_headers, quote_etag,
+)
+from django.utils.http import http_date
 from django.urls import NoReverseMatch, path, reverse
+from django.utils.http import urlencode
+from django.utils.text import capfirst
+from django.utils.translation import get_language
 from django.utils.decorators import classonlymethod
-from django.core.exceptions import ImproperlyConfigured
-from django.shortcuts import render
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from django.shortcuts import aget_object_or_404, get_object_or_404, redirect, render
+from django.template.loader import select_template
 from django.template.response import TemplateResponse
 
 from django.conf import settings
-from django.db.models.fields.reverse_related import ManyToOneRel
+from django.core.cache import caches
+from django.db.models.fields.reverse_related import ForeignObjectRel, ManyToOneRel
 
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import logging
+import re
+import time
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Mapping, NamedTuple
 log = logging.getLogger("nominopolitan")
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from crispy_forms.helper import FormHelper
 from django import forms
 from django_filters import (
@@ -33,6 +56,25 @@ from django_filters import (
 from django_filters.filterset import filterset_factory
 from neapolitan.views import Role
 
+from nominopolitan.cache import bump_model_version, get_cache, get_model_versions, watch_models
+from nominopolitan.coalesce import async_list_requests, list_requests
+from nominopolitan.export import EXPORT_FORMATS
+from nominopolitan.imports import import_rows, read_csv
+from nominopolitan.pagination import (
+    AsyncPaginator, CachedCountPaginator, EstimatedCountPaginator, KeysetPaginator,
+    UncountedPaginator, afetch,
+)
+from nominopolitan.search import search_queryset
+from nominopolitan.templatetags.nominopolitan import object_list as object_list_tag
+from nominopolitan.timing import NULL_TIMER, NullTimer, PhaseTimer, format_server_timing, phases_timed
+from nominopolitan.widgets import AutocompleteSelect
+
+# an htmx target sent back in the X-Original-Target header: a single id selector
+ORIGINAL_TARGET_RE = re.compile(r"#[A-Za-z][\w-]*")
+
+# how long a table size check (for autocomplete and sorting) is trusted
+TABLE_SIZE_RECHECK_SECONDS = 300
+
 class HTMXFilterSetMixin:
     """
     Mixin that adds HTMX attributes to filter forms for dynamic updates.
@@ -68,6 +110,136 @@ class HTMXFilterSetMixin:
         self.helper.wrapper_class = 'col-auto'
         self.helper.template = 'bootstrap5/layout/inline_field.html'
 
+class Column(NamedTuple):
+    """
+    A compiled list view column.
+
+    Attributes:
+        name (str): Field or property name
+        header (str): Column header text
+        render (Callable): Returns the display string for an object
+    """
+    name: str
+    header: str
+    render: Callable[[Any], str]
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date(value) -> str:
+    return value.strftime('%d/%m/%Y')
+
+
+def _field_renderer(field) -> Callable[[Any], str]:
+    """
+    Build the cell renderer for a model field, resolving all field metadata up front.
+
+    Args:
+        field: The model field (or reverse relation)
+
+    Returns:
+        Callable: Takes an object and returns the display string for the field
+    """
+    if isinstance(field, ForeignObjectRel):
+        getter = attrgetter(field.get_accessor_name())
+    else:
+        getter = attrgetter(field.name)
+
+    if field.get_internal_type() == 'DateField':
+        def render(obj):
+            value = getter(obj)
+            return _format_date(value) if value is not None else field.value_to_string(obj)
+    elif field.many_to_many or field.one_to_many:
+        # iterate .all() so that prefetched rows are used
+        def render(obj):
+            return ", ".join(str(related) for related in getter(obj).all())
+    elif field.is_relation:
+        def render(obj):
+            return str(getter(obj))
+    else:
+        render = field.value_to_string
+    return render
+
+
+def _property_renderer(name: str) -> Callable[[Any], str]:
+    # also used for annotations, where name is the annotation's attribute
+    getter = attrgetter(name)
+
+    def render(obj):
+        return str(getter(obj))
+    return render
+
+
+def annotation_attribute(prop: str) -> str:
+    """
+    Get the attribute a property's annotation is loaded into.
+
+    The annotation itself is added with QuerySet.alias() under the property's
+    name, for filtering and sorting, but it cannot be loaded into that attribute
+    since the property has no setter.
+    """
+    return f"{prop}_annotation"
+
+
+def sort_key_is_indexed(model, key: str) -> bool:
+    """
+    Determine whether the database can use an index to sort a model on a key.
+
+    Only keys on the model's own table are considered indexed: sorting across a
+    join (or on a relation whose model has Meta.ordering) generally cannot use one.
+
+    Args:
+        model: The model class
+        key (str): An order_by key, eg 'title' or '-published_date'
+
+    Returns:
+        bool: True if a single column index or the leading column of a
+            multi-column index covers the key
+    """
+    name = key.lstrip('-')
+    if name == 'pk':
+        return True
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    if not field.concrete or field.many_to_many:
+        return False
+    if field.is_relation and field.related_model._meta.ordering:
+        # ordering by a relation uses the related model's ordering
+        return False
+    if field.primary_key or field.unique or field.db_index:
+        return True
+
+    opts = model._meta
+    leading = [index.fields[0] for index in opts.indexes if index.fields]
+    leading += [
+        constraint.fields[0] for constraint in opts.constraints
+        if isinstance(constraint, models.UniqueConstraint) and constraint.fields
+    ]
+    leading += [fields[0] for fields in opts.unique_together]
+    return any(column.lstrip('-') in (field.name, field.attname) for column in leading)
+
+
+class ViewSpec(NamedTuple):
+    """
+    Resolved field and property configuration for a view class.
+
+    Attributes:
+        fields (tuple[str, ...]): Fields for the list view (after exclusions)
+        properties (tuple[str, ...]): Properties for the list view (after exclusions)
+        detail_fields (tuple[str, ...]): Fields for the detail view (after exclusions)
+        detail_properties (tuple[str, ...]): Properties for the detail view (after exclusions)
+        related_fields (Mapping[str, str]): Relation field names mapped to the related model's verbose_name
+        relation_fields (tuple[str, ...]): Names of the model's forward relation fields
+    """
+    fields: tuple[str, ...]
+    properties: tuple[str, ...]
+    detail_fields: tuple[str, ...]
+    detail_properties: tuple[str, ...]
+    related_fields: Mapping[str, str]
+    relation_fields: tuple[str, ...]
+
+
 class NominopolitanMixin:
     """
     Main mixin that enhances Django CRUD views with HTMX support, filtering, and modal functionality.
@@ -90,6 +262,96 @@ class NominopolitanMixin:
 
         table_font_size (str | None): Table font size in rem
         table_max_col_width (str | None): Maximum column width in characters
+
+        use_related_optimization (bool): Automatically apply select_related /
+            prefetch_related for relations displayed in list and detail views
+        property_relations (dict[str, list[str]]): Relation paths touched by each
+            property, eg {'author_name': ['author']}
+        extra_related (list[str]): Additional relation paths to load for list
+            and detail views
+        use_column_projection (bool): Only load the columns the list displays
+        property_fields (dict[str, list[str]]): Fields (or field paths) read by each
+            property, eg {'has_bio': ['bio']}; needed for projection with properties
+        related_only (dict[str, list[str]]): Columns of each displayed relation used
+            by its __str__, eg {'author': ['name']}; other related columns are deferred
+        use_column_toggles (bool): Let users hide list columns, persisted in a cookie
+        use_fast_rows (bool): Render the list's table rows in Python rather than
+            through the rows partial of partial/list.html (same output); leave off
+            if you customise that partial
+        property_annotations (dict[str, Expression]): SQL equivalents of properties,
+            eg {'many_pages': Q(pages__gt=10)}; the list view reads these annotations
+            instead of the properties, and they can be filtered and sorted on
+
+        autocomplete_fields (list[str]): ForeignKey fields that always use the
+            htmx autocomplete widget in filters and forms
+        autocomplete_threshold (int | None): Use autocomplete for any ForeignKey
+            whose related table has more rows than this (None to disable)
+        autocomplete_limit (int): Number of matches returned per autocomplete page
+        autocomplete_search_fields (dict[str, list[str]]): Related model fields to
+            search for each ForeignKey (defaults to its CharFields)
+        autocomplete_lookup (str): Lookup used for autocomplete searches
+
+        pagination_mode (str): 'page' for numbered pages (default), 'keyset' for
+            cursor based Previous/Next pagination on the ordering plus pk, or
+            'infinite' to load the next batch of rows (by cursor) as the list is scrolled
+        cursor_kwarg (str): Query parameter holding the keyset pagination cursor
+        count_strategy (str): How numbered pagination counts rows: 'exact' (default),
+            'cached', 'estimated' or 'none'
+        count_cache_timeout (int): Seconds a 'cached' count is kept
+        count_cache_alias (str): Cache used for 'cached' counts
+        count_estimate_cap (int): Largest result counted exactly by 'estimated'
+
+        fragment_cache_timeout (int | None): Cache the htmx list partials for this
+            many seconds (None, the default, disables the fragment cache); with
+            several worker processes its cache must be shared between them
+        coalesce_requests (bool): Let identical concurrent htmx list requests share
+            one query and render (per process)
+        coalesce_timeout (float): Seconds a coalesced request waits for the one
+            rendering before rendering itself
+        use_conditional_responses (bool): Add ETag / Last-Modified validators to htmx
+            list and detail partials and answer matching requests with 304 Not Modified
+        last_modified_field (str | None): DateTimeField giving the Last-Modified time
+            of detail views, eg 'updated_at'
+
+        original_target_storage (str): Where the list's original htmx target is kept:
+            'header' (default; sent back by the templates in an X-Original-Target
+            header) or 'session' (written to the session on every htmx list request)
+
+        use_server_timing (bool): Time the phases of list requests and report them in
+            a Server-Timing header; they are also timed (for nominopolitan.timing.
+            phases_timed) whenever that signal has a receiver for the view
+
+        export_formats (list[str]): Formats the filtered list can be exported in
+            ('csv', 'jsonl'); empty (the default) disables export
+        export_chunk_size (int): Rows fetched from the database per batch when exporting
+
+        bulk_actions (list[str]): Actions on selected rows ('delete', 'update'); empty
+            (the default) hides the row checkboxes
+        bulk_update_fields (list[str]): Fields the 'update' action can set
+        bulk_update_method (str): 'update' for a single UPDATE statement, or 'save' to
+            call save() on each row (loaded in batches) so model logic and signals run
+        bulk_batch_size (int): Rows loaded per batch by bulk_update_method = 'save'
+
+        use_import (bool): Whether users can create objects by uploading a CSV file
+        import_form_class (type[forms.ModelForm] | None): Form validating each CSV row;
+            defaults to create_form_class, then the view's form class
+        import_batch_size (int): Rows inserted per bulk_create() (and transaction)
+        import_max_errors (int): Number of row errors reported for an import
+
+        sortable_fields (list[str] | str): Columns users can sort by clicking their
+            header, or '__all__' for every displayed field (and properties in sort_keys
+            or property_annotations)
+        sort_keys (dict[str, str | list[str]]): order_by keys for a column, eg
+            {'author': 'author__name'}; required for properties without an annotation
+        sort_kwarg (str): Query parameter holding the sort, eg 'sort=-pages,title'
+        max_sort_columns (int): Number of columns that can be sorted on at once
+        sort_index_threshold (int | None): When the table has more rows than this,
+            only columns whose sort key is indexed are sortable
+
+        search_fields (list[str]): Fields (and relation paths) searched from the
+            search box, using full-text search once nm_search_index has built an index
+        search_kwarg (str): Query parameter holding the search text
+        search_config (str): PostgreSQL text search configuration, eg 'english'
     """
 
     namespace: str | None = None
@@ -117,6 +379,93 @@ class NominopolitanMixin:
 
     table_font_size: str | None = None
     table_max_col_width: str | None = None
+
+    use_related_optimization: bool = True
+    property_relations: dict[str, list[str]] = {}
+    extra_related: list[str] = []
+    use_column_projection: bool = True
+    property_fields: dict[str, list[str]] = {}
+    related_only: dict[str, list[str]] = {}
+    use_column_toggles: bool = False
+    use_fast_rows: bool = False
+    property_annotations: dict[str, Any] = {}
+
+    autocomplete_fields: list[str] = []
+    autocomplete_threshold: int | None = 1000
+    autocomplete_limit: int = 20
+    autocomplete_search_fields: dict[str, list[str]] = {}
+    autocomplete_lookup: str = 'icontains'
+
+    pagination_mode: str = 'page'
+    PAGINATION_MODES: tuple[str, ...] = ('page', 'keyset', 'infinite')
+    cursor_kwarg: str = 'cursor'
+
+    count_strategy: str = 'exact'
+    COUNT_STRATEGIES: tuple[str, ...] = ('exact', 'cached', 'estimated', 'none')
+    count_cache_timeout: int = 60
+    count_cache_alias: str = 'default'
+    count_estimate_cap: int = 10000
+
+    fragment_cache_timeout: int | None = None
+    coalesce_requests: bool = False
+    coalesce_timeout: float = 10
+
+    use_conditional_responses: bool = False
+    last_modified_field: str | None = None
+    vary_headers: tuple[str, ...] = (
+        'HX-Request', 'HX-Target', 'X-Filter-Request', 'X-Rows-Request', 'X-Original-Target'
+    )
+
+    original_target_storage: str = 'header'
+    ORIGINAL_TARGET_STORAGES: tuple[str, ...] = ('header', 'session')
+
+    use_server_timing: bool = False
+    # the timer of the current list request (see get_timer())
+    timer: PhaseTimer | NullTimer = NULL_TIMER
+
+    export_formats: list[str] = []
+    export_chunk_size: int = 2000
+
+    bulk_actions: list[str] = []
+    BULK_ACTIONS: tuple[str, ...] = ('delete', 'update')
+    bulk_update_fields: list[str] = []
+    bulk_update_method: str = 'update'
+    BULK_UPDATE_METHODS: tuple[str, ...] = ('update', 'save')
+    bulk_batch_size: int = 500
+
+    use_import: bool = False
+    import_form_class: type[forms.ModelForm] | None = None
+    import_batch_size: int = 500
+    import_max_errors: int = 100
+
+    sortable_fields: list[str] | str = []
+    sort_keys: dict[str, str | list[str]] = {}
+    sort_kwarg: str = 'sort'
+    max_sort_columns: int = 1
+    sort_index_threshold: int | None = None
+
+    search_fields: list[str] = []
+    search_kwarg: str = 'q'
+    search_config: str = 'english'
+
+    # (checked_at, exceeds threshold) keyed by model and threshold, stored on
+    # each view class by table_exceeds()
+    _table_sizes: dict[tuple, tuple[float, bool]]
+
+    # attributes resolved into the cached ViewSpec
+    _view_spec_attrs = (
+        'fields', 'exclude', 'properties', 'properties_exclude',
+        'detail_fields', 'detail_exclude', 'detail_properties', 'detail_properties_exclude',
+    )
+
+    # generated FilterSet classes keyed by filter configuration, stored on each
+    # view class by get_dynamic_filterset_class()
+    _filterset_classes: dict[tuple, type]
+
+    # compiled columns keyed by ('field' or 'property', name), stored on each
+    # view class by get_column_plan()
+    _columns: dict[tuple[str, str], Column]
+
     def get_table_font_size(self):
         # The font size for the table (buttons, filters, column headers, rows) in object_list.html
         return self.table_font_size or '0.875' #rem
@@ -163,232 +512,2012 @@ class NominopolitanMixin:
         }
 
 
-    def list(self, request, *args, **kwargs):
+    def list(self, request, *args, **kwargs):
+        """
+        Handle GET requests for list view, including filtering and pagination.
+
+        htmx partials are served from the fragment cache if enabled, and with
+        coalesce_requests, identical concurrent requests wait for one of them
+        to render instead of each running the same queries.
+
+        If get_timer() gives a timer, the phases of the request are timed and
+        passed to report_timings().
+        
+        Returns:
+            TemplateResponse: Rendered list view
+        """
+        self.timer = self.get_timer()
+        if not self.timer.enabled:
+            return self.get_list_response(request)
+
+        with self.timer.count_queries(connections[router.db_for_read(self.model)]):
+            response = self.get_list_response(request)
+            if isinstance(response, TemplateResponse) and not response.is_rendered:
+                # rendered here rather than by the handler, so that rendering is timed
+                with self.timer.phase("render"):
+                    response.render()
+        self.report_timings(response, self.timer.get_timings())
+        return response
+
+    def get_list_response(self, request):
+        """
+        Get the list view's response, from the fragment cache, a coalesced request or render_list().
+
+        Returns:
+            HttpResponse: Rendered list view
+        """
+        self.fragment_cache_key = self.get_fragment_cache_key()
+        if self.fragment_cache_key is not None:
+            content = get_cache().get(self.fragment_cache_key)
+            if content is not None:
+                return self.render_fragment(content)
+
+        coalesce_key = self.get_coalesce_key()
+        if coalesce_key is None:
+            return self.render_list()
+
+        response, shared = list_requests.do(coalesce_key, self.render_list, self.coalesce_timeout)
+        if not shared:
+            return response
+        if response.status_code != 200:
+            # eg a 304 for the leader's If-None-Match, which says nothing about this request
+            return self.render_list()
+        return self.render_fragment(response.content)
+
+    def render_list(self):
+        """
+        Query and render the list view.
+
+        Returns:
+            HttpResponse: Rendered list view
+        """
+        self.hide_columns()
+        with self.timer.phase("queryset"):
+            queryset, filterset = self.get_list_queryset()
+
+        paginate_by = self.get_paginate_by()
+        if paginate_by is None:
+            if not self.allow_empty and not queryset.exists():
+                raise Http404
+
+            # Unpaginated response
+            self.object_list = queryset
+            page = None
+        else:
+            # Paginated response
+            with self.timer.phase("paginate"):
+                page = self.paginate_queryset(queryset, paginate_by)
+            # an empty first page means an empty queryset, so no separate exists() query
+            if not self.allow_empty and not page.object_list:
+                raise Http404
+            self.object_list = page.object_list
+
+        return self.render_list_page(page, filterset)
+
+    def render_list_page(self, page, filterset):
+        """
+        Render the list view once object_list has been loaded.
+
+        Args:
+            page (Page | None): The current page, or None if the list is not paginated
+            filterset (FilterSet | None): The list's filterset
+
+        Returns:
+            HttpResponse: Rendered list view
+        """
+        if self.timer.enabled:
+            # loaded here rather than where the template first tests them, so they are timed apart
+            with self.timer.phase("fetch"):
+                len(self.object_list)
+        with self.timer.phase("context"):
+            context = self.get_context_data(
+                test_variable="Testing",
+                page_obj=page,
+                is_paginated=page.has_other_pages() if page is not None else False,
+                paginator=page.paginator if page is not None else None,
+                filterset=filterset,
+            )
+        return self.render_to_response(context)
+
+
+    def get_list_queryset(self):
+        """
+        Build the filtered queryset shown by the list view.
+
+        Related lookups and property annotations for the displayed fields are
+        applied, the filterset and search box filter the queryset, the user's
+        sort is applied and the column projection restricts the columns loaded.
+
+        Returns:
+            tuple: (QuerySet, FilterSet or None)
+        """
+        queryset = self.apply_related_lookups(
+            self.get_queryset(), self.fields, self.properties
+        )
+        queryset = self.apply_property_annotations(queryset, self.properties)
+        with self.timer.phase("filter"):
+            filterset = self.get_filterset(queryset)
+            if filterset is not None:
+                queryset = filterset.qs
+
+        search_fields = self.get_search_fields()
+        if search_fields:
+            queryset = search_queryset(
+                queryset, search_fields, self.get_search_query(), self.search_config
+            )
+
+        self.sort = self.get_sort()
+        if self.sort:
+            queryset = queryset.order_by(*self.get_sort_ordering(self.sort))
+
+        projection = self.get_projection(self.fields, self.properties)
+        if projection is not None:
+            if self.get_pagination_mode() in ('keyset', 'infinite'):
+                # the cursor is read from the ordering keys of the edge rows
+                projection += [
+                    key.lstrip('-') for key in self.get_keyset_ordering(queryset)
+                    if key.lstrip('-') not in queryset.query.annotations
+                ]
+            queryset = queryset.only(*projection)
+
+        return queryset, filterset
+
+    @classmethod
+    def resolve_sortable_columns(cls, fields, properties):
+        """
+        Map each sortable column to its order_by keys.
+
+        Args:
+            fields (list[str]): Displayed fields
+            properties (list[str]): Displayed properties
+
+        Returns:
+            dict[str, list[str]]: Sort keys for each sortable column
+        """
+        if cls.sortable_fields == '__all__':
+            opts = cls.model._meta
+            names = [
+                name for name in fields
+                if name in cls.sort_keys or (
+                    opts.get_field(name).concrete and not opts.get_field(name).many_to_many
+                )
+            ]
+            names += [
+                prop for prop in properties
+                if prop in cls.sort_keys or prop in cls.property_annotations
+            ]
+        else:
+            names = [
+                name for name in cls.sortable_fields
+                if name in fields or (name in properties and (
+                    name in cls.sort_keys or name in cls.property_annotations
+                ))
+            ]
+
+        columns = {}
+        for name in names:
+            keys = cls.sort_keys.get(name, name)
+            columns[name] = [keys] if isinstance(keys, str) else list(keys)
+        return columns
+
+    def get_sortable_columns(self):
+        """
+        Get the displayed columns the user can sort by, with their order_by keys.
+
+        If the table has more than sort_index_threshold rows, columns whose
+        first sort key is not indexed are left out, so sorting never needs a
+        full table sort.
+
+        Returns:
+            dict[str, list[str]]: Sort keys for each sortable column
+        """
+        columns = self.resolve_sortable_columns(self.fields, self.properties)
+        if self.sort_index_threshold is not None and columns and self.table_exceeds(
+            self.model, self.sort_index_threshold
+        ):
+            columns = {
+                name: keys for name, keys in columns.items()
+                if sort_key_is_indexed(self.model, keys[0])
+            }
+        return columns
+
+    def get_sort(self):
+        """
+        Get the requested sort from the sort_kwarg query parameter.
+
+        Unknown or unsortable columns are ignored, as are columns beyond
+        max_sort_columns.
+
+        Returns:
+            list[tuple[str, bool]]: (column, descending) pairs, most significant first
+        """
+        columns = self.get_sortable_columns()
+        sort = []
+        for item in self.request.GET.get(self.sort_kwarg, '').split(','):
+            item = item.strip()
+            name = item.lstrip('-')
+            if name in columns and name not in dict(sort):
+                sort.append((name, item.startswith('-')))
+        return sort[:self.max_sort_columns]
+
+    def get_sort_ordering(self, sort):
+        """
+        Convert a sort into order_by keys, ending with the pk so the order is stable.
+
+        Args:
+            sort (list[tuple[str, bool]]): (column, descending) pairs
+
+        Returns:
+            list[str]: Keys for QuerySet.order_by()
+        """
+        columns = self.get_sortable_columns()
+        ordering = []
+        for name, descending in sort:
+            for key in columns[name]:
+                key_descending = key.startswith('-') != descending
+                ordering.append(f"{'-' if key_descending else ''}{key.lstrip('-')}")
+        pk_names = ('pk', self.model._meta.pk.name)
+        if not any(key.lstrip('-') in pk_names for key in ordering):
+            ordering.append('pk')
+        return ordering
+
+    def get_sort_url(self, name):
+        """
+        Get the query string for clicking a column header.
+
+        The column becomes the primary sort, toggling its direction if it already
+        was. With max_sort_columns > 1 the previous sort columns are kept after it.
+
+        Args:
+            name (str): The column clicked
+
+        Returns:
+            str: A query string starting with '?'
+        """
+        sort = getattr(self, "sort", [])
+        descending = bool(sort) and sort[0] == (name, False)
+        sort = [(name, descending)] + [item for item in sort if item[0] != name]
+        value = ",".join(
+            f"{'-' if descending else ''}{column}"
+            for column, descending in sort[:self.max_sort_columns]
+        )
+        return self.get_page_url(**{self.sort_kwarg: value})
+
+    def get_search_fields(self):
+        """
+        Get the fields searched from the list view's search box.
+
+        Returns:
+            list[str]: Field names and relation paths, or [] for no search box
+        """
+        return self.search_fields
+
+    def get_search_query(self):
+        """
+        Get the search text from the search_kwarg query parameter.
+
+        Returns:
+            str: The search text, or '' if there is none
+        """
+        return self.request.GET.get(self.search_kwarg, '').strip()
+
+    def get_export_formats(self):
+        """
+        Get the formats the list can be exported in.
+
+        Returns:
+            list[str]: Keys of nominopolitan.export.EXPORT_FORMATS
+        """
+        return self.export_formats
+
+    def get_export_filename(self, export_format):
+        """
+        Get the download filename for an export.
+
+        Args:
+            export_format (str): The export format
+
+        Returns:
+            str: eg "books.csv"
+        """
+        return f"{self.model._meta.verbose_name_plural}.{export_format}".replace(" ", "_")
+
+    def export(self, request, *args, **kwargs):
+        """
+        GET handler for the export endpoint.
+
+        Streams the list as filtered by the request's query parameters, using
+        the same columns as the list view. Rows are fetched in batches of
+        export_chunk_size with QuerySet.iterator(), so memory use stays flat and
+        the first bytes are sent before the query has finished.
+
+        Returns:
+            StreamingHttpResponse: The export as an attachment
+        """
+        export_format = self.kwargs["export_format"]
+        if export_format not in self.get_export_formats() or export_format not in EXPORT_FORMATS:
+            raise Http404(f"Export format '{export_format}' is not enabled")
+        exporter = EXPORT_FORMATS[export_format]
+
+        queryset, filterset = self.get_list_queryset()
+        if filterset is not None and not filterset.is_valid():
+            # matches django-filter, which returns no rows for invalid filters
+            queryset = queryset.none()
+
+        response = StreamingHttpResponse(
+            exporter.write(
+                self.get_column_plan(),
+                queryset.iterator(chunk_size=self.export_chunk_size),
+            ),
+            content_type=exporter.content_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.get_export_filename(export_format)}"'
+        )
+        return response
+
+    def get_bulk_actions(self):
+        """
+        Get the actions users can apply to selected rows of the list.
+
+        Returns:
+            list[str]: 'delete' and / or 'update', or [] to disable bulk actions
+        """
+        return self.bulk_actions
+
+    def get_bulk_update_formfields(self):
+        """
+        Get the form fields used to enter and validate the value of each bulk update field.
+
+        Returns:
+            dict[str, forms.Field]: Form fields keyed by model field name
+        """
+        if 'update' not in self.get_bulk_actions():
+            return {}
+        formfields = {}
+        for name in self.bulk_update_fields:
+            formfield = formfields[name] = self.model._meta.get_field(name).formfield()
+            # as in forms, large related tables are searched rather than listed
+            if isinstance(formfield, forms.ModelChoiceField) and self.get_use_autocomplete(name):
+                url = self.get_autocomplete_url(name)
+                if url is not None:
+                    formfield.widget = AutocompleteSelect(
+                        url, formfield.queryset, formfield.to_field_name, attrs=formfield.widget.attrs
+                    )
+        return formfields
+
+    def get_bulk_update_choices(self):
+        """
+        Get the bulk update fields offered by the list's bulk action form.
+
+        With htmx only the URL of each field's value input is given, and the
+        input is loaded from the bulk value endpoint when it is first shown.
+        Without htmx (or the endpoint) the inputs are rendered with the list.
+
+        Returns:
+            list[tuple]: (field name, label, rendered input or None, input URL or None) for each field
+        """
+        if 'update' not in self.get_bulk_actions():
+            return []
+        choices = []
+        formfields = None
+        for name in self.bulk_update_fields:
+            label = capfirst(self.model._meta.get_field(name).verbose_name)
+            url = self.get_use_htmx() and self.safe_reverse(
+                f"{self.get_prefix()}-bulk-value", kwargs={"field_name": name}
+            )
+            if url:
+                choices.append((name, label, None, url))
+            else:
+                if formfields is None:
+                    formfields = self.get_bulk_update_formfields()
+                choices.append((name, label, self.render_bulk_value(name, formfields[name]), None))
+        return choices
+
+    def get_bulk_queryset(self):
+        """
+        Get the rows a bulk action applies to.
+
+        These are the selected rows (bulk_pk), or with bulk_all every row matching
+        the list's filters and search, taken from the request's query string.
+        Either way only rows in get_queryset() can be affected.
+
+        Returns:
+            QuerySet: The rows to act on
+
+        Raises:
+            ValidationError: If a selected pk is not a valid value for the model's pk
+        """
+        queryset = self.get_queryset()
+        if not self.request.POST.get('bulk_all'):
+            pk_field = self.model._meta.pk
+            return queryset.filter(pk__in=[
+                pk_field.to_python(pk) for pk in self.request.POST.getlist('bulk_pk')
+            ])
+
+        matching, filterset = self.get_list_queryset()
+        if filterset is not None and not filterset.is_valid():
+            return queryset.none()
+        # a pk subquery leaves the list's ordering, projection and annotations behind
+        return queryset.filter(pk__in=matching.order_by().values('pk'))
+
+    def bulk(self, request, *args, **kwargs):
+        """
+        POST handler for the bulk endpoint.
+
+        Deletes the selected rows with a single QuerySet.delete(), or sets a
+        field on them with a single QuerySet.update() (or save() per row with
+        bulk_update_method = 'save'). The list is then rendered again with the
+        filters in the query string, for htmx to swap in with one request
+        (without htmx the browser is redirected to it).
+
+        Returns:
+            HttpResponse: The re-rendered list
+        """
+        actions = self.get_bulk_actions()
+        action = request.POST.get('bulk_action', '')
+        action, _, field_name = action.partition(':')
+        if action not in actions or action not in self.BULK_ACTIONS:
+            raise Http404(f"Bulk action '{action}' is not enabled")
+
+        try:
+            queryset = self.get_bulk_queryset()
+        except ValidationError as exc:
+            return HttpResponseBadRequest(' '.join(exc.messages))
+        verbose_name_plural = self.model._meta.verbose_name_plural
+        if action == 'delete':
+            try:
+                with transaction.atomic():
+                    deleted, counts = queryset.delete()
+            except ProtectedError as exc:
+                self.bulk_message = f"Nothing was deleted: {exc.args[0]}"
+            else:
+                self.bulk_message = f"Deleted {counts.get(self.model._meta.label, 0)} {verbose_name_plural}"
+                if deleted:
+                    # rows deleted without loading them send no signals
+                    bump_model_version(self.model)
+        else:
+            formfields = self.get_bulk_update_formfields()
+            if field_name not in formfields:
+                raise Http404(f"Field '{field_name}' cannot be bulk updated")
+            formfield = formfields[field_name]
+            try:
+                value = formfield.clean(formfield.widget.value_from_datadict(
+                    request.POST, request.FILES, f"bulk_value_{field_name}"
+                ))
+            except ValidationError as exc:
+                self.bulk_message = f"{formfield.label or field_name}: {' '.join(exc.messages)}"
+            else:
+                updated = self.bulk_update(queryset, field_name, value)
+                self.bulk_message = f"Updated {updated} {verbose_name_plural}"
+                if updated:
+                    # no signals are sent by QuerySet.update()
+                    bump_model_version(self.model)
+
+        if not request.htmx:
+            list_url = self.safe_reverse(f"{self.get_prefix()}-list")
+            return redirect(f"{list_url}{self.get_page_url().rstrip('?')}")
+        return self.render_list()
+
+    def bulk_value(self, request, *args, **kwargs):
+        """
+        GET handler for the bulk value endpoint.
+
+        Renders the value input of one bulk update field. With htmx the list
+        loads each input when it is first shown, so the choices of a related
+        field are not queried on every list render.
+
+        Returns:
+            HttpResponse: The rendered widget
+        """
+        field_name = self.kwargs["field_name"]
+        formfields = self.get_bulk_update_formfields()
+        if field_name not in formfields:
+            raise Http404(f"Field '{field_name}' cannot be bulk updated")
+        return HttpResponse(self.render_bulk_value(field_name, formfields[field_name]))
+
+    def render_bulk_value(self, field_name, formfield):
+        """
+        Render the input for the value of a bulk update field.
+
+        Args:
+            field_name (str): The model field
+            formfield (forms.Field): Its form field, from get_bulk_update_formfields()
+
+        Returns:
+            str: The widget's HTML
+        """
+        return formfield.widget.render(f"bulk_value_{field_name}", None, attrs={
+            'class': 'form-control form-control-sm w-auto', 'id': f"bulk_value_{field_name}"
+        })
+
+    def bulk_update(self, queryset, field_name, value):
+        """
+        Set a field on every row of a queryset.
+
+        Args:
+            queryset: The rows to update
+            field_name (str): The model field to set
+            value: The cleaned value
+
+        Returns:
+            int: The number of rows updated
+        """
+        if self.bulk_update_method != 'save':
+            return queryset.update(**{field_name: value})
+
+        updated = 0
+        with transaction.atomic():
+            for obj in queryset.iterator(chunk_size=self.bulk_batch_size):
+                setattr(obj, field_name, value)
+                obj.save()
+                updated += 1
+        return updated
+
+    def get_use_import(self):
+        """
+        Determine whether users can create objects by uploading a CSV file.
+
+        Returns:
+            bool: True if the import endpoint is enabled
+        """
+        return self.use_import
+
+    def get_import_form_class(self):
+        """
+        Get the form class each row of an imported CSV file is validated with.
+
+        Returns:
+            type[forms.ModelForm]: import_form_class, create_form_class or the view's form class
+        """
+        return self.import_form_class or self.create_form_class or self.get_form_class()
+
+    def import_csv(self, request, *args, **kwargs):
+        """
+        GET and POST handler for the import endpoint.
+
+        GET renders the upload form. POST reads the uploaded CSV file row by row,
+        validates each row with get_import_form_class() and inserts the valid
+        ones with bulk_create() in batches of import_batch_size, each in its own
+        transaction, so the file is never held in memory and one bad row does not
+        stop the import. The columns are the form's field names, with values as
+        the form expects them (eg a ForeignKey's primary key).
+
+        As rows are inserted with bulk_create(), save() is not called, no signals
+        are sent and many-to-many fields are not set.
+
+        Returns:
+            HttpResponse: The upload form, with the result of a POST
+        """
+        if not self.get_use_import():
+            raise Http404("Import is not enabled")
+
+        context = self.get_context_data()
+        context["import_url"] = self.safe_reverse(f"{self.get_prefix()}-import")
+        context["list_view_url"] = self.safe_reverse(f"{self.get_prefix()}-list")
+        if self.get_original_target_storage() == 'header':
+            # the list's target, not the modal's that this request is for
+            target = request.headers.get('X-Original-Target')
+            context["original_target"] = target if target and ORIGINAL_TARGET_RE.fullmatch(target) else None
+
+        if request.method == 'POST':
+            uploaded_file = request.FILES.get('import_file')
+            if uploaded_file is None:
+                context["import_error"] = "Choose a CSV file to import"
+            else:
+                result = context["import_result"] = import_rows(
+                    self.model,
+                    self.get_import_form_class(),
+                    read_csv(uploaded_file),
+                    batch_size=self.import_batch_size,
+                    max_errors=self.import_max_errors,
+                )
+                if result.created:
+                    # no signals are sent by bulk_create()
+                    bump_model_version(self.model)
+
+        template_name = select_template([
+            f"{self.model._meta.app_label}/{self.model._meta.object_name.lower()}_import.html",
+            f"{self.templates_path}/object_import.html",
+        ]).template.name
+        if request.htmx:
+            template_name = f"{template_name}#content"
+        response = render(request, template_name, context)
+        if request.htmx:
+            response['HX-Trigger'] = self.get_hx_trigger()
+        return response
+
+    def get_filterset(self, queryset=None):
+        """
+        Create a dynamic FilterSet class based on provided parameters:
+            - filterset_class (in which case the provided class is used); or
+            - filterset_fields (in which case a dynamic class is created)
+        
+        Args:
+            queryset: Optional queryset to filter
+            
+        Returns:
+            FilterSet: Configured filter set instance or None
+        """
+        filterset_class = getattr(self, "filterset_class", None)
+        filterset_fields = getattr(self, "filterset_fields", None)
+        kwargs = {}
+
+        if filterset_class is None and filterset_fields is not None:
+            filterset_class = self.get_dynamic_filterset_class(filterset_fields)
+            kwargs["autocomplete_urls"] = self.get_filter_autocomplete_urls(filterset_fields)
+
+        if filterset_class is None:
+            return None
+
+        return filterset_class(
+            self.request.GET,
+            queryset=queryset,
+            request=self.request,
+            **kwargs,
+        )
+
+    def get_filter_autocomplete_urls(self, filterset_fields):
+        """
+        Get the autocomplete endpoint of each filter that uses the autocomplete widget.
+
+        Args:
+            filterset_fields (list[str]): Model fields to filter on
+
+        Returns:
+            dict[str, str]: Autocomplete URLs keyed by field name
+        """
+        return {
+            field_name: url for field_name in filterset_fields
+            if self.get_use_autocomplete(field_name)
+            and (url := self.get_autocomplete_url(field_name)) is not None
+        }
+    
+    def get_dynamic_filterset_class(self, filterset_fields):
+        """
+        Get the FilterSet class generated from filterset_fields.
+
+        The class is built once and cached on the view class, keyed on the
+        model, filterset_fields, CSS framework, filter attributes and
+        htmx/crispy flags, so each request only has to instantiate it. Whether
+        a ForeignKey filter uses the autocomplete widget depends on the size of
+        the related table, so that is decided per request, by the
+        autocomplete_urls the instance is created with.
+
+        Args:
+            filterset_fields (list[str]): Model fields to filter on
+
+        Returns:
+            type[FilterSet]: The generated FilterSet class
+        """
+        framework = getattr(settings, 'NOMINOPOLITAN_CSS_FRAMEWORK', 'bootstrap5')
+        filter_attrs = self.get_framework_styles()[framework]['filter_attrs']
+        use_htmx = self.get_use_htmx()
+
+        filterset_classes = type(self).__dict__.get('_filterset_classes')
+        if filterset_classes is None:
+            filterset_classes = type(self)._filterset_classes = {}
+        key = (
+            self.model, tuple(filterset_fields), framework,
+            use_htmx, self.get_use_crispy(), json.dumps(filter_attrs, sort_keys=True),
+        )
+        filterset_class = filterset_classes.get(key)
+        if filterset_class is None:
+            filterset_class = filterset_classes[key] = self._build_filterset_class(
+                filterset_fields, filter_attrs, use_htmx
+            )
+        return filterset_class
+
+    def _build_filterset_class(self, filterset_fields, filter_attrs, use_htmx):
+        """Build the DynamicFilterSet class cached by get_dynamic_filterset_class()."""
+        class DynamicFilterSet(HTMXFilterSetMixin, FilterSet):
+            """
+            Dynamically create a FilterSet class based on the model fields.
+
+            This class inherits from HTMXFilterSetMixin to add HTMX functionality
+            and FilterSet for Django filtering capabilities.
+            """
+            BASE_ATTRS = filter_attrs
+
+            # Dynamically create filter fields based on the model's fields
+            for field_name in filterset_fields:
+                if field_name in self.property_annotations:
+                    # filters the alias added by apply_property_annotations()
+                    model_field = self.get_annotation_field(field_name)
+                else:
+                    model_field = self.model._meta.get_field(field_name)
+                field_attrs = BASE_ATTRS.copy()
+
+                # Handle GeneratedField special case
+                field_to_check = model_field.output_field if isinstance(model_field, models.GeneratedField) else model_field
+
+                # Create appropriate filter based on field type
+                if isinstance(field_to_check, (models.CharField, models.TextField)):
+                    locals()[field_name] = CharFilter(lookup_expr='icontains', widget=forms.TextInput(attrs=field_attrs))
+                elif isinstance(field_to_check, models.DateField):
+                    field_attrs['type'] = 'date'
+                    locals()[field_name] = DateFilter(widget=forms.DateInput(attrs=field_attrs))
+                elif isinstance(field_to_check, (models.IntegerField, models.DecimalField, models.FloatField)):
+                    field_attrs['step'] = 'any'
+                    locals()[field_name] = NumberFilter(widget=forms.NumberInput(attrs=field_attrs))
+                elif isinstance(field_to_check, models.BooleanField):
+                    locals()[field_name] = BooleanFilter(widget=forms.Select(
+                        attrs=field_attrs, choices=((None, '---------'), (True, True), (False, False))))
+                elif isinstance(field_to_check, models.ForeignKey):
+                    locals()[field_name] = ModelChoiceFilter(
+                        queryset=model_field.related_model.objects.all(),
+                        widget=forms.Select(attrs=field_attrs))
+                elif isinstance(field_to_check, models.TimeField):
+                    field_attrs['type'] = 'time'
+                    locals()[field_name] = TimeFilter(widget=forms.TimeInput(attrs=field_attrs))
+                else:
+                    locals()[field_name] = CharFilter(widget=forms.TextInput(attrs=field_attrs))
+
+            class Meta:
+                model = self.model
+                fields = filterset_fields
+
+            def __init__(self, *args, autocomplete_urls=None, **kwargs):
+                """Initialize the FilterSet, switching to autocomplete widgets and setting up HTMX attributes."""
+                super().__init__(*args, **kwargs)
+                # the filters are copies, so the class's widgets are left alone
+                for field_name, url in (autocomplete_urls or {}).items():
+                    filter_ = self.filters[field_name]
+                    filter_.extra['widget'] = AutocompleteSelect(
+                        url, filter_.queryset, attrs=filter_.extra['widget'].attrs
+                    )
+                if use_htmx:
+                    self.setup_htmx_attrs()
+
+        return DynamicFilterSet
+
+    @classmethod
+    def _get_all_fields(cls):
+        # Exclude reverse relations
+        fields = [
+            field.name for field in cls.model._meta.get_fields()
+            if not isinstance(field, ManyToOneRel)
+        ]
+        return fields
+
+    @classmethod
+    def _get_all_properties(cls):
+        return [name for name in dir(cls.model)
+                    if isinstance(getattr(cls.model, name), property) and name != 'pk'
+                ]
+
+    @classmethod
+    def get_view_spec(cls):
+        """
+        Get the resolved field and property configuration for this view class.
+
+        The configuration is resolved on first use and cached on the class, so
+        every request reuses the same frozen ViewSpec. Configuration errors are
+        also reported at startup by the nominopolitan system checks.
+
+        Returns:
+            ViewSpec: The resolved configuration
+
+        Raises:
+            ValueError, TypeError: If the configuration is invalid
+        """
+        spec = cls.__dict__.get('_view_spec')
+        if spec is None:
+            spec = cls._resolve_view_spec(cls)
+            cls._view_spec = spec
+        return spec
+
+    @classmethod
+    def _resolve_view_spec(cls, source):
+        """
+        Resolve fields, properties, detail_fields and detail_properties (after exclusions).
+
+        Args:
+            source: The view class, or a view instance whose attributes were
+                overridden by as_view() initkwargs
+
+        Returns:
+            ViewSpec: The resolved configuration
+        """
+        fields = source.fields
+        properties = source.properties
+        detail_fields = source.detail_fields
+        detail_properties = source.detail_properties
+
+        # determine the starting list of fields (before exclusions)
+        if not fields or fields == '__all__':
+            # set to all fields in model
+            fields = cls._get_all_fields()
+        elif type(fields) == list:
+            # check all are valid fields
+            all_fields = cls._get_all_fields()
+            for field in fields:
+                if field not in all_fields:
+                    raise ValueError(f"Field {field} not defined in {cls.model.__name__}")
+        elif type(fields) != list:
+            raise TypeError("fields must be a list")        
+        else:
+            raise ValueError("fields must be '__all__', a list of valid fields or not defined")
+
+        # exclude fields
+        if type(source.exclude) == list:
+            fields = [field for field in fields if field not in source.exclude]
+        else:
+            raise TypeError("exclude must be a list")
+
+        if properties:
+            if properties == '__all__':
+                # Set properties to a list of every property in the model
+                properties = cls._get_all_properties()
+            elif type(properties) == list:
+                # check all are valid properties
+                all_properties = cls._get_all_properties()
+                for prop in properties:
+                    if prop not in all_properties:
+                        raise ValueError(f"Property {prop} not defined in {cls.model.__name__}")
+            elif type(properties) != list:
+                raise TypeError("properties must be a list or '__all__'")
+            
+        # exclude properties
+        if type(source.properties_exclude) == list:
+            properties = [prop for prop in properties if prop not in source.properties_exclude]
+        else:
+            raise TypeError("properties_exclude must be a list")
+
+        # determine the starting list of detail_fields (before exclusions)
+        if detail_fields == '__all__':
+            # Set detail_fields to a list of every field in the model
+            detail_fields = cls._get_all_fields()        
+        elif not detail_fields or detail_fields == '__fields__':
+            # Set detail_fields to fields
+            detail_fields = fields
+        elif type(detail_fields) == list:
+            # check all are valid fields
+            all_fields = cls._get_all_fields()
+            for field in detail_fields:
+                if field not in all_fields:
+                    raise ValueError(f"detail_field {field} not defined in {cls.model.__name__}")
+        elif type(detail_fields) != list:
+            raise TypeError("detail_fields must be a list or '__all__' or '__fields__' or a list of fields")
+
+        # exclude detail_fields
+        if type(source.detail_exclude) == list:
+            detail_fields = [field for field in detail_fields 
+                                  if field not in source.detail_exclude]
+        else:
+            raise TypeError("detail_fields_exclude must be a list")
+
+        # add specified detail_properties            
+        if detail_properties:
+            if detail_properties == '__all__':
+                # Set detail_properties to a list of every property in the model
+                detail_properties = cls._get_all_properties()
+            elif detail_properties == '__properties__':
+                # Set detail_properties to the list view properties
+                detail_properties = properties
+            elif type(detail_properties) == list:
+                # check all are valid properties
+                all_properties = cls._get_all_properties()
+                for prop in detail_properties:
+                    if prop not in all_properties:
+                        raise ValueError(f"Property {prop} not defined in {cls.model.__name__}")
+            elif type(detail_properties) != list:
+                raise TypeError("detail_properties must be a list or '__all__' or '__properties__'")
+
+        # exclude detail_properties
+        if type(source.detail_properties_exclude) == list:
+            detail_properties = [prop for prop in detail_properties 
+                                  if prop not in source.detail_properties_exclude]
+        else:
+            raise TypeError("detail_properties_exclude must be a list")
+
+        relation_fields = [field for field in cls.model._meta.fields if field.is_relation]
+
+        return ViewSpec(
+            fields=tuple(fields),
+            properties=tuple(properties),
+            detail_fields=tuple(detail_fields),
+            detail_properties=tuple(detail_properties),
+            related_fields=MappingProxyType({
+                field.name: field.related_model._meta.verbose_name
+                for field in relation_fields
+            }),
+            relation_fields=tuple(field.name for field in relation_fields),
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if any(attr in self.__dict__ for attr in self._view_spec_attrs):
+            # configuration was overridden by as_view() initkwargs
+            self.view_spec = self._resolve_view_spec(self)
+        else:
+            self.view_spec = self.get_view_spec()
+
+        self.fields = list(self.view_spec.fields)
+        self.properties = list(self.view_spec.properties)
+        self.detail_fields = list(self.view_spec.detail_fields)
+        self.detail_properties = list(self.view_spec.detail_properties)
+        
+    def _split_related_path(self, path):
+        """
+        Reduce a lookup path to its relation prefix and note whether it crosses
+        a many-valued relation.
+
+        Args:
+            path (str): A lookup path, eg 'author' or 'author__publisher__name'
+
+        Returns:
+            tuple: (relation path or None, True if the path needs prefetch_related)
+        """
+        model = self.model
+        relation_parts = []
+        many = False
+        for part in path.split('__'):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            # stop at concrete values and generic relations
+            if not field.is_relation or field.related_model is None:
+                break
+            if isinstance(field, ForeignObjectRel):
+                relation_parts.append(field.get_accessor_name())
+            else:
+                relation_parts.append(part)
+            many = many or field.many_to_many or field.one_to_many
+            model = field.related_model
+
+        if not relation_parts:
+            return None, False
+        return '__'.join(relation_parts), many
+
+    def get_related_lookups(self, field_names, property_names=()):
+        """
+        Determine which relations to load up front for the displayed fields and properties.
+
+        Forward ForeignKey / OneToOne relations (and reverse OneToOne) are joined
+        using select_related. Paths crossing a ManyToMany or reverse ForeignKey
+        are loaded with prefetch_related, which costs one query per path
+        regardless of the number of rows.
+
+        Args:
+            field_names (list[str]): Model fields being displayed
+            property_names (list[str]): Model properties being displayed
+
+        Returns:
+            tuple: (list of select_related paths, list of prefetch_related paths)
+        """
+        paths = list(field_names)
+        for prop in property_names:
+            if prop not in self.property_annotations:
+                paths.extend(self.property_relations.get(prop, []))
+        paths.extend(self.extra_related)
+
+        select_related = []
+        prefetch_related = []
+        for path in paths:
+            relation_path, many = self._split_related_path(path)
+            if relation_path is None:
+                continue
+            target = prefetch_related if many else select_related
+            if relation_path not in target:
+                target.append(relation_path)
+
+        return select_related, prefetch_related
+
+    def apply_related_lookups(self, queryset, field_names, property_names=()):
+        """
+        Apply select_related / prefetch_related for the displayed relations.
+
+        This method is called from list() and get_object() so that related
+        objects rendered with str() do not trigger a query per row.
+
+        Args:
+            queryset: The queryset to optimise
+            field_names (list[str]): Model fields being displayed
+            property_names (list[str]): Model properties being displayed
+
+        Returns:
+            QuerySet: The queryset with related lookups applied
+        """
+        if not self.use_related_optimization:
+            return queryset
+
+        select_related, prefetch_related = self.get_related_lookups(field_names, property_names)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def apply_property_annotations(self, queryset, property_names=()):
+        """
+        Add the property_annotations to a list queryset.
+
+        Every annotation is added with alias() under its property's name, so
+        filters and sorting can use it; those of displayed properties are also
+        loaded, into annotation_attribute(prop), for the column plan to render.
+
+        Args:
+            queryset: The queryset to annotate
+            property_names (list[str]): Model properties being displayed
+
+        Returns:
+            QuerySet: The annotated queryset
+        """
+        annotations = self.get_property_annotations()
+        if not annotations:
+            return queryset
+        queryset = queryset.alias(**annotations)
+        loaded = {
+            annotation_attribute(prop): models.F(prop) for prop in property_names if prop in annotations
+        }
+        return queryset.annotate(**loaded) if loaded else queryset
+
+    def get_property_annotations(self):
+        """
+        Get the SQL expressions standing in for properties in list views.
+
+        Returns:
+            dict[str, Expression]: Expressions keyed by property name
+        """
+        return self.property_annotations
+
+    def get_annotation_field(self, prop):
+        """
+        Get the model field type of a property's annotation, eg to choose its filter.
+
+        Args:
+            prop (str): A property in property_annotations
+
+        Returns:
+            Field: The annotation's output field
+        """
+        queryset = self.model._default_manager.alias(**{prop: self.property_annotations[prop]})
+        return queryset.query.annotations[prop].output_field
+
+    def get_projection(self, field_names, property_names=()):
+        """
+        Determine the columns the list view needs to load.
+
+        These are the pk, the displayed concrete fields (with all columns of
+        displayed relations, or those in related_only), the property_fields of
+        displayed properties and the relations in property_relations and
+        extra_related. If a displayed property does not declare its
+        property_fields (or a property_annotations entry) nothing is deferred,
+        since it may read any column.
+
+        Args:
+            field_names (list[str]): Model fields being displayed
+            property_names (list[str]): Model properties being displayed
+
+        Returns:
+            list[str] | None: Field paths for QuerySet.only(), or None to load every column
+        """
+        if not self.use_column_projection:
+            return None
+        # annotated properties are computed by the database from any columns
+        property_names = [prop for prop in property_names if prop not in self.property_annotations]
+        if any(prop not in self.property_fields for prop in property_names):
+            return None
+
+        opts = self.model._meta
+        related = self.use_related_optimization
+        only = {opts.pk.name}
+
+        def load_all(model, prefix):
+            only.update(f"{prefix}__{field.name}" for field in model._meta.concrete_fields)
+
+        for name in field_names:
+            field = opts.get_field(name)
+            if not field.concrete or field.many_to_many:
+                # loaded by prefetch_related, which only needs the pk
+                continue
+            only.add(name)
+            if field.is_relation and related:
+                if name in self.related_only:
+                    only.update(f"{name}__{column}" for column in self.related_only[name])
+                else:
+                    load_all(field.related_model, name)
+
+        for prop in property_names:
+            only.update(self.property_fields[prop])
+
+        paths = [path for prop in property_names for path in self.property_relations.get(prop, [])]
+        for path in [*paths, *self.extra_related]:
+            # load every column along the joined (forward) part of the path
+            model, prefix = self.model, []
+            for part in path.split('__'):
+                try:
+                    field = model._meta.get_field(part)
+                except FieldDoesNotExist:
+                    break
+                if not field.concrete or not field.is_relation or field.many_to_many:
+                    break
+                prefix.append(part)
+                only.add('__'.join(prefix))
+                if not related:
+                    break
+                model = field.related_model
+                load_all(model, '__'.join(prefix))
+
+        return sorted(only)
+
+    def get_use_fast_rows(self):
+        """
+        Determine whether list rows are rendered by compile_rows_renderer() instead of the template.
+
+        Returns:
+            bool: True to use the compiled row renderer
+        """
+        return self.use_fast_rows
+
+    def get_use_column_toggles(self):
+        """
+        Determine whether users can hide list columns.
+
+        Returns:
+            bool: True if column toggles are enabled
+        """
+        return self.use_column_toggles
+
+    def get_column_cookie_name(self):
+        """
+        Get the name of the cookie holding the hidden list columns.
+
+        Returns:
+            str: The cookie name, eg "nominopolitan_columns_sample_book"
+        """
+        return f"nominopolitan_columns_{self.get_prefix().replace(':', '_')}"
+
+    def get_hidden_columns(self):
+        """
+        Get the list columns the user has hidden.
+
+        The cookie is set client side by the column toggle menu and holds the
+        hidden column names separated by '.'; unknown names are ignored.
+
+        Returns:
+            list[str]: Names of hidden fields and properties
+        """
+        if not self.get_use_column_toggles():
+            return []
+        value = self.request.COOKIES.get(self.get_column_cookie_name(), '')
+        columns = {*self.view_spec.fields, *self.view_spec.properties}
+        return [name for name in value.split('.') if name in columns]
+
+    def hide_columns(self):
+        """
+        Remove the columns the user has hidden from the displayed fields and properties.
+
+        Called when rendering the list table, so hidden columns are neither
+        queried nor shown there; exports and bulk actions keep the view's
+        configured columns.
+        """
+        hidden_columns = self.get_hidden_columns()
+        if hidden_columns:
+            self.fields = [name for name in self.fields if name not in hidden_columns]
+            self.properties = [name for name in self.properties if name not in hidden_columns]
+
+    def get_column_plan(self, fields=None, properties=None):
+        """
+        Get the compiled column plan for the list view.
+
+        Each column is compiled once per view class and reused by every request
+        (whichever columns the user has hidden), so rendering a row only calls
+        the precompiled renderers rather than looking up field metadata for
+        each cell.
+
+        Args:
+            fields (list[str] | None): Fields to plan for (defaults to the displayed fields)
+            properties (list[str] | None): Properties to plan for (defaults to the displayed properties)
+
+        Returns:
+            tuple[Column, ...]: One Column per field and property
+        """
+        fields = self.fields if fields is None else fields
+        properties = self.properties if properties is None else properties
+        columns = type(self).__dict__.get('_columns')
+        if columns is None:
+            columns = type(self)._columns = {}
+
+        plan = []
+        for kind, names in (('field', fields), ('property', properties)):
+            for name in names:
+                column = columns.get((kind, name))
+                if column is None:
+                    column = columns[kind, name] = self._build_column(kind, name)
+                plan.append(column)
+        return tuple(plan)
+
+    def _build_column(self, kind, name):
+        if kind == 'field':
+            render = _field_renderer(self.model._meta.get_field(name))
+        else:
+            render = _property_renderer(
+                annotation_attribute(name) if name in self.property_annotations else name
+            )
+        return Column(name, name.replace('_', ' ').title(), render)
+
+    def get_object(self):
+        """
+        Override of neapolitan's get_object method, loading the object with get_object_lookup().
+
+        Returns:
+            Model: The object the view is displaying
+        """
+        queryset, lookup = self.get_object_lookup()
+        return get_object_or_404(queryset, **lookup)
+
+    def get_object_lookup(self):
+        """
+        Get the queryset and lookup that the view's object is loaded with.
+
+        For the detail view the relations in detail_fields and detail_properties
+        are loaded in the same query as the object itself.
+
+        Returns:
+            tuple: (QuerySet, dict of lookup keyword arguments)
+        """
+        queryset = self.get_queryset()
+        if self.role is Role.DETAIL:
+            queryset = self.apply_related_lookups(
+                queryset, self.detail_fields, self.detail_properties
+            )
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+
+        try:
+            lookup = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        except KeyError:
+            msg = "Lookup field '%s' was not provided in view kwargs to '%s'"
+            raise ImproperlyConfigured(
+                msg % (lookup_url_kwarg, self.__class__.__name__)
+            )
+        return queryset, lookup
+
+    def get_use_autocomplete(self, field_name):
+        """
+        Determine if a ForeignKey field should use the autocomplete widget.
+
+        This method is called when building filtersets and forms. Fields listed in
+        autocomplete_fields always use it; other ForeignKey / OneToOne fields use it
+        when their related table has more than autocomplete_threshold rows.
+        Requires HTMX.
+
+        Args:
+            field_name (str): Name of the model field
+
+        Returns:
+            bool: True if the autocomplete widget should be used
+        """
+        if not self.get_use_htmx():
+            return False
+        try:
+            model_field = self.model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return False
+        if not model_field.concrete or not (model_field.many_to_one or model_field.one_to_one):
+            return False
+
+        if field_name in self.autocomplete_fields:
+            return True
+        if self.autocomplete_threshold is None:
+            return False
+
+        return self.table_exceeds(model_field.related_model, self.autocomplete_threshold)
+
+    def table_exceeds(self, model, threshold):
+        """
+        Determine whether a model's table has more than threshold rows.
+
+        The check is a bounded count, never scanning more than threshold + 1
+        rows, and is cached on the view class for TABLE_SIZE_RECHECK_SECONDS.
+
+        Args:
+            model: The model class
+            threshold (int): The row count to compare against
+
+        Returns:
+            bool: True if the table has more than threshold rows
+        """
+        table_sizes = type(self).__dict__.get('_table_sizes')
+        if table_sizes is None:
+            table_sizes = type(self)._table_sizes = {}
+        key = (model, threshold)
+        now = time.monotonic()
+        checked = table_sizes.get(key)
+        if checked is None or now - checked[0] > TABLE_SIZE_RECHECK_SECONDS:
+            size = model._default_manager.all()[:threshold + 1].count()
+            checked = table_sizes[key] = (now, size > threshold)
+        return checked[1]
+
+    def get_autocomplete_url(self, field_name):
+        """
+        Get the URL of the autocomplete endpoint for a field.
+
+        Args:
+            field_name (str): Name of the ForeignKey field
+
+        Returns:
+            str or None: The endpoint URL, or None if the endpoint is not registered
+        """
+        return self.safe_reverse(
+            f"{self.get_prefix()}-autocomplete", kwargs={"field_name": field_name}
+        )
+
+    def get_autocomplete_queryset(self, field_name):
+        """
+        Get the related objects offered by the autocomplete endpoint for a field.
+
+        Only ForeignKeys using autocomplete in the view's forms or filterset_fields
+        are served. Form fields use their own queryset (so limit_choices_to applies).
+
+        Args:
+            field_name (str): Name of the ForeignKey field
+
+        Returns:
+            tuple: (queryset, to_field_name or None)
+
+        Raises:
+            Http404: If the field is not served by the autocomplete endpoint
+        """
+        if not self.get_use_autocomplete(field_name):
+            raise Http404
+
+        for form_class in (self.create_form_class, self.get_form_class()):
+            form_field = getattr(form_class, 'base_fields', {}).get(field_name)
+            if isinstance(form_field, forms.ModelChoiceField):
+                return form_field.queryset, form_field.to_field_name
+
+        if field_name in (getattr(self, "filterset_fields", None) or []):
+            related_model = self.model._meta.get_field(field_name).related_model
+            return related_model._default_manager.all(), None
+
+        raise Http404
+
+    def get_autocomplete_search_fields(self, field_name):
+        """
+        Get the related model fields searched for a ForeignKey.
+
+        Args:
+            field_name (str): Name of the ForeignKey field
+
+        Returns:
+            list[str]: autocomplete_search_fields[field_name] if set, otherwise
+                the related model's CharFields
+        """
+        if field_name in self.autocomplete_search_fields:
+            return self.autocomplete_search_fields[field_name]
+        related_model = self.model._meta.get_field(field_name).related_model
+        return [
+            field.name for field in related_model._meta.concrete_fields
+            if isinstance(field, models.CharField)
+        ]
+
+    def autocomplete(self, request, *args, **kwargs):
+        """
+        GET handler for the autocomplete endpoint.
+
+        Renders one page (autocomplete_limit rows) of related objects matching
+        the `q` parameter as options for AutocompleteSelect.
+
+        Returns:
+            HttpResponse: The rendered options
+        """
+        field_name = self.kwargs["field_name"]
+        queryset, to_field_name = self.get_autocomplete_queryset(field_name)
+
+        query = request.GET.get("q", "").strip()
+        if query:
+            condition = models.Q()
+            for search_field in self.get_autocomplete_search_fields(field_name):
+                condition |= models.Q(**{f"{search_field}__{self.autocomplete_lookup}": query})
+            queryset = queryset.filter(condition)
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+        limit = self.autocomplete_limit
+        offset = (page - 1) * limit
+        # fetch one extra row to know whether there is another page
+        objects = list(queryset[offset:offset + limit + 1])
+
+        context = {
+            "page": page,
+            "results": [
+                (getattr(obj, to_field_name or "pk"), str(obj)) for obj in objects[:limit]
+            ],
+            "next_url": (
+                f"{request.path}?{urlencode({'q': query, 'page': page + 1})}"
+                if len(objects) > limit else None
+            ),
+        }
+        return render(
+            request=request,
+            template_name=f"{self.templates_path}/partial/autocomplete.html",
+            context=context,
+        )
+
+    def get_pagination_mode(self):
+        """
+        Get the pagination mode for the list view.
+
+        'infinite' needs htmx, so without it the list falls back to 'keyset'.
+
+        Returns:
+            str: 'page', 'keyset' or 'infinite'
+        """
+        if self.pagination_mode == 'infinite' and not self.get_use_htmx():
+            return 'keyset'
+        return self.pagination_mode
+
+    def get_rows_request(self):
+        """
+        Determine whether the request is for the next batch of rows in infinite mode.
+
+        Returns:
+            bool: True if only the table rows should be rendered
+        """
+        return bool(
+            self.request.htmx
+            and self.role == Role.LIST
+            and self.request.headers.get('X-Rows-Request')
+            and self.get_pagination_mode() == 'infinite'
+        )
+
+    def get_keyset_ordering(self, queryset):
+        """
+        Get the ordering keys used for keyset pagination.
+
+        Uses the queryset's ordering, or the model's Meta.ordering, with pk appended
+        so that every row has a unique position. Relations are ordered by their key
+        column so that the ORDER BY and the seek condition agree.
+
+        Args:
+            queryset: The (filtered) list queryset
+
+        Returns:
+            list[str]: Ordering keys, eg ['-published_date', 'pk']
+
+        Raises:
+            ImproperlyConfigured: If the ordering uses expressions or random ordering
+        """
+        pk = self.model._meta.pk
+        ordering = list(queryset.query.order_by) or list(self.model._meta.ordering)
+
+        keys = []
+        for item in ordering:
+            if not isinstance(item, str) or item == '?':
+                raise ImproperlyConfigured(
+                    f"{self.__class__.__name__} keyset pagination requires ordering by field names, not {item!r}"
+                )
+            prefix = '-' if item.startswith('-') else ''
+            parts = item.lstrip('-').split('__')
+            model = self.model
+            for index, part in enumerate(parts):
+                try:
+                    field = model._meta.get_field(part)
+                except FieldDoesNotExist:
+                    # eg an annotation
+                    break
+                if not field.is_relation:
+                    break
+                if index == len(parts) - 1 and field.concrete:
+                    parts[index] = field.attname
+                model = field.related_model
+            keys.append(prefix + '__'.join(parts))
+
+        if not any(key.lstrip('-') in ('pk', pk.name, pk.attname) for key in keys):
+            keys.append('pk')
+        return keys
+
+    def get_page_url(self, **params):
+        """
+        Build a pagination query string that keeps the current filter parameters.
+
+        Args:
+            **params: Pagination parameters to set, eg cursor='...'
+
+        Returns:
+            str: A query string starting with '?'
+        """
+        query = self.request.GET.copy()
+        for key in (self.page_kwarg, self.cursor_kwarg):
+            query.pop(key, None)
+        for key, value in params.items():
+            query[key] = value
+        return f"?{query.urlencode()}"
+
+    def get_count_strategy(self):
+        """
+        Get the count strategy for numbered pagination.
+
+        Returns:
+            str: 'exact', 'cached', 'estimated' or 'none'
+        """
+        return self.count_strategy
+
+    def get_normalized_query(self, exclude=()):
+        """
+        Get the request's query parameters in a stable order, for use in cache keys.
+
+        Args:
+            exclude (iterable[str]): Parameter names to leave out
+
+        Returns:
+            str: The sorted, urlencoded query parameters
+        """
+        items = sorted(
+            (key, value)
+            for key, values in self.request.GET.lists() if key not in exclude
+            for value in values if value != ''
+        )
+        return urlencode(items)
+
+    def get_count_cache_key(self):
+        """
+        Get the cache key for the 'cached' count strategy.
+
+        The key covers the view and its filter parameters. Override this to add
+        anything else the queryset depends on, such as the user.
+
+        Returns:
+            str: The cache key
+        """
+        query = self.get_normalized_query(exclude=(self.page_kwarg, self.cursor_kwarg))
+        digest = hashlib.md5(query.encode(), usedforsecurity=False).hexdigest()
+        return f"nominopolitan:count:{self.model._meta.label_lower}:{self.get_prefix()}:{digest}"
+
+    def get_paginator(self, queryset, page_size):
+        """
+        Override of neapolitan's get_paginator to apply the count strategy.
+
+        Returns:
+            Paginator: A paginator for the count strategy
+        """
+        strategy = self.get_count_strategy()
+        if strategy == 'cached':
+            return CachedCountPaginator(
+                queryset, page_size,
+                cache=caches[self.count_cache_alias],
+                cache_key=self.get_count_cache_key(),
+                timeout=self.count_cache_timeout,
+            )
+        elif strategy == 'estimated':
+            return EstimatedCountPaginator(queryset, page_size, cap=self.count_estimate_cap)
+        elif strategy == 'none':
+            return UncountedPaginator(queryset, page_size)
+        return super().get_paginator(queryset, page_size)
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Override of neapolitan's paginate_queryset to support keyset pagination.
+
+        When pagination_mode is 'keyset' or 'infinite' the page is selected by the
+        cursor in the query string, seeking on get_keyset_ordering() rather than
+        using OFFSET.
+
+        Returns:
+            Page or KeysetPage: The requested page
+        """
+        if self.get_pagination_mode() not in ('keyset', 'infinite'):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size, self.get_keyset_ordering(queryset))
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        try:
+            page = paginator.page(cursor)
+        except InvalidPage as exc:
+            raise Http404(f"Invalid cursor: {exc}")
+        return self.link_keyset_page(page)
+
+    def link_keyset_page(self, page):
+        """
+        Add the URLs of the following and preceding pages to a keyset page.
+
+        Returns:
+            KeysetPage: The page
+        """
+        if page.has_next():
+            page.next_url = self.get_page_url(**{self.cursor_kwarg: page.next_cursor})
+        if page.has_previous():
+            page.previous_url = self.get_page_url(**{self.cursor_kwarg: page.previous_cursor})
+        return page
+
+    def get_fragment_cache_timeout(self):
+        """
+        Get how long htmx list partials are cached for.
+
+        Returns:
+            int | None: Seconds, or None if the fragment cache is disabled
+        """
+        return self.fragment_cache_timeout
+
+    def get_cache_models(self):
+        """
+        Get the models whose changes invalidate cached partials and validators.
+
+        These are the view's model plus every model reached by the displayed
+        fields, property_relations and extra_related (and, for lists,
+        filterset_fields). Saving or deleting any of them bumps their version
+        stamp (see nominopolitan.cache).
+
+        Returns:
+            set: Model classes
+        """
+        return self._get_cache_models(self, self.role)
+
+    @classmethod
+    def get_watched_models(cls, role, **initkwargs):
+        """
+        Get the models watched from startup for a role, without creating a view.
+
+        These are the models get_cache_models() returns by default for the class
+        configuration and as_view() initkwargs. Models added by overriding
+        get_cache_models() are watched from the first request that uses them.
+
+        Args:
+            role (Role): The role of the view
+            **initkwargs: The as_view() initkwargs
+
+        Returns:
+            set: Model classes
+        """
+        source = SimpleNamespace(**{
+            name: initkwargs.get(name, getattr(cls, name, None))
+            for name in (
+                'model', *cls._view_spec_attrs, 'extra_related', 'property_relations', 'filterset_fields',
+            )
+        })
+        if any(attr in initkwargs for attr in cls._view_spec_attrs):
+            spec = cls._resolve_view_spec(source)
+        else:
+            spec = cls.get_view_spec()
+        source.fields, source.properties = spec.fields, spec.properties
+        source.detail_fields, source.detail_properties = spec.detail_fields, spec.detail_properties
+        return cls._get_cache_models(source, role)
+
+    @staticmethod
+    def _get_cache_models(source, role):
+        """
+        Get the models reached by the resolved configuration of a view.
+
+        Args:
+            source: A view instance, or a namespace with its resolved configuration
+            role (Role): The role of the view
+
+        Returns:
+            set: Model classes
+        """
+        if role == Role.DETAIL:
+            fields, properties, filters = source.detail_fields, source.detail_properties, []
+        else:
+            fields, properties = source.fields, source.properties
+            filters = getattr(source, "filterset_fields", None) or []
+        paths = [*fields, *source.extra_related, *filters]
+        for prop in properties:
+            paths.extend(source.property_relations.get(prop, []))
+
+        models = {source.model}
+        for path in paths:
+            model = source.model
+            for part in path.split('__'):
+                try:
+                    field = model._meta.get_field(part)
+                except FieldDoesNotExist:
+                    break
+                if not field.is_relation or field.related_model is None:
+                    break
+                model = field.related_model
+                models.add(model)
+        return models
+
+    def get_cache_vary(self):
+        """
+        Get the request specific values which cached partials and ETags depend on.
+
+        These include the user, as get_queryset() or the templates may depend on
+        them. Override this to add anything else the rendered fragment depends on,
+        eg a tenant resolved from the host name.
+
+        Returns:
+            tuple: Values included in fragment cache keys and detail ETags
+        """
+        user = getattr(self.request, "user", None)
+        return (
+            user.pk if user is not None and user.is_authenticated else None,
+            self.request.htmx.target,
+            self.request.headers.get('X-Original-Target'),
+            get_language(),
+            tuple(self.get_hidden_columns()),
+        )
+
+    def get_fragment_cache_key(self):
+        """
+        Get the cache key for the current htmx list partial.
+
+        The key covers the view, the partial being rendered, the normalized query
+        parameters, get_cache_vary() and the version stamps of
+        get_cache_models(), which are bumped whenever those models change.
+
+        Returns:
+            str | None: The key, or None if the response should not be cached
+        """
+        if self.get_fragment_cache_timeout() is None:
+            return None
+        return self.get_fragment_key()
+
+    def get_coalesce_key(self):
+        """
+        Get the key under which identical concurrent htmx list requests are coalesced.
+
+        This is the fragment key: requests sharing it would render the same partial.
+        As get_cache_vary() includes the user, only requests of the same user are
+        coalesced; override get_cache_vary() to leave the user out if the list
+        does not depend on them, so that requests of different users share a render.
+
+        Returns:
+            str | None: The key, or None if the request should not be coalesced
+        """
+        if not self.get_coalesce_requests():
+            return None
+        return self.fragment_cache_key or self.get_fragment_key()
+
+    def get_coalesce_requests(self):
+        """
+        Determine whether identical concurrent htmx list requests are coalesced.
+
+        Returns:
+            bool: True if coalescing is enabled
+        """
+        return self.coalesce_requests
+
+    def get_fragment_key(self):
+        """
+        Get the key identifying the htmx list partial the current request renders.
+
+        See get_fragment_cache_key().
+
+        Returns:
+            str | None: The key, or None if this is not an htmx list request
+        """
+        if self.role != Role.LIST or not self.request.htmx:
+            return None
+
+        models = self.get_cache_models()
+        watch_models(models)
+
+        if self.get_rows_request():
+            partial = "rows"
+        elif self.request.headers.get('X-Filter-Request'):
+            partial = "filtered_results"
+        else:
+            partial = "content"
+        parts = (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            partial,
+            self.get_normalized_query(),
+            self.get_cache_vary(),
+            get_model_versions(models),
+        )
+        digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        return f"nominopolitan:fragment:{self.get_prefix()}-{self.role.value}:{digest}"
+
+    def get_use_conditional_responses(self):
+        """
+        Determine whether htmx partials get ETag / Last-Modified validators.
+
+        Returns:
+            bool: True if conditional responses are enabled
+        """
+        return self.use_conditional_responses
+
+    def get_etag(self):
+        """
+        Get an ETag for the detail partial that can be checked before any query.
+
+        It is built from the request path, get_cache_vary() and the version
+        stamps of get_cache_models(). Lists (and details with a
+        last_modified_field) are instead given an ETag hashed from the
+        rendered content.
+
+        Returns:
+            str | None: A quoted ETag, or None
+        """
+        if self.role != Role.DETAIL or self.last_modified_field:
+            return None
+
+        models = self.get_cache_models()
+        watch_models(models)
+        parts = (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self.request.get_full_path(),
+            self.get_cache_vary(),
+            get_model_versions(models),
+        )
+        return quote_etag(hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest())
+
+    def get_last_modified(self):
         """
-        Handle GET requests for list view, including filtering and pagination.
-        
+        Get the Last-Modified time of the detail object from last_modified_field.
+
         Returns:
-            TemplateResponse: Rendered list view
+            int | None: A timestamp, or None
         """
-        queryset = self.get_queryset()
-        filterset = self.get_filterset(queryset)
-        if filterset is not None:
-            queryset = filterset.qs
+        if self.role != Role.DETAIL or not self.last_modified_field or not self.object:
+            return None
+        value = getattr(self.object, self.last_modified_field)
+        return int(value.timestamp()) if value else None
 
-        if not self.allow_empty and not queryset.exists():
-            raise Http404
+    def get_not_modified_response(self, etag=None, last_modified=None):
+        """
+        Check the request's conditional headers against validators.
 
-        paginate_by = self.get_paginate_by()
-        if paginate_by is None:
-            # Unpaginated response
-            self.object_list = queryset
-            context = self.get_context_data(
-                test_variable="Testing",
-                page_obj=None,
-                is_paginated=False,
-                paginator=None,
-                filterset=filterset,
-            )
-        else:
-            # Paginated response
-            page = self.paginate_queryset(queryset, paginate_by)
-            self.object_list = page.object_list
-            context = self.get_context_data(
-                test_variable="Testing",
-                page_obj=page,
-                is_paginated=page.has_other_pages(),
-                paginator=page.paginator,
-                filterset=filterset,
-            )
+        Args:
+            etag (str | None): The quoted ETag of the current representation
+            last_modified (int | None): Its Last-Modified timestamp
 
-        return self.render_to_response(context)
+        Returns:
+            HttpResponse | None: A 304 response if the client's copy is current
+        """
+        response = HttpResponse()
+        self.add_validators(response, etag, last_modified)
+        response = get_conditional_response(
+            self.request, etag=etag, last_modified=last_modified, response=response
+        )
+        return response if response.status_code == 304 else None
+
+    def add_validators(self, response, etag=None, last_modified=None):
+        if etag:
+            response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_vary_headers(response, self.vary_headers)
+        # always revalidate, so stale partials are never reused
+        patch_cache_control(response, no_cache=True)
+
+    def get_use_server_timing(self):
+        """
+        Determine whether list responses get a Server-Timing header with the time of each phase.
 
+        Returns:
+            bool: True to add the Server-Timing header
+        """
+        return self.use_server_timing
 
-    def get_filterset(self, queryset=None):
+    def get_timer(self):
         """
-        Create a dynamic FilterSet class based on provided parameters:
-            - filterset_class (in which case the provided class is used); or
-            - filterset_fields (in which case a dynamic class is created)
-        
-        Args:
-            queryset: Optional queryset to filter
-            
+        Get the timer for the phases of a list request.
+
+        Phases are timed when use_server_timing is on or a receiver of
+        phases_timed is connected for the view. Otherwise NULL_TIMER is
+        returned, so the phases cost a no-op context manager each.
+
         Returns:
-            FilterSet: Configured filter set instance or None
+            PhaseTimer | NullTimer: The timer
         """
-        filterset_class = getattr(self, "filterset_class", None)
-        filterset_fields = getattr(self, "filterset_fields", None)
+        if self.get_use_server_timing() or phases_timed.has_listeners(type(self)):
+            return PhaseTimer()
+        return NULL_TIMER
 
-        if filterset_class is None and filterset_fields is not None:
-            use_htmx = self.get_use_htmx()
-            use_crispy = self.get_use_crispy()
+    def report_timings(self, response, timings):
+        """
+        Report the timings of a list request.
 
-            class DynamicFilterSet(HTMXFilterSetMixin, FilterSet):
-                """
-                Dynamically create a FilterSet class based on the model fields.
+        Adds the Server-Timing header if use_server_timing is on, and sends
+        phases_timed. Override it to forward the timings elsewhere.
 
-                This class inherits from HTMXFilterSetMixin to add HTMX functionality
-                and FilterSet for Django filtering capabilities.
-                """
-                framework = getattr(settings, 'NOMINOPOLITAN_CSS_FRAMEWORK', 'bootstrap5')
-                BASE_ATTRS = self.get_framework_styles()[framework]['filter_attrs']
+        Phases are "queryset" and "filter" (building the filtered queryset),
+        "paginate" (the count, or the rows of a keyset page), "context",
+        "fetch" (loading the rows), "rows" (their cell values), "actions"
+        (their action links) and "render" (the rest of the template). Each
+        excludes the phases nested in it.
 
-                # Dynamically create filter fields based on the model's fields
-                for field_name in filterset_fields:
-                    model_field = self.model._meta.get_field(field_name)
-                    field_attrs = BASE_ATTRS.copy()
-
-                    # Handle GeneratedField special case
-                    field_to_check = model_field.output_field if isinstance(model_field, models.GeneratedField) else model_field
-
-                    # Create appropriate filter based on field type
-                    if isinstance(field_to_check, (models.CharField, models.TextField)):
-                        locals()[field_name] = CharFilter(lookup_expr='icontains', widget=forms.TextInput(attrs=field_attrs))
-                    elif isinstance(field_to_check, models.DateField):
-                        field_attrs['type'] = 'date'
-                        locals()[field_name] = DateFilter(widget=forms.DateInput(attrs=field_attrs))
-                    elif isinstance(field_to_check, (models.IntegerField, models.DecimalField, models.FloatField)):
-                        field_attrs['step'] = 'any'
-                        locals()[field_name] = NumberFilter(widget=forms.NumberInput(attrs=field_attrs))
-                    elif isinstance(field_to_check, models.BooleanField):
-                        locals()[field_name] = BooleanFilter(widget=forms.Select(
-                            attrs=field_attrs, choices=((None, '---------'), (True, True), (False, False))))
-                    elif isinstance(field_to_check, models.ForeignKey):
-                        locals()[field_name] = ModelChoiceFilter(queryset=model_field.related_model.objects.all(), 
-                                                                 widget=forms.Select(attrs=field_attrs))
-                    elif isinstance(field_to_check, models.TimeField):
-                        field_attrs['type'] = 'time'
-                        locals()[field_name] = TimeFilter(widget=forms.TimeInput(attrs=field_attrs))
-                    else:
-                        locals()[field_name] = CharFilter(widget=forms.TextInput(attrs=field_attrs))
-
-                class Meta:
-                    model = self.model
-                    fields = filterset_fields
-               
-                def __init__(self, *args, **kwargs):
-                    """Initialize the FilterSet and set up HTMX attributes if needed."""
-                    super().__init__(*args, **kwargs)
-                    if use_htmx:
-                        self.setup_htmx_attrs()
-                        
-            filterset_class = DynamicFilterSet
+        Args:
+            response (HttpResponse): The list view's response
+            timings (list[PhaseTiming]): The time and queries of each phase,
+                followed by the "total"
+        """
+        if self.get_use_server_timing():
+            response['Server-Timing'] = format_server_timing(timings)
+        phases_timed.send(sender=type(self), view=self, request=self.request, timings=timings)
 
-        if filterset_class is None:
-            return None
+    def finalize_response(self, response):
+        """
+        Add Vary headers and, if enabled, answer conditional htmx requests.
 
-        return filterset_class(
-            self.request.GET,
-            queryset=queryset,
-            request=self.request,
-        )
-    
-    def _get_all_fields(self):
-        fields = [field.name for field in self.model._meta.get_fields()]
-            
-        # Exclude reverse relations
-        fields = [
-            field.name for field in self.model._meta.get_fields()
-            if not isinstance(field, ManyToOneRel)
-        ]
-        return fields
+        Full pages and htmx partials are served from the same URL, so responses
+        always vary on the htmx request headers.
 
-    
-    def _get_all_properties(self):
-        return [name for name in dir(self.model)
-                    if isinstance(getattr(self.model, name), property) and name != 'pk'
-                ]
+        Args:
+            response (HttpResponse): The response to finalize
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        Returns:
+            HttpResponse: The response, or a 304 Not Modified response
+        """
+        patch_vary_headers(response, self.vary_headers)
+        if self.get_use_column_toggles():
+            patch_vary_headers(response, ('Cookie',))
+        if not (
+            self.request.htmx
+            and self.get_use_conditional_responses()
+            and self.request.method in ('GET', 'HEAD')
+            and response.status_code == 200
+        ):
+            return response
 
-        # determine the starting list of fields (before exclusions)
-        if not self.fields or self.fields == '__all__':
-            # set to all fields in model
-            self.fields = self._get_all_fields()
-        elif type(self.fields) == list:
-            # check all are valid fields
-            all_fields = self._get_all_fields()
-            for field in self.fields:
-                if field not in all_fields:
-                    raise ValueError(f"Field {field} not defined in {self.model.__name__}")
-        elif type(self.fields) != list:
-            raise TypeError("fields must be a list")        
-        else:
-            raise ValueError("fields must be '__all__', a list of valid fields or not defined")
+        etag = getattr(self, "etag", None) or quote_etag(
+            hashlib.md5(response.content, usedforsecurity=False).hexdigest()
+        )
+        last_modified = self.get_last_modified()
+        self.add_validators(response, etag, last_modified)
+        return get_conditional_response(
+            self.request, etag=etag, last_modified=last_modified, response=response
+        )
 
-        # exclude fields
-        if type(self.exclude) == list:
-            self.fields = [field for field in self.fields if field not in self.exclude]
-        else:
-            raise TypeError("exclude must be a list")
+    def detail(self, request, *args, **kwargs):
+        """
+        GET handler for the detail view, answering conditional htmx requests early.
 
-        if self.properties:
-            if self.properties == '__all__':
-                # Set self.properties to a list of every property in self.model
-                self.properties = self._get_all_properties()
-            elif type(self.properties) == list:
-                # check all are valid properties
-                all_properties = self._get_all_properties()
-                for prop in self.properties:
-                    if prop not in all_properties:
-                        raise ValueError(f"Property {prop} not defined in {self.model.__name__}")
-            elif type(self.properties) != list:
-                raise TypeError("properties must be a list or '__all__'")
-            
-        # exclude properties
-        if type(self.properties_exclude) == list:
-            self.properties = [prop for prop in self.properties if prop not in self.properties_exclude]
-        else:
-            raise TypeError("properties_exclude must be a list")
+        With use_conditional_responses, a stamp based ETag is checked before the
+        object is loaded and a Last-Modified time before the partial is rendered.
+        """
+        if request.htmx and self.get_use_conditional_responses():
+            self.etag = self.get_etag()
+            if self.etag and (response := self.get_not_modified_response(etag=self.etag)):
+                return response
+
+            self.object = self.get_object()
+            last_modified = self.get_last_modified()
+            if last_modified and (
+                response := self.get_not_modified_response(last_modified=last_modified)
+            ):
+                return response
+            return self.render_to_response(self.get_context_data())
+
+        return super().detail(request, *args, **kwargs)
+
+    def render_fragment(self, content):
+        """
+        Build the response for an htmx list partial rendered by another request.
 
-        # determine the starting list of detail_fields (before exclusions)
-        if self.detail_fields == '__all__':
-            # Set self.detail_fields to a list of every field in self.model
-            self.detail_fields = self._get_all_fields()        
-        elif not self.detail_fields or self.detail_fields == '__fields__':
-            # Set self.detail_fields to self.fields
-            self.detail_fields = self.fields
-        elif type(self.detail_fields) == list:
-            # check all are valid fields
-            all_fields = self._get_all_fields()
-            for field in self.detail_fields:
-                if field not in all_fields:
-                    raise ValueError(f"detail_field {field} not defined in {self.model.__name__}")
-        elif type(self.detail_fields) != list:
-            raise TypeError("detail_fields must be a list or '__all__' or '__fields__' or a list of fields")
+        Used for fragment cache hits and coalesced requests: the request's own
+        original target is still recorded and its validators added.
 
-        # exclude detail_fields
-        if type(self.detail_exclude) == list:
-            self.detail_fields = [field for field in self.detail_fields 
-                                  if field not in self.detail_exclude]
-        else:
-            raise TypeError("detail_fields_exclude must be a list")
+        Args:
+            content (bytes): The rendered partial
 
-        # add specified detail_properties            
-        if self.detail_properties:
-            if self.detail_properties == '__all__':
-                # Set self.detail_properties to a list of every property in self.model
-                self.detail_properties = self._get_all_properties()
-            elif self.detail_properties == '__properties__':
-                # Set self.detail_properties to a list of every property in self.model
-                self.detail_properties = self.properties
-            elif type(self.detail_properties) == list:
-                # check all are valid properties
-                all_properties = self._get_all_properties()
-                for prop in self.detail_properties:
-                    if prop not in all_properties:
-                        raise ValueError(f"Property {prop} not defined in {self.model.__name__}")
-            elif type(self.detail_properties) != list:
-                raise TypeError("detail_properties must be a list or '__all__' or '__properties__'")
+        Returns:
+            HttpResponse: The response
+        """
+        if not self.get_rows_request():
+            self.set_original_target()
+        response = HttpResponse(content)
+        response['HX-Trigger'] = self.get_hx_trigger()
+        return self.finalize_response(response)
+
+    def cache_fragment(self, response):
+        """Store a rendered partial under the key from get_fragment_cache_key(), if any."""
+        fragment_cache_key = getattr(self, "fragment_cache_key", None)
+        if fragment_cache_key is not None:
+            get_cache().set(
+                fragment_cache_key, response.content, self.get_fragment_cache_timeout()
+            )
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        bump_model_version(self.model)
+        return response
+
+    def process_deletion(self, request, *args, **kwargs):
+        response = super().process_deletion(request, *args, **kwargs)
+        bump_model_version(self.model)
+        return response
 
-        # exclude detail_properties
-        if type(self.detail_properties_exclude) == list:
-            self.detail_properties = [prop for prop in self.detail_properties 
-                                  if prop not in self.detail_properties_exclude]
-        else:
-            raise TypeError("detail_properties_exclude must be a list")
-        
     def get_session_key(self):
         """
         Generate a unique session key for storing the original HTMX target.
@@ -404,15 +2533,54 @@ class NominopolitanMixin:
 
     def get_original_target(self):
         """
-        Retrieve the original HTMX target from the session.
+        Retrieve the original HTMX target of the list view.
 
         This method is called in get_context_data() to provide the original target
         in the context for templates.
 
+        With original_target_storage = 'header', an htmx list request for the
+        whole content partial is its own original target; every other request
+        gets it from the X-Original-Target header the list templates send.
+        With 'session' it is read from the session.
+
+        Returns:
+            str or None: The original HTMX target (eg '#content') or None if not set
+        """
+        if self.get_original_target_storage() == 'session':
+            return self.request.session.get(self.get_session_key(), None)
+
+        htmx = getattr(self.request, "htmx", None)
+        if (
+            htmx and htmx.target and self.role == Role.LIST
+            and not self.request.headers.get('X-Filter-Request')
+            and not self.get_rows_request()
+        ):
+            target = f"#{htmx.target}"
+        else:
+            target = self.request.headers.get('X-Original-Target')
+        # the header comes from the client and ends up in hx-target attributes
+        if target and ORIGINAL_TARGET_RE.fullmatch(target):
+            return target
+        return None
+
+    def set_original_target(self):
+        """
+        Store the current HTMX target in the session as the list's original target.
+
+        Only used with original_target_storage = 'session': in 'header' mode the
+        templates send the target back, so list requests never write the session.
+        """
+        if self.get_original_target_storage() == 'session':
+            self.request.session[self.get_session_key()] = f"#{self.request.htmx.target}"
+
+    def get_original_target_storage(self):
+        """
+        Get where the list's original htmx target is kept.
+
         Returns:
-            str or None: The original HTMX target or None if not set
+            str: 'header' or 'session'
         """
-        return self.request.session.get(self.get_session_key(), None)
+        return self.original_target_storage
 
     def get_use_htmx(self):
         """
@@ -542,7 +2710,7 @@ class NominopolitanMixin:
         return crispy_installed
 
     @staticmethod
-    def get_url(role, view_cls):
+    def get_url(role, view_cls, **initkwargs):
         """
         Generate a URL pattern for a specific role and view class.
 
@@ -551,33 +2719,135 @@ class NominopolitanMixin:
         Args:
             role (Role): The role for which to generate the URL.
             view_cls (class): The view class for which to generate the URL.
+            **initkwargs: Attributes of the view to override, passed to as_view()
 
         Returns:
             path: A Django URL pattern for the specified role and view class.
         """
         return path(
             role.url_pattern(view_cls),
-            view_cls.as_view(role=role),
+            view_cls.as_view(role=role, **initkwargs),
             name=f"{view_cls.url_base}-{role.url_name_component}",
         )
 
+    @staticmethod
+    def get_endpoint_url(name, pattern, handlers, view_cls, **initkwargs):
+        """
+        Generate a URL pattern for an additional (non-role) endpoint of a view class.
+
+        Args:
+            name (str): Endpoint name, used as the URL name component
+            pattern (str): URL pattern appended to the view's url_base
+            handlers (dict[str, str]): HTTP method names mapped to view method names
+            view_cls (class): The view class serving the endpoint.
+            **initkwargs: Attributes of the view to override, passed to as_endpoint_view()
+
+        Returns:
+            path: A Django URL pattern named "{url_base}-{name}".
+        """
+        return path(
+            f"{view_cls.url_base}/{pattern}",
+            view_cls.as_endpoint_view(handlers, **initkwargs),
+            name=f"{view_cls.url_base}-{name}",
+        )
+
+    @classmethod
+    def get_endpoints(cls):
+        """
+        Get the additional endpoints registered by get_urls() alongside the list role.
+
+        Override this to add endpoints, extending the list returned by super().
+
+        Returns:
+            list[tuple[str, str, dict[str, str]]]: (name, url pattern, handlers) for each endpoint
+        """
+        return [
+            ("autocomplete", "autocomplete/<str:field_name>/", {"get": "autocomplete"}),
+            ("export", "export/<str:export_format>/", {"get": "export"}),
+            ("bulk", "bulk/", {"post": "bulk"}),
+            ("bulk-value", "bulk/value/<str:field_name>/", {"get": "bulk_value"}),
+            ("import", "import/", {"get": "import_csv", "post": "import_csv"}),
+        ]
+
+    @classonlymethod
+    def as_endpoint_view(cls, handlers, role=Role.LIST, **initkwargs):
+        """
+        Create a view callable for an endpoint that is not one of neapolitan's roles.
+
+        The view is set up exactly as for the given role, but HTTP methods are
+        dispatched to the given handlers.
+
+        Args:
+            handlers (dict[str, str]): HTTP method names mapped to view method names
+            role (Role): Role the view instance is set up with (defaults to LIST)
+            **initkwargs: Attributes of the view to override, as for as_view()
+
+        Returns:
+            function: The view callable
+
+        Raises:
+            TypeError: If an initkwarg is not an attribute of the class, or is an HTTP method name
+        """
+        for key in initkwargs:
+            if key in cls.http_method_names or not hasattr(cls, key):
+                raise TypeError(
+                    f"{cls.__name__}.as_endpoint_view() received an invalid keyword {key!r}. "
+                    "It only accepts arguments that are already attributes of the class."
+                )
+
+        def view(request, *args, **kwargs):
+            self = cls(**{**role.extra_initkwargs(), **initkwargs})
+            self.role = role
+            self.setup(request, *args, **kwargs)
+            for method, action in handlers.items():
+                setattr(self, method, getattr(self, action))
+            return self.dispatch(request, *args, **kwargs)
+
+        view.view_class = cls
+        view.view_initkwargs = initkwargs
+        view.__doc__ = cls.__doc__
+        view.__module__ = cls.__module__
+        view.__dict__.update(cls.dispatch.__dict__)
+        return view
+
     @classonlymethod
-    def get_urls(cls, roles=None):
+    def as_view(cls, role, **initkwargs):
+        option = {
+            Role.LIST: initkwargs.get("fragment_cache_timeout", cls.fragment_cache_timeout),
+            Role.DETAIL: initkwargs.get("use_conditional_responses", cls.use_conditional_responses) or None,
+        }.get(role)
+        if option is not None:
+            # watch models from the start, so changes made in this process
+            # invalidate fragments cached and ETags issued by others
+            watch_models(cls.get_watched_models(role, **initkwargs))
+        return super().as_view(role=role, **initkwargs)
+
+    @classonlymethod
+    def get_urls(cls, roles=None, **initkwargs):
         """
         Generate a list of URL patterns for all roles or specified roles.
 
         This method is typically called from the urls.py file of a Django app to generate
-        URL patterns for all CRUD views associated with a model.
+        URL patterns for all CRUD views associated with a model. When the list role is
+        included, the endpoints from get_endpoints() are added as well.
 
         Args:
             roles (iterable, optional): An iterable of Role objects. If None, all roles are used.
+            **initkwargs: Attributes of the view to override for every role and endpoint
 
         Returns:
             list: A list of URL patterns for the specified roles.
         """
         if roles is None:
             roles = iter(Role)
-        return [NominopolitanMixin.get_url(role, cls) for role in roles]
+        roles = list(roles)
+        urls = [NominopolitanMixin.get_url(role, cls, **initkwargs) for role in roles]
+        if Role.LIST in roles:
+            urls += [
+                NominopolitanMixin.get_endpoint_url(name, pattern, handlers, cls, **initkwargs)
+                for name, pattern, handlers in cls.get_endpoints()
+            ]
+        return urls
 
     def reverse(self, role, view, object=None):
         """
@@ -656,6 +2926,28 @@ class NominopolitanMixin:
 
         return super().get_form_class()
 
+    def get_form(self, data=None, files=None, **kwargs):
+        """
+        Override of neapolitan's get_form to use autocomplete widgets for large ForeignKeys.
+
+        Returns:
+            Form: The form instance
+        """
+        form = super().get_form(data=data, files=files, **kwargs)
+        for name, field in form.fields.items():
+            if (
+                isinstance(field, forms.ModelChoiceField)
+                and not isinstance(field, forms.ModelMultipleChoiceField)
+                and self.get_use_autocomplete(name)
+            ):
+                url = self.get_autocomplete_url(name)
+                if url is not None:
+                    field.widget = AutocompleteSelect(
+                        url, field.queryset, field.to_field_name, attrs=field.widget.attrs
+                    )
+                    field.widget.is_required = field.required
+        return form
+
     def get_prefix(self):
         """
         Generate a prefix for URL names.
@@ -748,6 +3040,7 @@ class NominopolitanMixin:
         context["use_crispy"] = self.get_use_crispy()
         context["use_htmx"] = self.get_use_htmx()
         context['use_modal'] = self.get_use_modal()
+        context["pagination_mode"] = self.get_pagination_mode()
         context["original_target"] = self.get_original_target()
 
         # Set table styling parameters
@@ -760,18 +3053,51 @@ class NominopolitanMixin:
 
         # Add related fields information for list view
         if self.role == Role.LIST and hasattr(self, "object_list"):
-            context["related_fields"] = {
-                field.name: field.related_model._meta.verbose_name
-                for field in self.model._meta.fields
-                if field.is_relation
-            }
+            context["related_fields"] = self.view_spec.related_fields
+
+            # the current query string without the page, for numbered page links
+            page_url = self.get_page_url()
+            context["page_link_prefix"] = page_url if page_url == "?" else f"{page_url}&"
+
+            bulk_actions = self.get_bulk_actions()
+            if bulk_actions:
+                context["bulk_url"] = self.safe_reverse(f"{self.get_prefix()}-bulk")
+                context["bulk_delete"] = 'delete' in bulk_actions
+                context["bulk_update_fields"] = self.get_bulk_update_choices()
+                context["bulk_message"] = getattr(self, "bulk_message", None)
+                context["csrf_cookie_name"] = settings.CSRF_COOKIE_NAME
+
+            if self.get_search_fields():
+                context["search_kwarg"] = self.search_kwarg
+                context["search_query"] = self.get_search_query()
+
+            if self.get_use_import():
+                context["import_url"] = self.safe_reverse(f"{self.get_prefix()}-import")
+
+            context["export_links"] = [
+                (export_format, url)
+                for export_format in self.get_export_formats()
+                if (url := self.safe_reverse(
+                    f"{self.get_prefix()}-export", kwargs={"export_format": export_format}
+                ))
+            ]
+
+            if self.get_use_column_toggles():
+                hidden_columns = self.get_hidden_columns()
+                context["column_cookie_name"] = self.get_column_cookie_name()
+                context["column_toggles"] = [
+                    (column.name, column.header, column.name not in hidden_columns)
+                    for column in self.get_column_plan(
+                        self.view_spec.fields, self.view_spec.properties
+                    )
+                ]
 
         # Add related objects information for detail view
         if self.role == Role.DETAIL and hasattr(self, "object"):
             context["related_objects"] = {
-                field.name: str(getattr(self.object, field.name))
-                for field in self.model._meta.fields
-                if field.is_relation and getattr(self.object, field.name)
+                name: str(value)
+                for name in self.view_spec.relation_fields
+                if (value := getattr(self.object, name))
             }
 
         return context
@@ -830,9 +3156,18 @@ class NominopolitanMixin:
         template_names = self.get_template_names()
         template_name = template_names[0] if self.template_name else template_names[1]
 
+        if self.get_rows_request():
+            # the next batch of rows for infinite scrolling; the original target is unchanged
+            template_name = f"{self.templates_path}/partial/list.html#rows"
+            context.update(object_list_tag(context, self.object_list, self))
+            with self.timer.phase("render"):
+                response = render(request=self.request, template_name=template_name, context=context)
+            self.cache_fragment(response)
+            return self.finalize_response(response)
+
         if self.request.htmx:
             if self.role == Role.LIST:
-                self.request.session[self.get_session_key()] = f"#{self.request.htmx.target}"
+                self.set_original_target()
                 context["original_target"] = self.get_original_target()
                 context['table_font_size'] = f"{self.get_table_font_size()}rem"
                 context['table_max_col_width'] = f"{self.get_table_max_col_width()}ch"
@@ -842,14 +3177,301 @@ class NominopolitanMixin:
             else:
                 template_name=f"{template_name}#content"
 
-            response = render(
-                request=self.request,
-                template_name=f"{template_name}",
-                context=context,
-            )
+            with self.timer.phase("render"):
+                response = render(
+                    request=self.request,
+                    template_name=f"{template_name}",
+                    context=context,
+                )
             response['HX-Trigger'] = self.get_hx_trigger()
-            return response
+            self.cache_fragment(response)
+            return self.finalize_response(response)
         else:
-            return TemplateResponse(
+            return self.finalize_response(TemplateResponse(
                 request=self.request, template=template_name, context=context
-            )
+            ))
+
+
+async def _aiterate(iterator):
+    # pulls each item in a thread, as the sync iterator may query the database
+    done = object()
+    while (item := await sync_to_async(next)(iterator, done)) is not done:
+        yield item
+
+
+class AsyncNominopolitanMixin(NominopolitanMixin):
+    """
+    NominopolitanMixin with async handlers, for ASGI deployments.
+
+    Use it in place of NominopolitanMixin, with the same attributes. The list,
+    detail and delete handlers use Django's async ORM: a list's page query,
+    its count and the options of its filter form's choice fields are awaited
+    together with asyncio.gather(), and objects are loaded with aget() and
+    deleted with adelete().
+
+    Code that may query the database lazily runs in a thread with
+    sync_to_async(): building the list queryset (filter validation, search
+    index and table size checks, a get_queryset() using request.user) and
+    rendering templates. So do the handlers without an async version: forms,
+    autocomplete, export, bulk actions and import.
+    """
+
+    @classonlymethod
+    def as_view(cls, role, **initkwargs):
+        view = super().as_view(role=role, **initkwargs)
+        # dispatch() returns a coroutine
+        markcoroutinefunction(view)
+        return view
+
+    @classonlymethod
+    def as_endpoint_view(cls, handlers, role=Role.LIST, **initkwargs):
+        view = super().as_endpoint_view(handlers, role=role, **initkwargs)
+        markcoroutinefunction(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Dispatch to the handler for the request's method, running sync handlers in a thread.
+
+        Returns:
+            Coroutine: Awaits the handler's response
+        """
+        handler = self.http_method_not_allowed
+        if request.method.lower() in self.http_method_names:
+            handler = getattr(self, request.method.lower(), handler)
+        if not iscoroutinefunction(handler):
+            handler = sync_to_async(handler)
+        return handler(request, *args, **kwargs)
+
+    def get_paginator(self, queryset, page_size):
+        """
+        Override of get_paginator to give exact counts acount() and apage() as well.
+
+        Returns:
+            Paginator: A paginator for the count strategy
+        """
+        if self.get_count_strategy() == 'exact':
+            return AsyncPaginator(queryset, page_size)
+        return super().get_paginator(queryset, page_size)
+
+    async def list(self, request, *args, **kwargs):
+        """
+        Async version of list(), serving the fragment cache and coalescing as it does.
+
+        Returns:
+            HttpResponse: Rendered list view
+        """
+        self.timer = self.get_timer()
+        if not self.timer.enabled:
+            return await self.aget_list_response(request)
+
+        # database connections are per thread, so queries are counted on the
+        # connection of the thread sync_to_async() runs the request's queries in
+        alias = router.db_for_read(self.model)
+        counting = contextlib.ExitStack()
+        await sync_to_async(
+            lambda: counting.enter_context(self.timer.count_queries(connections[alias]))
+        )()
+        try:
+            response = await self.aget_list_response(request)
+            if isinstance(response, TemplateResponse) and not response.is_rendered:
+                with self.timer.phase("render"):
+                    await sync_to_async(response.render)()
+        finally:
+            await sync_to_async(counting.close)()
+        # receivers of phases_timed may query the database
+        await sync_to_async(self.report_timings)(response, self.timer.get_timings())
+        return response
+
+    async def aget_list_response(self, request):
+        """
+        Async version of get_list_response().
+
+        Returns:
+            HttpResponse: Rendered list view
+        """
+        # the model version stamps are read from the cache synchronously
+        self.fragment_cache_key = await sync_to_async(self.get_fragment_cache_key)()
+        if self.fragment_cache_key is not None:
+            content = await get_cache().aget(self.fragment_cache_key)
+            if content is not None:
+                return await sync_to_async(self.render_fragment)(content)
+
+        coalesce_key = await sync_to_async(self.get_coalesce_key)()
+        if coalesce_key is None:
+            return await self.arender_list()
+
+        response, shared = await async_list_requests.do(
+            coalesce_key, self.arender_list, self.coalesce_timeout
+        )
+        if not shared:
+            return response
+        if response.status_code != 200:
+            return await self.arender_list()
+        return await sync_to_async(self.render_fragment)(response.content)
+
+    async def arender_list(self):
+        """
+        Async version of render_list().
+
+        The rows (or page of rows, with its count) and the filter form's choices
+        are loaded concurrently before the list is rendered.
+
+        Returns:
+            HttpResponse: Rendered list view
+        """
+        self.hide_columns()
+        with self.timer.phase("queryset"):
+            queryset, filterset = await sync_to_async(self.get_list_queryset)()
+
+        paginate_by = self.get_paginate_by()
+        if paginate_by is None:
+            # the filter form's choices load at the same time, so are timed with the rows
+            with self.timer.phase("fetch"):
+                rows, _ = await asyncio.gather(afetch(queryset), self.aload_filter_choices(filterset))
+            if not self.allow_empty and not rows:
+                raise Http404
+            self.object_list = rows
+            page = None
+        else:
+            with self.timer.phase("paginate"):
+                page, _ = await asyncio.gather(
+                    self.apaginate_queryset(queryset, paginate_by),
+                    self.aload_filter_choices(filterset),
+                )
+            if not self.allow_empty and not page.object_list:
+                raise Http404
+            self.object_list = page.object_list
+
+        return await sync_to_async(self.render_list_page)(page, filterset)
+
+    async def apaginate_queryset(self, queryset, page_size):
+        """
+        Async version of paginate_queryset().
+
+        Paginators without apage() (eg from an overridden get_paginator) are
+        run in a thread.
+
+        Returns:
+            Page or KeysetPage: The requested page
+        """
+        if self.get_pagination_mode() in ('keyset', 'infinite'):
+            paginator = KeysetPaginator(queryset, page_size, self.get_keyset_ordering(queryset))
+            try:
+                page = await paginator.apage(self.request.GET.get(self.cursor_kwarg))
+            except InvalidPage as exc:
+                raise Http404(f"Invalid cursor: {exc}")
+            return self.link_keyset_page(page)
+
+        paginator = self.get_paginator(queryset, page_size)
+        page_number = (
+            self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg) or 1
+        )
+        try:
+            page_number = int(page_number)
+        except ValueError:
+            if page_number != "last":
+                raise Http404("Page is not 'last', nor can it be converted to an int.")
+            if hasattr(paginator, "acount"):
+                await paginator.acount()
+            page_number = await sync_to_async(getattr)(paginator, "num_pages")
+
+        try:
+            if hasattr(paginator, "apage"):
+                return await paginator.apage(page_number)
+            return await sync_to_async(paginator.page)(page_number)
+        except InvalidPage as exc:
+            raise Http404(f"Invalid page ({page_number}): {exc}")
+
+    async def aload_filter_choices(self, filterset):
+        """
+        Load the options of the filter form's related choice fields, concurrently.
+
+        Each field's widget is given its options as a list, so rendering the
+        form does not query them one field after another. Autocomplete
+        widgets, which only show the selected option, are left alone, as is
+        everything when the request does not render the filter form.
+
+        Args:
+            filterset (FilterSet | None): The list's filterset
+        """
+        if (
+            filterset is None
+            or self.request.headers.get('X-Filter-Request')
+            or self.get_rows_request()
+        ):
+            return
+        fields = [
+            field for field in filterset.form.fields.values()
+            if isinstance(field, forms.ModelChoiceField)
+            and not isinstance(field.widget, AutocompleteSelect)
+        ]
+        results = await asyncio.gather(*(afetch(field.queryset) for field in fields))
+        for field, objs in zip(fields, results):
+            iterator = field.iterator(field)
+            choices = [iterator.choice(obj) for obj in objs]
+            if field.empty_label is not None:
+                choices.insert(0, ("", field.empty_label))
+            field.widget.choices = choices
+
+    async def export(self, request, *args, **kwargs):
+        """
+        Async version of export(), streaming the export through an async iterator.
+
+        Django's ASGI handler reads a sync iterator to the end before sending
+        it; here each batch of lines is written in a thread as it is sent.
+
+        Returns:
+            StreamingHttpResponse: The export as an attachment
+        """
+        response = await sync_to_async(super().export)(request, *args, **kwargs)
+        response.streaming_content = _aiterate(iter(response.streaming_content))
+        return response
+
+    async def aget_object(self):
+        """
+        Async version of get_object(), loading the object with aget().
+
+        Returns:
+            Model: The object the view is displaying
+        """
+        # get_queryset() may use request.user, which is loaded synchronously
+        queryset, lookup = await sync_to_async(self.get_object_lookup)()
+        return await aget_object_or_404(queryset, **lookup)
+
+    def render_object(self):
+        return self.render_to_response(self.get_context_data())
+
+    async def detail(self, request, *args, **kwargs):
+        """
+        Async version of detail(), answering conditional htmx requests early as it does.
+
+        Returns:
+            HttpResponse: The rendered detail view, or a 304 response
+        """
+        conditional = request.htmx and self.get_use_conditional_responses()
+        if conditional:
+            self.etag = await sync_to_async(self.get_etag)()
+            if self.etag and (response := self.get_not_modified_response(etag=self.etag)):
+                return response
+
+        self.object = await self.aget_object()
+        if conditional:
+            last_modified = self.get_last_modified()
+            if last_modified and (
+                response := self.get_not_modified_response(last_modified=last_modified)
+            ):
+                return response
+        return await sync_to_async(self.render_object)()
+
+    async def confirm_delete(self, request, *args, **kwargs):
+        """Async GET handler for the delete confirmation view."""
+        self.object = await self.aget_object()
+        return await sync_to_async(self.render_object)()
+
+    async def process_deletion(self, request, *args, **kwargs):
+        """Async POST handler for the delete confirmation view."""
+        self.object = await self.aget_object()
+        await self.object.adelete()
+        await sync_to_async(bump_model_version)(self.model)
+        return HttpResponseRedirect(self.get_success_url())
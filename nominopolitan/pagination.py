@@ -0,0 +1,593 @@
+"""
+This module provides pagination helpers for nominopolitan list views.
+
+Key Components:
+- KeysetPaginator: Seek (cursor) pagination on a queryset's ordering plus pk
+- KeysetPage: A page of results produced by KeysetPaginator
+- CachedCountPaginator: Paginator whose count is cached for a TTL
+- EstimatedCountPaginator: Paginator using planner estimates or a capped count
+- UncountedPaginator: Paginator that never counts, only knowing if there is a next page
+- AsyncPaginator: Paginator with an exact count and the async acount() / apage()
+- afetch: Load a queryset's rows with the async ORM
+"""
+
+import asyncio
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Sequence
+
+from asgiref.sync import sync_to_async
+from django.core import signing
+from django.core.paginator import EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+
+CURSOR_SALT = "nominopolitan.pagination.cursor"
+
+
+async def afetch(queryset, chunk_size=2000):
+    """
+    Load the rows of a queryset (or list) with QuerySet.aiterator().
+
+    Args:
+        queryset: The queryset, eg a page slice
+        chunk_size (int): Rows fetched per batch, as for aiterator()
+
+    Returns:
+        list: The rows
+    """
+    if not hasattr(queryset, "aiterator"):
+        return list(queryset)
+    return [obj async for obj in queryset.aiterator(chunk_size=chunk_size)]
+
+
+def sort_key_is_nullable(model, key):
+    """
+    Determine whether a sort key may be NULL for some rows of a model.
+
+    Keys through a nullable relation may be NULL, and so may unknown paths
+    (eg annotations).
+
+    Args:
+        model: The model class
+        key (str): An order_by key, eg 'title' or '-author__birth_date'
+
+    Returns:
+        bool: True unless every field along the path is NOT NULL
+    """
+    for name in key.lstrip("-").split("__"):
+        try:
+            field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return True
+        if field.null:
+            return True
+        model = field.related_model
+        if model is None:
+            break
+    return False
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+# Cursor values which JSON has no type for are encoded as {tag: string}, so
+# they are decoded to the same type and value (DjangoJSONEncoder would drop
+# the microseconds of datetimes and decode everything to strings).
+CURSOR_TYPES = {
+    "dt": (datetime.datetime, datetime.datetime.isoformat, datetime.datetime.fromisoformat),
+    "d": (datetime.date, datetime.date.isoformat, datetime.date.fromisoformat),
+    "t": (datetime.time, datetime.time.isoformat, datetime.time.fromisoformat),
+    "td": (datetime.timedelta, lambda value: str(value // datetime.timedelta(microseconds=1)),
+           lambda value: datetime.timedelta(microseconds=int(value))),
+    "dec": (decimal.Decimal, str, decimal.Decimal),
+    "uuid": (uuid.UUID, str, uuid.UUID),
+}
+
+
+class CursorEncoder(json.JSONEncoder):
+    def default(self, o):
+        # datetime is a date subclass, so it has to be looked up before date
+        for tag, (type_, encode, _) in CURSOR_TYPES.items():
+            if isinstance(o, type_):
+                return {tag: encode(o)}
+        return super().default(o)
+
+
+def decode_cursor_value(obj):
+    if len(obj) == 1:
+        tag, value = next(iter(obj.items()))
+        if tag in CURSOR_TYPES and isinstance(value, str):
+            return CURSOR_TYPES[tag][2](value)
+    return obj
+
+
+class CursorSerializer:
+    """Serializer for cursor tokens which keeps dates, times, decimals and UUIDs exact."""
+
+    def dumps(self, obj):
+        return json.dumps(obj, cls=CursorEncoder, separators=(",", ":")).encode("latin-1")
+
+    def loads(self, data):
+        return json.loads(data.decode("latin-1"), object_hook=decode_cursor_value)
+
+
+class KeysetPage(Sequence):
+    """
+    A page of results from KeysetPaginator.
+
+    Behaves like django.core.paginator.Page for the purposes of templates,
+    except that it has no page number or total count.
+
+    Attributes:
+        object_list (list): The objects on this page
+        paginator (KeysetPaginator): The paginator that produced the page
+        next_cursor (str | None): Cursor token for the following page
+        previous_cursor (str | None): Cursor token for the preceding page
+        next_url (str | None): Set by the view: query string for the following page
+        previous_url (str | None): Set by the view: query string for the preceding page
+    """
+
+    number = None
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.next_url = None
+        self.previous_url = None
+
+    def __repr__(self):
+        return "<Keyset page of %s objects>" % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by seeking past the last row seen rather than using OFFSET.
+
+    Each page is fetched with a WHERE clause on the ordering keys of the row at
+    the cursor, so the cost of a page does not depend on how deep it is. The
+    ordering must be made up of field paths (eg ['-published_date', 'pk']) and
+    must end in a unique key.
+
+    NULLs of nullable keys sort as greater than every value (last when
+    ascending, first when descending, as PostgreSQL does by default) on every
+    database, and the seek condition matches them with IS NULL.
+
+    Args:
+        queryset: The queryset to paginate
+        per_page (int): Number of rows per page
+        ordering (list[str]): Ordering keys, ending in a unique key such as 'pk'
+    """
+
+    def __init__(self, queryset, per_page, ordering):
+        self.per_page = int(per_page)
+        self.ordering = list(ordering)
+        self.keys = [
+            (key.lstrip("-"), key.startswith("-")) for key in self.ordering
+        ]
+        self.nullable = [sort_key_is_nullable(queryset.model, path) for path, _ in self.keys]
+        self.queryset = queryset.order_by(*[
+            (F(path).desc(nulls_first=True) if descending else F(path).asc(nulls_last=True))
+            if nullable else (f"-{path}" if descending else path)
+            for (path, descending), nullable in zip(self.keys, self.nullable)
+        ])
+
+    def _get_value(self, obj, path):
+        for part in path.split("__"):
+            obj = getattr(obj, part)
+            if obj is None:
+                break
+        return obj
+
+    def encode_cursor(self, obj, forward=True):
+        """
+        Encode a cursor token pointing just after (or before) an object.
+
+        Args:
+            obj: The object at the edge of the current page
+            forward (bool): True for the following page, False for the preceding page
+
+        Returns:
+            str: A signed, URL safe cursor token
+        """
+        values = [self._get_value(obj, path) for path, _ in self.keys]
+        return signing.dumps(
+            {"v": values, "f": forward},
+            salt=CURSOR_SALT,
+            serializer=CursorSerializer,
+            compress=True,
+        )
+
+    def decode_cursor(self, cursor):
+        """
+        Decode a cursor token.
+
+        Args:
+            cursor (str): A token from encode_cursor()
+
+        Returns:
+            tuple: (list of ordering key values, True if paging forward)
+
+        Raises:
+            InvalidCursor: If the token is invalid or does not match the ordering
+        """
+        try:
+            data = signing.loads(cursor, salt=CURSOR_SALT, serializer=CursorSerializer)
+            values, forward = data["v"], data["f"]
+        except (signing.BadSignature, KeyError, TypeError, ValueError, decimal.InvalidOperation):
+            raise InvalidCursor("Invalid cursor")
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise InvalidCursor("Cursor does not match the ordering")
+        return values, bool(forward)
+
+    def get_seek_condition(self, values, forward=True):
+        """
+        Build the WHERE condition selecting rows after (or before) the cursor values.
+
+        For keys (a, b) this is: a > x OR (a = x AND b > y), with the comparisons
+        flipped for descending keys and for paging backwards. NULL is greater than
+        every value, so a > x also matches a IS NULL, a > NULL matches nothing,
+        a < NULL matches a IS NOT NULL, and a = NULL is a IS NULL.
+
+        Args:
+            values (list): Ordering key values at the cursor
+            forward (bool): True to select following rows, False for preceding rows
+
+        Returns:
+            Q: The seek condition
+        """
+        condition = Q()
+        equal = Q()
+        for (path, descending), nullable, value in zip(self.keys, self.nullable, values):
+            greater = forward != descending
+            if value is None:
+                beyond = None if greater else Q(**{f"{path}__isnull": False})
+            else:
+                beyond = Q(**{f"{path}__{'gt' if greater else 'lt'}": value})
+                if greater and nullable:
+                    beyond |= Q(**{f"{path}__isnull": True})
+            if beyond is not None:
+                condition |= equal & beyond
+            equal &= Q(**{f"{path}__isnull": True}) if value is None else Q(**{path: value})
+        return condition
+
+    def get_page_queryset(self, cursor=None):
+        """
+        Build the query for the page following (or preceding) the cursor.
+
+        Returns:
+            tuple: (QuerySet of up to per_page + 1 rows, True if paging forward)
+        """
+        queryset = self.queryset
+        forward = True
+        if cursor:
+            values, forward = self.decode_cursor(cursor)
+            queryset = queryset.filter(self.get_seek_condition(values, forward))
+        if not forward:
+            queryset = queryset.reverse()
+        # fetch one extra row to know whether there is another page
+        return queryset[:self.per_page + 1], forward
+
+    def page(self, cursor=None):
+        """
+        Return the page following (or preceding) the cursor.
+
+        Args:
+            cursor (str | None): Cursor token, or None for the first page
+
+        Returns:
+            KeysetPage: The requested page
+        """
+        queryset, forward = self.get_page_queryset(cursor)
+        return self.make_page(list(queryset), cursor, forward)
+
+    async def apage(self, cursor=None):
+        """Async version of page(), loading the rows with the async ORM."""
+        queryset, forward = self.get_page_queryset(cursor)
+        return self.make_page(await afetch(queryset, self.per_page + 1), cursor, forward)
+
+    def make_page(self, rows, cursor, forward):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not forward:
+            rows.reverse()
+
+        if forward:
+            has_next, has_previous = has_more, bool(cursor)
+        else:
+            has_next, has_previous = True, has_more
+
+        return KeysetPage(
+            rows,
+            self,
+            next_cursor=self.encode_cursor(rows[-1], True) if has_next and rows else None,
+            previous_cursor=self.encode_cursor(rows[0], False) if has_previous and rows else None,
+        )
+
+
+class AsyncPaginatorMixin:
+    """
+    Adds acount() and apage() to a Paginator of a queryset, for async views.
+
+    apage() runs the count and the page query concurrently: the page is fetched
+    on the assumption that its number is in range, which the count then checks.
+    """
+
+    count_is_estimate = False
+
+    async def acount(self):
+        """Async version of count."""
+        if "count" not in self.__dict__:
+            if hasattr(self.object_list, "acount"):
+                self.__dict__["count"] = await self.object_list.acount()
+            else:
+                self.__dict__["count"] = len(self.object_list)
+        return self.count
+
+    async def apage(self, number):
+        """Async version of page()."""
+        try:
+            guess = max(int(number), 1)
+        except (TypeError, ValueError):
+            guess = 1
+        bottom = (guess - 1) * self.per_page
+        # one row more than the page, to know if there is a next page when the count is an estimate
+        limit = self.per_page + max(self.orphans, 1)
+        _, rows = await asyncio.gather(
+            self.acount(), afetch(self.object_list[bottom:bottom + limit], limit)
+        )
+
+        number = self.validate_number(number)
+        if self.count_is_estimate:
+            if not rows and number > 1:
+                raise EmptyPage(self.error_messages["no_results"])
+            has_next = len(rows) > self.per_page
+            self.num_pages = max(self.num_pages, number + 1 if has_next else number)
+            return UncountedPage(rows[:self.per_page], number, self, has_next)
+
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        return self._get_page(rows[:top - bottom], number, self)
+
+
+class AsyncPaginator(AsyncPaginatorMixin, Paginator):
+    """Django's Paginator, with an exact count, plus acount() and apage()."""
+
+
+class CachedCountPaginator(AsyncPaginatorMixin, Paginator):
+    """
+    Paginator whose count is stored in a cache for a limited time.
+
+    Args:
+        object_list: The queryset to paginate
+        per_page (int): Number of rows per page
+        cache: The cache backend to use
+        cache_key (str): Key identifying this (filtered) queryset
+        timeout (int): Seconds to keep the count
+    """
+
+    count_strategy = "cached"
+    count_is_estimate = False
+
+    def __init__(self, object_list, per_page, cache, cache_key, timeout=60, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache = cache
+        self.cache_key = cache_key
+        self.timeout = timeout
+
+    @cached_property
+    def count(self):
+        count = self.cache.get(self.cache_key)
+        if count is None:
+            count = super().count
+            self.cache.set(self.cache_key, count, self.timeout)
+        return count
+
+    async def acount(self):
+        if "count" not in self.__dict__:
+            count = await self.cache.aget(self.cache_key)
+            if count is None:
+                count = await super().acount()
+                await self.cache.aset(self.cache_key, count, self.timeout)
+            self.__dict__["count"] = count
+        return self.count
+
+
+class EstimatedCountPaginator(AsyncPaginatorMixin, Paginator):
+    """
+    Paginator that avoids exact counts of large querysets.
+
+    Results of up to `cap` rows are counted exactly, with a count that stops
+    scanning at cap + 1 rows. Beyond that the database planner's estimate is used
+    where available (PostgreSQL), otherwise cap + 1; `count_is_estimate` is then
+    True, pages past the estimated last page are still served as long as they
+    have rows, and each page looks one row ahead to know whether there is a
+    next one.
+
+    Args:
+        object_list: The queryset to paginate
+        per_page (int): Number of rows per page
+        cap (int): Largest result size that is counted exactly
+    """
+
+    count_strategy = "estimated"
+
+    def __init__(self, object_list, per_page, cap=10000, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cap = cap
+        self.count_is_estimate = False
+
+    def get_planner_estimate(self):
+        """
+        Get the planner's row estimate for the queryset.
+
+        Returns:
+            int or None: The estimated number of rows, or None if not available
+        """
+        queryset = self.object_list
+        if not hasattr(queryset, "query"):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, "query"):
+            return len(self.object_list)
+
+        # a bounded count: never scans more than cap + 1 rows
+        count = self.object_list[:self.cap + 1].count()
+        if count <= self.cap:
+            return count
+
+        self.count_is_estimate = True
+        return max(self.get_planner_estimate() or 0, count)
+
+    async def acount(self):
+        if "count" not in self.__dict__:
+            if not hasattr(self.object_list, "query"):
+                count = len(self.object_list)
+            else:
+                count = await self.object_list[:self.cap + 1].acount()
+                if count > self.cap:
+                    self.count_is_estimate = True
+                    # there is no async cursor for the EXPLAIN
+                    count = max(await sync_to_async(self.get_planner_estimate)() or 0, count)
+            self.__dict__["count"] = count
+        return self.count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # the real last page may be beyond the estimated one
+            if self.count_is_estimate and int(number) > 1:
+                return int(number)
+            raise
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        # the estimate can be off, so look one row ahead for the next page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            # past the real last page
+            raise EmptyPage(self.error_messages["no_results"])
+        has_next = len(rows) > self.per_page
+        self.num_pages = max(self.num_pages, number + 1 if has_next else number)
+        return UncountedPage(rows[:self.per_page], number, self, has_next)
+
+
+class UncountedPage(Page):
+    """A page from UncountedPaginator, which knows whether it has a next page but not the total."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1 if self.object_list else 0
+
+
+class UncountedPaginator(Paginator):
+    """
+    Paginator that never counts the queryset.
+
+    Each page fetches per_page + 1 rows to learn whether there is a next page.
+    `count` is None and `num_pages` only covers the pages known so far (up to the
+    page after the current one), so page ranges show Previous/Next navigation
+    without a last page.
+    """
+
+    count_strategy = "none"
+    count_is_estimate = False
+    count = None
+
+    def __init__(self, object_list, per_page, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.known_pages = 1
+
+    @property
+    def num_pages(self):
+        return self.known_pages
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def get_page_rows(self, number):
+        bottom = (number - 1) * self.per_page
+        # fetch one extra row to know whether there is another page
+        return self.object_list[bottom:bottom + self.per_page + 1]
+
+    def page(self, number):
+        number = self.validate_number(number)
+        return self.make_page(number, list(self.get_page_rows(number)))
+
+    async def apage(self, number):
+        """Async version of page(), loading the rows with the async ORM."""
+        number = self.validate_number(number)
+        return self.make_page(number, await afetch(self.get_page_rows(number), self.per_page + 1))
+
+    async def acount(self):
+        return None
+
+    def make_page(self, number, rows):
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        has_next = len(rows) > self.per_page
+        self.known_pages = number + 1 if has_next else number
+        return UncountedPage(rows[:self.per_page], number, self, has_next)
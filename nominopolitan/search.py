@@ -0,0 +1,271 @@
+"""
+This module provides the full-text search behind the list view's search box.
+
+A search uses the database's full-text facility when the model has a search
+index for its search fields, built by the nm_search_index management command:
+
+- PostgreSQL: SearchVector / SearchQuery, backed by a GIN expression index
+- SQLite: an FTS5 table over the model's table, kept in sync by triggers
+
+Search fields across relations (eg 'author__name') cannot be indexed and are
+matched with icontains, as is everything when there is no index.
+
+Key Components:
+- search_queryset: Filter a queryset by a search query
+- build_search_index: Create (or refresh) a model's search index
+- drop_search_index: Remove a model's search indexes
+"""
+
+import re
+import time
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import NotSupportedError, connections, models
+from django.db.backends.utils import names_digest
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+# how long a check for a model's search index is trusted
+INDEX_RECHECK_SECONDS = 300
+
+# (checked_at, index exists) keyed by index name and database alias
+_index_checks: dict[tuple[str, str], tuple[float, bool]] = {}
+
+
+def split_search_fields(model, search_fields):
+    """
+    Separate the model's own text columns from the other search fields.
+
+    Args:
+        model: The model class
+        search_fields (list[str]): Field names and relation paths
+
+    Returns:
+        tuple[list[Field], list[str]]: The indexable fields, and the paths matched with icontains
+    """
+    columns, paths = [], []
+    for name in search_fields:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is not None and field.concrete and not field.is_relation:
+            columns.append(field)
+        else:
+            paths.append(name)
+    return columns, paths
+
+
+def get_index_prefix(model):
+    return f"{model._meta.db_table[:40]}_search"
+
+
+def get_index_name(model, columns):
+    """
+    Get the name of the search index over the given columns.
+
+    The name includes a digest of the columns, so changing a view's search
+    fields never uses an index built for different ones.
+    """
+    return f"{get_index_prefix(model)}_{names_digest(*[field.column for field in columns], length=8)}"
+
+
+def has_search_index(model, columns, using="default"):
+    """
+    Determine whether the search index over the given columns exists.
+
+    The result is cached for INDEX_RECHECK_SECONDS.
+
+    Args:
+        model: The model class
+        columns (list[Field]): The indexed fields
+        using (str): The database alias
+
+    Returns:
+        bool: True if the index exists
+    """
+    name = get_index_name(model, columns)
+    now = time.monotonic()
+    checked = _index_checks.get((name, using))
+    if checked is None or now - checked[0] > INDEX_RECHECK_SECONDS:
+        checked = _index_checks[(name, using)] = (now, name in _get_index_names(model, using))
+    return checked[1]
+
+
+def _get_index_names(model, using):
+    connection = connections[using]
+    prefix = get_index_prefix(model)
+    if connection.vendor == "sqlite":
+        names = connection.introspection.table_names()
+    elif connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            names = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    else:
+        return set()
+    # skips the shadow tables of SQLite's FTS5 tables
+    pattern = re.compile(rf"{re.escape(prefix)}_[0-9a-f]{{8}}")
+    return {name for name in names if pattern.fullmatch(name)}
+
+
+def _fts5_match(terms):
+    # each term is quoted as an FTS5 string (so no term is read as syntax) and prefix matched
+    return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def search_queryset(queryset, search_fields, query, config="english"):
+    """
+    Filter a queryset to the rows matching a search query.
+
+    Every term of the query must match one of the search fields. With a search
+    index, a term matches the model's own columns by the database's full-text
+    search, and relation paths by icontains; without one, every field is
+    matched with icontains.
+
+    Args:
+        queryset: The queryset to filter
+        search_fields (list[str]): Field names and relation paths to search
+        query (str): The user's search text
+        config (str): PostgreSQL text search configuration of the index
+
+    Returns:
+        QuerySet: The filtered queryset
+    """
+    terms = query.split()
+    if not terms or not search_fields:
+        return queryset
+
+    model = queryset.model
+    using = queryset.db
+    columns, paths = split_search_fields(model, search_fields)
+    match = None
+
+    if columns and has_search_index(model, columns, using):
+        connection = connections[using]
+        if connection.vendor == "sqlite":
+            table = connection.ops.quote_name(get_index_name(model, columns))
+
+            def match(terms):
+                return Q(pk__in=RawSQL(
+                    f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [_fts5_match(terms)]
+                ))
+        else:
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+
+            queryset = queryset.alias(
+                nominopolitan_search=SearchVector(*[field.name for field in columns], config=config)
+            )
+
+            def match(terms):
+                return Q(nominopolitan_search=SearchQuery(
+                    " ".join(terms), config=config, search_type="websearch"
+                ))
+    else:
+        paths = list(search_fields)
+
+    if not paths:
+        # one full-text query for all the terms
+        return queryset.filter(match(terms))
+
+    condition = Q()
+    for term in terms:
+        term_condition = match([term]) if match is not None else Q()
+        for path in paths:
+            term_condition |= Q(**{f"{path}__icontains": term})
+        condition &= term_condition
+    return queryset.filter(condition)
+
+
+def build_search_index(model, search_fields, config="english", using="default"):
+    """
+    Create the search index for a model's search fields, or refresh it if it exists.
+
+    Search indexes for other sets of fields are dropped first. On SQLite the
+    FTS5 table is rebuilt from the model's table; PostgreSQL maintains its GIN
+    index itself.
+
+    Args:
+        model: The model class
+        search_fields (list[str]): Field names and relation paths to search
+        config (str): PostgreSQL text search configuration
+        using (str): The database alias
+
+    Returns:
+        str | None: The name of the index, or None if no search field can be indexed
+
+    Raises:
+        NotSupportedError: If the database has no supported full-text search
+    """
+    connection = connections[using]
+    columns, _ = split_search_fields(model, search_fields)
+    if not columns:
+        return None
+
+    name = get_index_name(model, columns)
+    existing = _get_index_names(model, using)
+    drop_search_index(model, using, keep=name)
+
+    if connection.vendor == "sqlite":
+        if not isinstance(model._meta.pk, models.IntegerField):
+            raise NotSupportedError(f"{model._meta.label} needs an integer primary key for an FTS5 index")
+        with connection.cursor() as cursor:
+            if name not in existing:
+                for statement in _fts5_statements(model, columns, name, connection):
+                    cursor.execute(statement)
+            cursor.execute(f"INSERT INTO {connection.ops.quote_name(name)}({connection.ops.quote_name(name)}) VALUES ('rebuild')")
+    elif connection.vendor == "postgresql":
+        if name not in existing:
+            from django.contrib.postgres.indexes import GinIndex
+            from django.contrib.postgres.search import SearchVector
+
+            index = GinIndex(SearchVector(*[field.name for field in columns], config=config), name=name)
+            with connection.schema_editor() as editor:
+                editor.add_index(model, index)
+    else:
+        raise NotSupportedError(f"Full-text search is not supported on {connection.vendor}")
+
+    _index_checks.pop((name, using), None)
+    return name
+
+
+def _fts5_statements(model, columns, name, connection):
+    qn = connection.ops.quote_name
+    table, pk = qn(model._meta.db_table), qn(model._meta.pk.column)
+    fts = qn(name)
+    names = ", ".join(qn(field.column) for field in columns)
+    new = ", ".join(f"new.{qn(field.column)}" for field in columns)
+    old = ", ".join(f"old.{qn(field.column)}" for field in columns)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.{pk}, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.{pk}, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{model._meta.db_table}', content_rowid='{model._meta.pk.column}')",
+        f"CREATE TRIGGER {qn(name + '_ai')} AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {qn(name + '_ad')} AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER {qn(name + '_au')} AFTER UPDATE ON {table} BEGIN {delete} {insert} END",
+    ]
+
+
+def drop_search_index(model, using="default", keep=None):
+    """
+    Remove a model's search indexes.
+
+    Args:
+        model: The model class
+        using (str): The database alias
+        keep (str | None): The name of an index to leave in place
+
+    Returns:
+        list[str]: The names of the indexes dropped
+    """
+    connection = connections[using]
+    dropped = [name for name in _get_index_names(model, using) if name != keep]
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for name in dropped:
+            if connection.vendor == "sqlite":
+                for suffix in ("_ai", "_ad", "_au"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {qn(name + suffix)}")
+                cursor.execute(f"DROP TABLE IF EXISTS {qn(name)}")
+            else:
+                cursor.execute(f"DROP INDEX IF EXISTS {qn(name)}")
+            _index_checks.pop((name, using), None)
+    return dropped
@@ -6,16 +6,22 @@ and rendering object lists with customized formatting.
 
 Key components:
 - action_links: Generates HTML for action buttons (View, Edit, Delete, etc.)
+- compile_action_links: Builds the action buttons once per request as a per-row renderer
+- compile_rows_renderer: Renders the list's table rows without the template, with the same output
 - object_detail: Renders details of an object, including fields and properties
-- object_list: Creates a list view of objects with customized field display
+- object_list: Creates a list view of objects with customized field display and sortable headers
 - get_proper_elided_page_range: Generates a properly elided page range for pagination
 
 The module adapts to different CSS frameworks and supports HTMX and modal functionality.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 from django import template
+from django.utils.formats import localize
+from django.utils.html import conditional_escape
+from django.utils.http import RFC3986_SUBDELIMS
 from django.utils.safestring import mark_safe
 from django.core.exceptions import FieldDoesNotExist
 from django.conf import settings
@@ -26,16 +32,68 @@ log = logging.getLogger("nominopolitan")
 
 register = template.Library()
 
-def action_links(view: Any, object: Any) -> str:
+# Values substituted for the pk when reversing action URLs once per request.
+# One of these is accepted by each of Django's int, slug, str, path and uuid converters.
+PK_SENTINELS: Tuple[str, ...] = (
+    "2147483647000000",
+    "nominopolitanpk",
+    "4e4f4d49-4e4f-504f-4c49-54414e4e4d50",
+)
+PK_PLACEHOLDER: str = "\x00pk\x00"
+
+
+def _url_pk(object: Any) -> str:
+    """Quote an object's pk for use in a URL path, as reverse() quotes a path."""
+    return quote(str(object.pk), safe=RFC3986_SUBDELIMS + "/~:@")
+
+
+def _action_url(view: Any, url_name: str, object: Any, needs_pk: bool = True) -> Any:
     """
-    Generate HTML for action links (buttons) for a given object.
+    Reverse an action URL once, for use with every row.
 
     Args:
         view: The view instance
-        object: The object for which actions are being generated
+        url_name: The URL name to reverse
+        object: A representative object (the first row)
+        needs_pk: Whether the URL takes the object's pk
 
     Returns:
-        str: HTML string of action buttons
+        str with PK_PLACEHOLDER in place of the pk, None if the URL does not
+        exist, or a callable that reverses the URL for each row if no
+        sentinel value suits the URL's path converter
+    """
+    if not needs_pk:
+        return view.safe_reverse(url_name)
+    object_url = view.safe_reverse(url_name, kwargs={"pk": object.pk})
+    if object_url is None:
+        return None
+
+    for sentinel in PK_SENTINELS:
+        url = view.safe_reverse(url_name, kwargs={"pk": sentinel})
+        # a converter whose to_url() changes the pk cannot use the placeholder
+        if (
+            url is not None and url.count(sentinel) == 1
+            and url.replace(sentinel, _url_pk(object)) == object_url
+        ):
+            return url.replace(sentinel, PK_PLACEHOLDER)
+
+    return lambda obj: view.safe_reverse(url_name, kwargs={"pk": obj.pk})
+
+
+def compile_action_links(view: Any, object: Any) -> Callable[[Any], str]:
+    """
+    Compile the action links (buttons) for a list view into a per-row renderer.
+
+    Each URL is reversed once, using a sentinel in place of the pk, and the
+    HTML for the whole action bar is built once and split into static parts.
+    Rendering a row then only substitutes its pk.
+
+    Args:
+        view: The view instance
+        object: A representative object (the first row)
+
+    Returns:
+        Callable: Takes an object and returns the HTML string of action buttons
     """
     framework: str = getattr(settings, 'NOMINOPOLITAN_CSS_FRAMEWORK', 'bootstrap5')
     styles: Dict[str, Any] = view.get_framework_styles()[framework]
@@ -47,12 +105,12 @@ def action_links(view: Any, object: Any) -> str:
     default_target: str = view.get_htmx_target() # this will be prepended with a #
 
     # Standard actions with framework-specific button classes
-    actions: List[Tuple[str, str, str, str, bool, str]] = [
+    actions: List[Tuple[Any, str, str, str, bool, str]] = [
         (url, name, styles['actions'][name], default_target, False, styles["modal_attrs"])
         for url, name in [
-            (view.safe_reverse(f"{prefix}-detail", kwargs={"pk": object.pk}), "View"),
-            (view.safe_reverse(f"{prefix}-update", kwargs={"pk": object.pk}), "Edit"),
-            (view.safe_reverse(f"{prefix}-delete", kwargs={"pk": object.pk}), "Delete"),
+            (_action_url(view, f"{prefix}-detail", object), "View"),
+            (_action_url(view, f"{prefix}-update", object), "Edit"),
+            (_action_url(view, f"{prefix}-delete", object), "Delete"),
         ]
         if url is not None
     ]
@@ -60,9 +118,8 @@ def action_links(view: Any, object: Any) -> str:
     # Add extra actions if defined
     extra_actions: List[Dict[str, Any]] = getattr(view, "extra_actions", [])
     for action in extra_actions:
-        url: Optional[str] = view.safe_reverse(
-            action["url_name"],
-            kwargs={"pk": object.pk} if action.get("needs_pk", True) else None,
+        url: Any = _action_url(
+            view, action["url_name"], object, needs_pk=action.get("needs_pk", True)
         )
         if url is not None:
             htmx_target: str = action.get("htmx_target", default_target)
@@ -82,6 +139,14 @@ def action_links(view: Any, object: Any) -> str:
                 modal_attrs
             ))
 
+    # URLs that must be reversed per row are marked with their own placeholder
+    row_urls: Dict[str, Callable[[Any], str]] = {}
+    for index, action in enumerate(actions):
+        if callable(action[0]):
+            placeholder = f"\x00url{index}\x00"
+            row_urls[placeholder] = action[0]
+            actions[index] = (placeholder,) + action[1:]
+
     # set up links for all actions (regular and extra)
     # note for future - could simplify by just conditionally adding hx-disable if not use_htmx
     links: List[str] = [
@@ -97,8 +162,123 @@ def action_links(view: Any, object: Any) -> str:
         ]) +
         "</div>"
     ]
+    html: str = " ".join(links)
+
+    # split into static strings, with None marking the pk and callables for per-row URLs
+    parts: List[Any] = []
+    for index, chunk in enumerate(html.split(PK_PLACEHOLDER)):
+        if index:
+            parts.append(None)
+        for placeholder, reverse_url in row_urls.items():
+            if placeholder in chunk:
+                before, chunk = chunk.split(placeholder, 1)
+                parts.extend([before, reverse_url])
+                # a URL appears in both href and hx-get
+                while placeholder in chunk:
+                    before, chunk = chunk.split(placeholder, 1)
+                    parts.extend([before, reverse_url])
+        parts.append(chunk)
+
+    def render(obj: Any) -> str:
+        pk = _url_pk(obj)
+        return mark_safe("".join([
+            pk if part is None else part if part.__class__ is str else str(part(obj))
+            for part in parts
+        ]))
+
+    return render
+
+
+def action_links(view: Any, object: Any) -> str:
+    """
+    Generate HTML for action links (buttons) for a given object.
+
+    The links are compiled once per request (see compile_action_links) and
+    reused for every row.
+
+    Args:
+        view: The view instance
+        object: The object for which actions are being generated
+
+    Returns:
+        str: HTML string of action buttons
+    """
+    render = view.__dict__.get("_action_links_renderer")
+    if render is None:
+        render = view._action_links_renderer = compile_action_links(view, object)
+    return render(object)
+
+
+# The markup of the rows partial in bootstrap5/partial/list.html, split around its
+# values. compile_rows_renderer() must produce exactly what the template does.
+ROW_START = '\n                <tr class="text-center"'
+ROW_NEXT = (
+    ' hx-get="{}" hx-trigger="revealed"\n                    hx-target="this" hx-swap="afterend"'
+    ' hx-headers=\'{{"X-Rows-Request": "true"}}\''
+)
+ROW_OPEN = '>\n                    '
+ROW_BULK = (
+    '\n                    <td class="py-0 align-middle">'
+    '\n                        <input class="form-check-input" type="checkbox" name="bulk_pk" value="{}"'
+    '\n                            form="bulk-form" aria-label="Select row">'
+    '\n                    </td>\n                    '
+)
+ROW_FIELDS = '\n                    '
+CELL = (
+    '\n                    <td class="{} py-0 align-middle text-truncate table-column-width px-2"'
+    '\n                        data-bs-toggle="tooltip"'
+    '\n                        data-bs-title="{{value}}"'
+    '\n                        data-bs-placement="top"'
+    '\n                        data-bs-custom-class="custom-tooltip">'
+    '\n                        {{value}}'
+    '\n                    </td>\n                    '
+)
+ROW_END = (
+    '\n                    <td class="text-end py-1 align-middle">'
+    '\n                        {}'
+    '\n                    </td>\n                </tr>\n                '
+)
+
+
+def compile_rows_renderer(view: Any, bulk: bool) -> Callable[..., str]:
+    """
+    Compile the table rows of a list view into a renderer that bypasses the template.
 
-    return mark_safe(" ".join(links))
+    The output is the same as the rows partial of the bootstrap5 list template,
+    from format strings prepared once per request, with each value escaped
+    once and no per-cell template nodes.
+
+    Args:
+        view: The view instance
+        bulk (bool): Whether rows have a bulk selection checkbox
+
+    Returns:
+        Callable: Takes the objects (and the next_url of infinite pagination)
+            and returns the rows' HTML
+    """
+    renderers = [column.render for column in view.get_column_plan()]
+    cells = [CELL.format("fw-medium" if index == 0 else "") for index in range(len(renderers))]
+    columns = list(zip(renderers, cells))
+
+    def render(objects: Any, next_url: Optional[str] = None) -> str:
+        objects = list(objects)
+        links = view.timer.timed("actions", action_links)
+        html: List[str] = []
+        append = html.append
+        for index, obj in enumerate(objects, 1):
+            append(ROW_START)
+            if next_url and index == len(objects):
+                append(ROW_NEXT.format(conditional_escape(next_url)))
+            append(ROW_OPEN)
+            if bulk:
+                append(ROW_BULK.format(conditional_escape(localize(obj.pk))))
+            append(ROW_FIELDS)
+            for render_value, cell in columns:
+                append(cell.format(value=conditional_escape(render_value(obj))))
+            append(ROW_END.format(conditional_escape(links(view, obj))))
+        return mark_safe("".join(html))
+
+    return render
 
 
 @register.inclusion_tag(f"nominopolitan/{getattr(settings, 'NOMINOPOLITAN_CSS_FRAMEWORK', 'bootstrap')}/partial/detail.html")
@@ -134,6 +314,21 @@ def object_detail(object, view):
     }
 
 
+class SortableHeader(str):
+    """
+    A column header for the list template, carrying its sort link if the column is sortable.
+
+    Attributes:
+        sort_url (str | None): Query string sorting by this column
+        sort_direction (str | None): 'asc' or 'desc' if the list is sorted by this column
+        sort_position (int | None): Position among the sort columns, when sorted on several
+    """
+
+    sort_url = None
+    sort_direction = None
+    sort_position = None
+
+
 @register.inclusion_tag(
         f"nominopolitan/{getattr(settings, 'NOMINOPOLITAN_CSS_FRAMEWORK', 'bootstrap')}/partial/list.html", 
         takes_context=True
@@ -143,43 +338,68 @@ def object_list(context, objects, view):
     Override default to set value = str()
     instead of value_to_string(). This allows related fields
     to be displayed correctly (not just the id)
-    """
-    fields = view.fields
-    properties = getattr(view, "properties", []) or []
 
-    # Headers for fields - get the related model's verbose_name for relation fields
-    field_headers = []
-    for f in fields:
-        field_headers.append(f.replace('_', ' ').title())
+    Cell values are produced by the view's compiled column plan and each row
+    is emitted as an (object, values, actions) tuple, or with use_fast_rows
+    the rows are rendered to rows_html by compile_rows_renderer(). In
+    infinite pagination mode next_url is the URL of the next batch of rows,
+    requested when the last row is revealed.
 
-    # Headers for properties with proper capitalization
-    property_headers = [prop.replace("_", " ").title() for prop in properties]
-    headers = field_headers + property_headers
-
-    import locale
+    The rows' cell values and action links are timed as the "rows" and
+    "actions" phases of the view's timer.
+    """
+    timer = view.timer
+    plan = view.get_column_plan()
+    bulk = bool(view.get_bulk_actions())
+    page_obj = context.get("page_obj")
+    next_url = (
+        page_obj.next_url
+        if page_obj is not None and view.get_pagination_mode() == "infinite"
+        else None
+    )
 
-    object_list = [
-        {
-            "object": object,
-            "fields": [
+    if view.get_use_fast_rows():
+        object_list = []
+        with timer.phase("rows"):
+            rows_html = compile_rows_renderer(view, bulk)(objects, next_url)
+    else:
+        renderers = [column.render for column in plan]
+        links = timer.timed("actions", action_links)
+        with timer.phase("rows"):
+            object_list = [
                 (
-                    str(getattr(object, f).strftime('%d/%m/%Y'))
-                    if object._meta.get_field(f).get_internal_type() == 'DateField' and getattr(object, f) is not None
-                    else str(getattr(object, f))
-                    if object._meta.get_field(f).is_relation
-                    else object._meta.get_field(f).value_to_string(object)
+                    object,
+                    [render(object) for render in renderers],
+                    links(view, object),
                 )
-                for f in fields
+                for object in objects
             ]
-            + [str(getattr(object, prop)) for prop in properties],
-            "actions": action_links(view, object),
-        }
-        for object in objects
-    ]
+        rows_html = None
+
+    sortable = view.get_sortable_columns() if hasattr(view, "sort") else {}
+    positions = {
+        name: (position, descending)
+        for position, (name, descending) in enumerate(getattr(view, "sort", []), 1)
+    }
+    headers = []
+    for column in plan:
+        header = SortableHeader(column.header)
+        if column.name in sortable:
+            header.sort_url = view.get_sort_url(column.name)
+            if column.name in positions:
+                position, descending = positions[column.name]
+                header.sort_direction = "desc" if descending else "asc"
+                if len(positions) > 1:
+                    header.sort_position = position
+        headers.append(header)
 
     return {
         "headers": headers,
+        "use_htmx": view.get_use_htmx(),
+        "bulk": bulk,
         "object_list": object_list,
+        "rows_html": rows_html,
+        "next_url": next_url,
     }
 
 @register.simple_tag
@@ -187,6 +407,10 @@ def get_proper_elided_page_range(paginator, number, on_each_side=1, on_ends=1):
     """
     Return a list of page numbers with proper elision for pagination.
 
+    The range adapts to the view's count strategy: without a count ('none') it
+    runs up to the next page only, and when the count is an estimate the
+    pages at the end are replaced by an ellipsis.
+
     Args:
         paginator: The Django Paginator instance
         number: The current page number
@@ -198,10 +422,15 @@ def get_proper_elided_page_range(paginator, number, on_each_side=1, on_ends=1):
     """
     page_range = paginator.get_elided_page_range(
         number=number,
-        on_each_side=1,
-        on_ends=1
+        on_each_side=on_each_side,
+        on_ends=on_ends
     )
+    if getattr(paginator, "count_is_estimate", False):
+        page_range = [
+            page for page in page_range
+            if page == paginator.ELLIPSIS or page <= number + on_each_side
+        ]
+        while page_range and page_range[-1] == paginator.ELLIPSIS:
+            page_range.pop()
+        page_range.append(paginator.ELLIPSIS)
     return page_range
-
-
-
@@ -0,0 +1,104 @@
+import datetime
+import re
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from nominopolitan.mixins import TABLE_SIZE_RECHECK_SECONDS
+from nominopolitan.tests.test_templatetags import make_view
+from nominopolitan.widgets import AutocompleteSelect
+from sample.models import Author, Book
+from sample.views import AuthorCRUDView, BookCRUDView
+
+MODAL = {"HX-Request": "true", "HX-Target": "nominopolitanModalContent"}
+
+
+class AutocompleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [Author.objects.create(name=name) for name in ("Ann", "Anna", "Annette", "Bob")]
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        cls.book = Book(
+            title="One", author=cls.authors[1], published_date=datetime.date(2000, 1, 1), isbn="1", pages=1,
+        ).save()
+
+    def setUp(self):
+        patcher = mock.patch.object(BookCRUDView, "autocomplete_fields", ["author"])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def options(self, response):
+        self.assertEqual(response.status_code, 200)
+        return re.findall(r'data-value="(\d*)">([^<]*)<', response.content.decode())
+
+    def test_endpoint_pages_through_matches(self):
+        url = reverse("sample:book-autocomplete", kwargs={"field_name": "author"})
+        with mock.patch.object(BookCRUDView, "autocomplete_limit", 2):
+            response = self.client.get(url, {"q": "ann"})
+            self.assertEqual(self.options(response), [
+                ("", "---------"), (str(self.authors[0].pk), "Ann"), (str(self.authors[1].pk), "Anna"),
+            ])
+            next_url = re.search(r'hx-get="([^"]+)"', response.content.decode())[1].replace("&amp;", "&")
+            self.assertEqual(next_url, f"{url}?q=ann&page=2")
+            response = self.client.get(next_url)
+        # later pages are appended to the list, without the empty option
+        self.assertEqual(self.options(response), [(str(self.authors[2].pk), "Annette")])
+        self.assertNotContains(response, "More...")
+
+        self.assertEqual(self.options(self.client.get(url, {"q": "zed"})), [("", "---------")])
+        self.assertContains(self.client.get(url, {"q": "zed"}), "No matches")
+
+    def test_only_autocomplete_fields_are_served(self):
+        url = reverse("sample:book-autocomplete", kwargs={"field_name": "title"})
+        self.assertEqual(self.client.get(url).status_code, 404)
+        with mock.patch.object(BookCRUDView, "autocomplete_fields", []):
+            url = reverse("sample:book-autocomplete", kwargs={"field_name": "author"})
+            self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_form_renders_the_selected_label_without_the_choices(self):
+        with self.assertNumQueries(2):
+            # the book, then the label of its author
+            response = self.client.get(reverse("sample:book-update", args=[self.book.pk]), headers=MODAL)
+        html = response.content.decode()
+        self.assertRegex(html, rf'<input type="hidden" name="author" value="{self.authors[1].pk}"')
+        self.assertIn('value="Anna"', html)
+        self.assertNotIn("<option", html.split('name="author"')[1].split("</div>")[0])
+        self.assertNotIn("Annette", html)
+
+    def test_widget_label(self):
+        widget = AutocompleteSelect("/authors/", Author.objects.all())
+        self.assertEqual(widget.get_label(self.authors[0].pk), "Ann")
+        for value in (None, "", "abc", 0):
+            with self.subTest(value=value):
+                self.assertEqual(widget.get_label(value), "")
+
+
+class TableSizeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(3))
+
+    def setUp(self):
+        # sizes checked by earlier tests would be served from the class
+        for view_class in (AuthorCRUDView, BookCRUDView):
+            view_class.__dict__.get("_table_sizes", {}).clear()
+
+    def test_sizes_are_cached_per_view_class(self):
+        view = make_view(BookCRUDView, "/sample/book/")
+        with mock.patch("nominopolitan.mixins.time.monotonic", return_value=10_000):
+            with self.assertNumQueries(1):
+                self.assertTrue(view.table_exceeds(Author, 2))
+                self.assertTrue(view.table_exceeds(Author, 2))
+            Author.objects.all().delete()
+            with self.assertNumQueries(0):
+                self.assertTrue(make_view(BookCRUDView, "/sample/book/").table_exceeds(Author, 2))
+            # other view classes count for themselves
+            with self.assertNumQueries(1):
+                self.assertFalse(make_view(AuthorCRUDView, "/sample/author/").table_exceeds(Author, 2))
+        self.assertIn("_table_sizes", BookCRUDView.__dict__)
+
+        with mock.patch(
+            "nominopolitan.mixins.time.monotonic", return_value=10_001 + TABLE_SIZE_RECHECK_SECONDS
+        ), self.assertNumQueries(1):
+            self.assertFalse(view.table_exceeds(Author, 2))
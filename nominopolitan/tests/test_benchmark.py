@@ -0,0 +1,55 @@
+import json
+import logging
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from sample.models import Book
+from sample.views import BookCRUDView
+
+
+# the command's client requests localhost, which DEBUG = False does not allow by default
+@override_settings(ALLOWED_HOSTS=["localhost"])
+class BenchmarkCommandTests(TestCase):
+    def setUp(self):
+        # the command sets these for its own run
+        patcher = mock.patch.object(BookCRUDView, "paginate_by", BookCRUDView.paginate_by)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        logger = logging.getLogger("nominopolitan")
+        self.addCleanup(logger.setLevel, logger.level)
+
+    def test_report(self):
+        cache.set("site", "kept")
+        self.addCleanup(cache.delete, "site")
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "report.json"
+            call_command("benchmark", rows=[30], repeat=2, output=str(output), stdout=StringIO(), stderr=StringIO())
+            report = json.loads(output.read_text())
+
+        results = {result["scenario"]: result for result in report["results"]}
+        self.assertEqual({result["status"] for result in results.values()}, {200, 302})
+        self.assertEqual(results["book_list"]["rows"], 30)
+        self.assertGreater(results["book_list"]["queries"], 0)
+        # the timed requests of the cached scenario are served from the fragment cache
+        self.assertEqual(results["book_list_cached"]["queries"], 0)
+        self.assertGreater(results["book_list_cached"]["bytes"], 0)
+        self.assertEqual(report["meta"]["repeat"], 2)
+
+        # the command's cache is its own, and its rows are rolled back
+        self.assertEqual(cache.get("site"), "kept")
+        self.assertFalse(Book.objects.exists())
+        self.assertNotIn("fragment_cache_timeout", BookCRUDView.__dict__)
+
+    def test_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "report.json"
+            call_command("benchmark", rows=[20], repeat=1, output=str(output), stdout=StringIO(), stderr=StringIO())
+            stdout = StringIO()
+            call_command("benchmark", rows=[20], repeat=1, compare=str(output), stdout=stdout, stderr=StringIO())
+        self.assertRegex(stdout.getvalue(), r"book_list_cached .* \d+\.\d\dx")
@@ -0,0 +1,107 @@
+import datetime
+import re
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from sample.models import Author, Book
+
+FILTER = {"HX-Request": "true", "HX-Target": "filtered_results", "X-Filter-Request": "true"}
+
+
+class BulkActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [Author.objects.create(name=f"Author {i}") for i in range(2)]
+        for i in range(4):
+            # Book.save() takes no arguments, so objects.create() cannot be used
+            Book(
+                title=f"Book {i}", author=cls.authors[i % 2], published_date=datetime.date(2000, 1, 1),
+                isbn=f"{i:013d}", pages=i,
+            ).save()
+
+    def setUp(self):
+        self.bump = mock.patch("nominopolitan.mixins.bump_model_version").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def post(self, data, query=""):
+        return self.client.post(f"{reverse('sample:book-bulk')}{query}", data, headers=FILTER)
+
+    def pks(self, **filters):
+        return list(Book.objects.filter(**filters).order_by("pk").values_list("pk", flat=True))
+
+    def test_delete_selected(self):
+        pks = self.pks(pages__lt=2)
+        response = self.post({"bulk_action": "delete", "bulk_pk": pks})
+        self.assertContains(response, "Deleted 2 books")
+        self.assertEqual(self.pks(), self.pks(pages__gte=2))
+        self.bump.assert_called_once()
+
+    def test_delete_all_matching(self):
+        response = self.post({"bulk_action": "delete", "bulk_all": "1"}, f"?author={self.authors[0].pk}")
+        self.assertContains(response, "Deleted 2 books")
+        self.assertEqual(set(Book.objects.values_list("author", flat=True)), {self.authors[1].pk})
+
+    def test_update_selected(self):
+        pks = self.pks(pages__lt=3)
+        response = self.post({"bulk_action": "update:pages", "bulk_pk": pks, "bulk_value_pages": "500"})
+        self.assertContains(response, "Updated 3 books")
+        self.assertEqual(self.pks(pages=500), pks)
+        self.bump.assert_called_once()
+
+    def test_update_with_an_invalid_value(self):
+        pks = self.pks()
+        response = self.post({"bulk_action": "update:pages", "bulk_pk": pks, "bulk_value_pages": "many"})
+        self.assertContains(response, "Pages: Enter a whole number.")
+        self.assertEqual(sorted(Book.objects.values_list("pages", flat=True)), [0, 1, 2, 3])
+        self.bump.assert_not_called()
+
+    def test_nothing_selected(self):
+        response = self.post({"bulk_action": "delete"})
+        self.assertContains(response, "Deleted 0 books")
+        self.bump.assert_not_called()
+
+    def test_invalid_pk(self):
+        response = self.post({"bulk_action": "delete", "bulk_pk": [*self.pks(), "abc"]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Book.objects.count(), 4)
+        self.bump.assert_not_called()
+
+    def test_unknown_action_or_field(self):
+        self.assertEqual(self.post({"bulk_action": "archive"}).status_code, 404)
+        self.assertEqual(self.post({"bulk_action": "update:isbn", "bulk_value_isbn": "1"}).status_code, 404)
+
+    def test_value_inputs_are_loaded_when_chosen(self):
+        # rendering the list does not query the authors for the author <select>
+        response = self.client.get(reverse("sample:book-list"), headers=FILTER)
+        html = response.content.decode()
+        url = reverse("sample:book-bulk-value", kwargs={"field_name": "author"})
+        self.assertIn(f'hx-get="{url}"', html)
+        self.assertNotIn('name="bulk_value_author"', html)
+
+        html = self.client.get(url, headers=FILTER).content.decode()
+        self.assertIn('name="bulk_value_author"', html)
+        self.assertEqual(len(re.findall(r"<option value=\"\d+\"", html)), len(self.authors))
+        self.assertEqual(self.client.get(reverse("sample:book-bulk-value", kwargs={"field_name": "isbn"})).status_code, 404)
+
+    def test_csrf_token_is_kept_out_of_cached_partials(self):
+        self.client = self.client_class(enforce_csrf_checks=True)
+        self.client.force_login(User.objects.create_user("alice"))
+        page = self.client.get(reverse("sample:book-list")).content.decode()
+        token = re.search(r"window\.nominopolitanCsrfToken = '(\w+)'", page)[1]
+        partial = self.client.get(reverse("sample:book-list"), headers=FILTER).content.decode()
+        self.assertNotIn("nominopolitanCsrfToken =", partial)
+        self.assertNotIn("csrfmiddlewaretoken", partial)
+
+        data = {"bulk_action": "delete", "bulk_pk": self.pks(pages=0)}
+        self.assertEqual(self.post(data).status_code, 403)
+        response = self.client.post(reverse("sample:book-bulk"), data, headers={**FILTER, "X-CSRFToken": token})
+        self.assertContains(response, "Deleted 1 book")
+
+    def test_partials_do_not_set_the_csrf_cookie(self):
+        response = self.client.get(reverse("sample:book-list"), headers=FILTER)
+        self.assertNotIn("csrftoken", response.cookies)
+        response = self.client.get(reverse("sample:book-list"))
+        self.assertIn("csrftoken", response.cookies)
@@ -0,0 +1,169 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from neapolitan.views import CRUDView, Role
+
+from nominopolitan.coalesce import async_list_requests, list_requests
+from nominopolitan.mixins import AsyncNominopolitanMixin, NominopolitanMixin
+from sample.models import Author, Book
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+
+
+class OwnBookView(NominopolitanMixin, CRUDView):
+    model = Book
+    url_base = "ownbook"
+    fields = ["title", "author"]
+    use_htmx = True
+    fragment_cache_timeout = 60
+    use_conditional_responses = True
+
+    def get_queryset(self):
+        return Book.objects.filter(title__startswith=self.request.user.username)
+
+
+class CoalescedOwnBookView(OwnBookView):
+    url_base = "coalescedownbook"
+    fragment_cache_timeout = None
+    coalesce_requests = True
+
+
+class AsyncOwnBookView(AsyncNominopolitanMixin, CoalescedOwnBookView):
+    url_base = "asyncownbook"
+
+
+urlpatterns = OwnBookView.get_urls() + CoalescedOwnBookView.get_urls() + AsyncOwnBookView.get_urls()
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class FragmentCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Ann")
+        for i, title in enumerate(["alice's book", "bob's book"]):
+            # Book.save() takes no arguments, so objects.create() cannot be used
+            Book(
+                title=title, author=cls.author, published_date=datetime.date(2000, 1, 1),
+                isbn=f"{i:013d}", pages=100,
+            ).save()
+        cls.alice = User.objects.create_user("alice")
+        cls.bob = User.objects.create_user("bob")
+
+    def setUp(self):
+        cache.clear()
+
+    def get_list(self, user):
+        self.client.force_login(user)
+        return self.client.get(reverse("ownbook-list"), headers=HTMX).content.decode()
+
+    def test_users_get_their_own_fragments(self):
+        for _ in range(2):
+            alice, bob = self.get_list(self.alice), self.get_list(self.bob)
+            self.assertIn("alice&#x27;s book", alice)
+            self.assertNotIn("bob&#x27;s book", alice)
+            self.assertIn("bob&#x27;s book", bob)
+            self.assertNotIn("alice&#x27;s book", bob)
+
+    def test_etags_are_not_shared_between_users(self):
+        book = Book.objects.get(title="alice's book")
+        url = reverse("ownbook-detail", args=[book.pk])
+        self.client.force_login(self.alice)
+        etag = self.client.get(url, headers=HTMX)["ETag"]
+        self.assertEqual(self.client.get(url, headers={**HTMX, "If-None-Match": etag}).status_code, 304)
+        self.client.force_login(self.bob)
+        self.assertEqual(self.client.get(url, headers={**HTMX, "If-None-Match": etag}).status_code, 404)
+
+    def test_fragments_are_cached_until_a_displayed_model_changes(self):
+        self.assertIn("Ann", self.get_list(self.alice))
+        Author.objects.filter(pk=self.author.pk).update(name="Anne")
+        # update() sends no signal, so the cached fragment is still served
+        self.assertNotIn("Anne", self.get_list(self.alice))
+        self.author.name = "Annie"
+        self.author.save()
+        self.assertIn("Annie", self.get_list(self.alice))
+
+    def test_watched_models_are_found_without_creating_a_view(self):
+        self.assertEqual(OwnBookView.get_watched_models(Role.LIST), {Book, Author})
+        self.assertEqual(OwnBookView.get_watched_models(Role.LIST, fields=["title"]), {Book})
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class ConditionalResponseTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Ann")
+        cls.book = Book(
+            title="alice's book", author=cls.author, published_date=datetime.date(2000, 1, 1),
+            isbn="0000000000000", pages=100,
+        ).save()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(User.objects.create_user("alice"))
+
+    def assertRevalidated(self, url, change):
+        response = self.client.get(url, headers=HTMX)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        conditional = {**HTMX, "If-None-Match": etag}
+        self.assertEqual(self.client.get(url, headers=conditional).status_code, 304)
+        change()
+        response = self.client.get(url, headers=conditional)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        return response
+
+    def rename_author(self):
+        self.author.name = "Annie"
+        self.author.save()
+
+    def test_list_304_until_a_displayed_model_changes(self):
+        response = self.assertRevalidated(reverse("ownbook-list"), self.rename_author)
+        self.assertContains(response, "Annie")
+
+    def test_detail_304_until_a_displayed_model_changes(self):
+        response = self.assertRevalidated(reverse("ownbook-detail", args=[self.book.pk]), self.rename_author)
+        self.assertContains(response, "Annie")
+
+    def test_full_pages_are_not_conditional(self):
+        response = self.client.get(reverse("ownbook-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class CoalesceKeyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user("alice")
+        cls.bob = User.objects.create_user("bob")
+
+    def test_requests_are_only_coalesced_per_user(self):
+        keys = []
+        def do(key, fn, timeout=None):
+            keys.append(key)
+            return fn(), False
+
+        with mock.patch.object(list_requests, "do", side_effect=do):
+            for user in (self.alice, self.alice, self.bob):
+                self.client.force_login(user)
+                self.client.get(reverse("coalescedownbook-list"), headers=HTMX)
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+
+    async def test_async_requests_are_only_coalesced_per_user(self):
+        keys = []
+        async def do(key, fn, timeout=None):
+            keys.append(key)
+            return await fn(), False
+
+        with mock.patch.object(async_list_requests, "do", side_effect=do):
+            for user in (self.alice, self.alice, self.bob):
+                await self.async_client.aforce_login(user)
+                await self.async_client.get(reverse("asyncownbook-list"), headers=HTMX)
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
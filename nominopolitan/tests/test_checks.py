@@ -0,0 +1,77 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from neapolitan.views import CRUDView
+
+from nominopolitan.checks import check_view_configuration
+from nominopolitan.mixins import NominopolitanMixin
+from sample import forms
+from sample.models import Book
+
+
+def make_view(model=Book, **attrs):
+    return type(
+        "CheckedView",
+        (NominopolitanMixin, CRUDView),
+        {"model": model, "url_base": "checked", "fields": ["title", "author", "pages"], **attrs},
+    )
+
+
+class CheckIdTests(SimpleTestCase):
+    def check_ids(self, view_class):
+        with mock.patch("nominopolitan.checks.get_nominopolitan_views", return_value=[view_class]):
+            return [message.id for message in check_view_configuration(None)]
+
+    def test_valid_view(self):
+        self.assertEqual(self.check_ids(make_view(sortable_fields=["author"], pagination_mode="keyset")), [])
+
+    def test_each_misconfiguration_has_its_own_id(self):
+        cases = [
+            ({"fields": ["no_such_field"]}, "nominopolitan.E001"),
+            ({"pagination_mode": "pages"}, "nominopolitan.E002"),
+            ({"count_strategy": "guess"}, "nominopolitan.E003"),
+            ({"export_formats": ["xml"]}, "nominopolitan.E004"),
+            ({"sortable_fields": ["isbn"]}, "nominopolitan.E005"),
+            ({"search_fields": ["author"]}, "nominopolitan.E006"),
+            ({"original_target_storage": "cookie"}, "nominopolitan.E007"),
+            ({"property_annotations": {"pages": None}}, "nominopolitan.E008"),
+            ({"bulk_actions": ["archive"]}, "nominopolitan.E009"),
+            ({"use_import": True, "import_form_class": forms.AuthorForm}, "nominopolitan.E010"),
+            ({"properties": ["many_pages"], "sortable_fields": ["many_pages"]}, "nominopolitan.E011"),
+            ({"max_sort_columns": 0}, "nominopolitan.E012"),
+            ({"bulk_update_method": "upsert"}, "nominopolitan.E013"),
+            ({"bulk_update_fields": ["isbn_empty"]}, "nominopolitan.E014"),
+            ({"use_import": True, "import_batch_size": 0}, "nominopolitan.E015"),
+        ]
+        for attrs, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertEqual(self.check_ids(make_view(**attrs)), [expected])
+
+    def test_unindexed_sortable_column(self):
+        for threshold in (None, 1000):
+            with self.subTest(sort_index_threshold=threshold):
+                view_class = make_view(
+                    fields=["title", "description"], sortable_fields=["description"], sort_index_threshold=threshold
+                )
+                self.assertEqual(self.check_ids(view_class), ["nominopolitan.W001"])
+
+    def test_nullable_sort_key_in_keyset_pagination(self):
+        attrs = {"fields": ["title", "uneditable_field"], "sortable_fields": ["uneditable_field"]}
+        self.assertEqual(self.check_ids(make_view(**attrs)), ["nominopolitan.W001"])
+        for mode in ("keyset", "infinite"):
+            with self.subTest(pagination_mode=mode):
+                self.assertEqual(
+                    self.check_ids(make_view(pagination_mode=mode, **attrs)),
+                    ["nominopolitan.W001", "nominopolitan.W002"],
+                )
+
+    def test_fragment_cache_in_local_memory(self):
+        caches = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": "/tmp"},
+        }
+        for attrs in ({"fragment_cache_timeout": 60}, {"use_conditional_responses": True}):
+            with self.subTest(**attrs), override_settings(CACHES=caches):
+                self.assertEqual(self.check_ids(make_view(**attrs)), ["nominopolitan.W003"])
+                with override_settings(NOMINOPOLITAN_CACHE_ALIAS="shared"):
+                    self.assertEqual(self.check_ids(make_view(**attrs)), [])
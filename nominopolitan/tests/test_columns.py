@@ -0,0 +1,59 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from nominopolitan.mixins import annotation_attribute
+from nominopolitan.tests.test_templatetags import make_view
+from sample.models import Author, Book
+from sample.views import AuthorCRUDView, BookCRUDView
+
+
+class ColumnPlanTests(SimpleTestCase):
+    def test_columns_are_compiled_once_per_view_class(self):
+        view = make_view(BookCRUDView, "/sample/book/")
+        plan = view.get_column_plan()
+        self.assertEqual(
+            [column.name for column in plan], [*view.view_spec.fields, *view.view_spec.properties]
+        )
+        self.assertIs(view.get_column_plan()[0], plan[0])
+
+        # every combination of hidden columns reuses the same columns
+        by_name = {column.name: column for column in plan}
+        for hidden in (["title"], ["title", "pages"], ["many_pages"]):
+            with self.subTest(hidden=hidden):
+                fields = [name for name in view.view_spec.fields if name not in hidden]
+                properties = [name for name in view.view_spec.properties if name not in hidden]
+                subset = view.get_column_plan(fields, properties)
+                self.assertEqual([column.name for column in subset], [*fields, *properties])
+                self.assertTrue(all(column is by_name[column.name] for column in subset))
+        self.assertEqual(len(BookCRUDView._columns), len(plan))
+
+        make_view(AuthorCRUDView, "/sample/author/").get_column_plan()
+        self.assertNotIn(("field", "title"), AuthorCRUDView._columns)
+
+    def test_cells(self):
+        view = make_view(BookCRUDView, "/sample/book/")
+        author = Author(pk=1, name="Ann & Bob")
+        book = Book(
+            pk=2, title="One", author=author, published_date=datetime.date(2001, 2, 3), isbn="1", pages=100,
+            uneditable_field=None,
+        )
+        book.isbn_empty = False
+        setattr(book, annotation_attribute("many_pages"), True)
+        plan = {column.name: column for column in view.get_column_plan()}
+        self.assertEqual(plan["published_date"].header, "Published Date")
+        cells = {name: column.render(book) for name, column in plan.items()}
+        self.assertEqual(cells["title"], "One")
+        # relations render their __str__, and escaping is left to the template
+        self.assertEqual(cells["author"], "Ann & Bob")
+        self.assertEqual(cells["published_date"], "03/02/2001")
+        self.assertEqual(cells["pages"], "100")
+        self.assertEqual(cells["uneditable_field"], "None")
+        # annotated properties are read from the annotation rather than the property
+        self.assertEqual(cells["many_pages"], "True")
+        book.pages = 1
+        self.assertEqual(plan["many_pages"].render(book), "True")
+
+        view = make_view(AuthorCRUDView, "/sample/author/")
+        plan = {column.name: column for column in view.get_column_plan()}
+        self.assertEqual(plan["birth_date"].render(Author(name="Cy")), "")
@@ -0,0 +1,90 @@
+import csv
+import datetime
+import json
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from nominopolitan.export import write_csv
+from nominopolitan.mixins import Column
+from sample.models import Author, Book
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(
+            title="One", author=Author.objects.create(name="Ann"), published_date=datetime.date(2000, 1, 1),
+            isbn="1", pages=100, description="First",
+        ).save()
+        Book(
+            title='Two, "quoted"', author=Author.objects.create(name="Bob"), published_date=datetime.date(2001, 2, 3),
+            isbn="2", pages=5, description="Line one\nline two",
+        ).save()
+
+    def export(self, export_format="csv", query=""):
+        url = reverse("sample:book-export", kwargs={"export_format": export_format})
+        response = self.client.get(f"{url}{query}")
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv(self):
+        response = self.client.get(reverse("sample:book-export", kwargs={"export_format": "csv"}))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="books.csv"')
+        rows = list(csv.DictReader(b"".join(response.streaming_content).decode().splitlines(keepends=True)))
+        self.assertEqual(
+            [(row["Title"], row["Author"], row["Published Date"], row["Description"]) for row in rows],
+            [("One", "Ann", "01/01/2000", "First"), ('Two, "quoted"', "Bob", "03/02/2001", "Line one\nline two")],
+        )
+        self.assertEqual(rows[0]["Many Pages"], "True")
+
+    def test_jsonl(self):
+        lines = self.export("jsonl").splitlines()
+        self.assertEqual(len(lines), 2)
+        row = json.loads(lines[1])
+        self.assertEqual(row["title"], 'Two, "quoted"')
+        self.assertEqual(row["description"], "Line one\nline two")
+        self.assertEqual(row["many_pages"], "False")
+
+    def titles(self, query):
+        return [row["Title"] for row in csv.DictReader(self.export(query=query).splitlines(keepends=True))]
+
+    def test_filters_search_and_sort_apply(self):
+        self.assertEqual(self.titles("?pages=5"), ['Two, "quoted"'])
+        self.assertEqual(self.titles("?q=first"), ["One"])
+        self.assertEqual(self.titles("?sort=-pages"), ["One", 'Two, "quoted"'])
+        self.assertEqual(self.titles("?sort=pages"), ['Two, "quoted"', "One"])
+        # invalid filters export no rows, as the list shows none
+        self.assertEqual(self.titles("?pages=many"), [])
+
+    def test_header_is_sent_before_the_query(self):
+        response = self.client.get(reverse("sample:book-export", kwargs={"export_format": "csv"}))
+        content = iter(response.streaming_content)
+        with self.assertNumQueries(0):
+            self.assertTrue(next(content).startswith(b"Id,Title,Author,"))
+        with self.assertNumQueries(1):
+            # two rows, the second with a description of two lines
+            self.assertEqual(len(b"".join(content).splitlines()), 3)
+
+    def test_unknown_format(self):
+        response = self.client.get(reverse("sample:book-export", kwargs={"export_format": "xlsx"}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_hidden_columns_are_exported(self):
+        self.client.cookies["nominopolitan_columns_sample_book"] = "description.pages"
+        header = next(csv.reader(self.export().splitlines()))
+        self.assertIn("Description", header)
+        self.assertIn("Pages", header)
+        # the list itself does not show them
+        response = self.client.get(reverse("sample:book-list"), headers={"HX-Request": "true", "HX-Target": "content"})
+        self.assertNotContains(response, "First")
+
+
+class WriterTests(SimpleTestCase):
+    def test_csv_is_streamed_in_batches(self):
+        columns = (Column("n", "N", str),)
+        chunks = list(write_csv(columns, range(5), batch_size=2))
+        self.assertEqual(chunks, ["N\r\n", "0\r\n1\r\n", "2\r\n3\r\n", "4\r\n"])
@@ -0,0 +1,67 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+
+from nominopolitan.tests.test_templatetags import make_view
+from nominopolitan.widgets import AutocompleteSelect
+from sample.models import Author, Book
+from sample.views import AuthorCRUDView, BookCRUDView
+
+FILTER = {"HX-Request": "true", "HX-Target": "filtered_results", "X-Filter-Request": "true"}
+
+
+def get_filterset(view_class, query=""):
+    view = make_view(view_class, f"/sample/list/{query}", **FILTER)
+    return view.get_filterset(view.apply_property_annotations(view.get_queryset()))
+
+
+class DynamicFilterSetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Ann")
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(title="One", author=cls.author, published_date=datetime.date(2000, 1, 1), isbn="1", pages=1).save()
+        Book(
+            title="Two", author=Author.objects.create(name="Bob"), published_date=datetime.date(2001, 1, 1),
+            isbn="2", pages=20,
+        ).save()
+
+    def test_class_is_built_once_per_view_class(self):
+        first = get_filterset(BookCRUDView)
+        # a table growing past autocomplete_threshold switches the widget, not the class
+        with mock.patch.object(BookCRUDView, "table_exceeds", return_value=True):
+            second = get_filterset(BookCRUDView)
+        self.assertIs(type(first), type(second))
+        self.assertNotIsInstance(first.form.fields["author"].widget, AutocompleteSelect)
+        self.assertIsInstance(second.form.fields["author"].widget, AutocompleteSelect)
+        self.assertNotIsInstance(type(second).base_filters["author"].extra["widget"], AutocompleteSelect)
+
+        self.assertIn("_filterset_classes", BookCRUDView.__dict__)
+        get_filterset(AuthorCRUDView)
+        self.assertIsNot(AuthorCRUDView._filterset_classes, BookCRUDView._filterset_classes)
+
+    def test_each_request_filters_with_its_own_data(self):
+        cases = [
+            ("?title=tw", ["Two"]),
+            ("?pages=1", ["One"]),
+            (f"?author={self.author.pk}", ["One"]),
+            ("?published_date=2001-01-01", ["Two"]),
+            ("?many_pages=true", ["Two"]),
+            ("", ["One", "Two"]),
+        ]
+        for query, titles in cases:
+            with self.subTest(query=query):
+                filterset = get_filterset(BookCRUDView, query)
+                self.assertTrue(filterset.is_valid())
+                self.assertEqual(sorted(filterset.qs.values_list("title", flat=True)), titles)
+        self.assertFalse(get_filterset(BookCRUDView, "?pages=many").is_valid())
+
+    def test_htmx_attributes_are_set_on_each_form(self):
+        filterset = get_filterset(BookCRUDView)
+        widgets = {name: field.widget for name, field in filterset.form.fields.items()}
+        self.assertEqual(widgets["title"].attrs["hx-trigger"], "keyup changed delay:300ms")
+        self.assertEqual(widgets["published_date"].attrs["hx-trigger"], "change")
+        self.assertEqual(widgets["published_date"].input_type, "date")
+        # the cached class's widgets are left alone
+        self.assertNotIn("hx-trigger", type(filterset).base_filters["title"].extra["widget"].attrs)
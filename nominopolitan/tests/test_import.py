@@ -0,0 +1,93 @@
+import datetime
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+
+from nominopolitan.imports import import_rows, read_csv
+from sample.forms import BookForm
+from sample.models import Author, Book
+
+HTMX = {"HX-Request": "true", "HX-Target": "nominopolitanModalContent"}
+
+
+def csv_file(*lines, encoding="utf-8"):
+    content = "\r\n".join(["title,author,published_date,isbn,pages", *lines]) + "\r\n"
+    return SimpleUploadedFile("books.csv", content.encode(encoding), content_type="text/csv")
+
+
+class ImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Ann")
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(
+            title="Existing", author=cls.author, published_date=datetime.date(2000, 1, 1), isbn="0", pages=1,
+        ).save()
+
+    def import_file(self, uploaded_file, **kwargs):
+        return import_rows(Book, BookForm, read_csv(uploaded_file), **kwargs)
+
+    def test_rows_with_errors_are_reported_by_line(self):
+        pk = self.author.pk
+        result = self.import_file(csv_file(
+            f"One,{pk},2001-01-01,1,100",
+            f"Two,{pk},2001-01-01,2,many",
+            f"Three,{pk + 100},2001-01-01,3,100",
+            f"Four,{pk},2001-01-01,0,100",
+            f"Five,{pk},2001-01-01,5,100",
+        ))
+        self.assertEqual((result.rows, result.created, result.failed), (5, 2, 3))
+        self.assertEqual([line for line, _ in result.errors], [3, 4, 5])
+        self.assertEqual(result.errors[0][1], "pages: Enter a whole number.")
+        self.assertIn("author: Select a valid choice.", result.errors[1][1])
+        self.assertIn("isbn: Book with this Isbn already exists.", result.errors[2][1])
+        self.assertEqual(
+            sorted(Book.objects.values_list("title", flat=True)), ["Existing", "Five", "One"]
+        )
+
+    def test_rows_conflicting_within_a_batch(self):
+        # the form cannot see the other rows of the file, so the batch is retried row by row
+        pk = self.author.pk
+        result = self.import_file(csv_file(
+            f"One,{pk},2001-01-01,1,100",
+            f"Again,{pk},2001-01-01,1,100",
+            f"Two,{pk},2001-01-01,2,100",
+        ))
+        self.assertEqual((result.created, result.failed), (2, 1))
+        self.assertEqual(result.errors[0][0], 3)
+        self.assertEqual(sorted(Book.objects.values_list("isbn", flat=True)), ["0", "1", "2"])
+
+    def test_errors_are_truncated(self):
+        result = self.import_file(csv_file(*[f"Bad,,,{i},100" for i in range(1, 6)]), max_errors=2)
+        self.assertEqual((result.created, result.failed, len(result.errors)), (0, 5, 2))
+        self.assertTrue(result.errors_truncated)
+
+    def test_unreadable_file(self):
+        # the file is decoded in chunks, so the rows before the first bad chunk are imported
+        good = "".join(f"Book {i},{self.author.pk},2001-01-01,{i},100\r\n" for i in range(1, 1001))
+        uploaded_file = SimpleUploadedFile(
+            "books.csv", f"title,author,published_date,isbn,pages\r\n{good}".encode() + b"\xff\xfe,1\r\n",
+        )
+        result = self.import_file(uploaded_file)
+        self.assertGreater(result.created, 0)
+        self.assertEqual(result.created, Book.objects.count() - 1)
+        self.assertEqual(result.failed, 1)
+        self.assertTrue(result.errors[0][1].startswith("The file could not be read from here on:"))
+
+    def test_byte_order_mark(self):
+        result = self.import_file(csv_file(f"One,{self.author.pk},2001-01-01,1,100", encoding="utf-8-sig"))
+        self.assertEqual((result.created, result.failed), (1, 0))
+
+    def test_import_view_reports_errors(self):
+        pk = self.author.pk
+        response = self.client.post(
+            reverse("sample:book-import"),
+            {"import_file": csv_file(f"One,{pk},2001-01-01,1,100", f"Two,{pk},2001-01-01,2,many")},
+            headers=HTMX,
+        )
+        self.assertContains(response, "Imported 1 of 2 rows; 1 had errors.")
+        self.assertContains(response, "pages: Enter a whole number.")
+
+        response = self.client.post(reverse("sample:book-import"), {}, headers=HTMX)
+        self.assertContains(response, "Choose a CSV file to import")
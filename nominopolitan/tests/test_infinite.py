@@ -0,0 +1,62 @@
+import re
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from sample.models import Author
+from sample.views import AuthorCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+FILTER = {"HX-Request": "true", "HX-Target": "filtered_results", "X-Filter-Request": "true"}
+ROWS = {"HX-Request": "true", "HX-Target": "content", "X-Rows-Request": "true"}
+
+
+def next_url(content):
+    match = re.search(r'hx-get="([^"]+)" hx-trigger="revealed"', content)
+    return match and f"/sample/author/{match[1].replace('&amp;', '&')}"
+
+
+def names(content):
+    return re.findall(r">\s*(Author \d+)\s*<", content)
+
+
+@mock.patch.object(AuthorCRUDView, "pagination_mode", "infinite")
+class InfiniteScrollTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # three batches of five
+        Author.objects.bulk_create(Author(name=f"Author {i:02d}") for i in range(13))
+
+    def test_batches_are_loaded_by_cursor(self):
+        content = self.client.get("/sample/author/", headers=HTMX).content.decode()
+        self.assertIn("<thead", content)
+        seen = names(content)
+        url = next_url(content)
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, headers=ROWS)
+            content = response.content.decode()
+            # only the rows are sent, and the batch is found without OFFSET
+            self.assertTrue(content.strip().startswith("<tr"))
+            self.assertNotIn("<thead", content)
+            self.assertNotIn("OFFSET", " ".join(query["sql"] for query in queries))
+            self.assertIn("X-Rows-Request", response["Vary"])
+            seen += names(content)
+            url = next_url(content)
+        self.assertEqual(seen, [f"Author {i:02d}" for i in range(13)])
+
+    def test_filters_are_kept_in_the_cursor_url(self):
+        content = self.client.get("/sample/author/?name=Author+0", headers=FILTER).content.decode()
+        url = next_url(content)
+        self.assertIn("name=Author+0", url)
+        content = self.client.get(url, headers=ROWS).content.decode()
+        self.assertEqual(names(content), [f"Author {i:02d}" for i in range(5, 10)])
+        self.assertIsNone(next_url(content))
+
+    def test_without_htmx_falls_back_to_keyset(self):
+        with mock.patch.object(AuthorCRUDView, "use_htmx", False):
+            content = self.client.get("/sample/author/").content.decode()
+        self.assertIsNone(next_url(content))
+        self.assertIn("cursor=", content)
@@ -0,0 +1,53 @@
+from unittest import mock
+
+from django.contrib.sessions.models import Session
+from django.test import TestCase
+
+from sample.models import Author
+from sample.views import AuthorCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+MODAL = {"HX-Request": "true", "HX-Target": "nominopolitanModalContent"}
+
+
+class OriginalTargetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Ann")
+
+    def edit_form(self, **headers):
+        return self.client.get(f"/sample/author/{self.author.pk}/edit/", headers={**MODAL, **headers})
+
+    def test_round_trip_without_the_session(self):
+        response = self.client.get("/sample/author/", headers=HTMX)
+        self.assertContains(response, """hx-headers='{"X-Original-Target": "#content"}'""")
+        self.assertIn("X-Original-Target", response["Vary"])
+
+        # the modal sends the target back, and the form posts to it
+        response = self.edit_form(**{"X-Original-Target": "#content"})
+        self.assertContains(response, 'hx-target="#content"')
+        self.assertContains(response, """hx-headers='{"X-Original-Target": "#content"}'""")
+        self.assertNotContains(self.edit_form(), 'hx-target="#content"')
+
+        self.assertNotIn("sessionid", self.client.cookies)
+        self.assertFalse(Session.objects.exists())
+
+    def test_filter_requests_keep_the_original_target(self):
+        # a second page, so the pagination links target the list
+        Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(AuthorCRUDView.paginate_by))
+        headers = {"HX-Target": "filtered_results", "X-Filter-Request": "true", "X-Original-Target": "#content"}
+        response = self.client.get("/sample/author/", headers={**HTMX, **headers})
+        self.assertContains(response, 'hx-target="#content"')
+
+    def test_invalid_header_is_ignored(self):
+        for target in ('#content" onclick="alert(1)', "content", "#a, #b"):
+            with self.subTest(target=target):
+                response = self.edit_form(**{"X-Original-Target": target})
+                self.assertNotContains(response, "X-Original-Target")
+                self.assertNotContains(response, "alert(1)")
+
+    @mock.patch.object(AuthorCRUDView, "original_target_storage", "session")
+    def test_session_storage(self):
+        self.client.get("/sample/author/", headers=HTMX)
+        self.assertEqual(self.client.session["nominopolitan_list_target_author"], "#content")
+        self.assertContains(self.edit_form(), 'hx-target="#content"')
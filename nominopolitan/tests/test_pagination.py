@@ -0,0 +1,214 @@
+import datetime
+import decimal
+import re
+import uuid
+from html import unescape
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from nominopolitan.pagination import (
+    CURSOR_SALT, AsyncPaginator, CachedCountPaginator, CursorSerializer, EstimatedCountPaginator,
+    InvalidCursor, KeysetPaginator, UncountedPaginator,
+)
+from sample.models import Author
+from sample.views import AuthorCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+
+
+def walk(paginator):
+    """Return the pks of every page, forward to the end and then back to the start."""
+    page = paginator.page(None)
+    forward = [[obj.pk for obj in page]]
+    while page.has_next():
+        assert len(forward) < 100, "paging does not end"
+        page = paginator.page(page.next_cursor)
+        forward.append([obj.pk for obj in page])
+    backward = [[obj.pk for obj in page]]
+    while page.has_previous():
+        page = paginator.page(page.previous_cursor)
+        backward.insert(0, [obj.pk for obj in page])
+    return forward, backward
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(23):
+            # duplicate dates, and NULLs in the middle of the pk range
+            birth_date = None if i % 4 == 1 else datetime.date(1950 + i % 5, 1, 1)
+            Author.objects.create(name=f"Author {i}", birth_date=birth_date)
+
+    def test_round_trip_with_nulls(self):
+        for ordering in (["birth_date", "pk"], ["-birth_date", "pk"], ["birth_date", "-pk"], ["-name", "pk"]):
+            with self.subTest(ordering=ordering):
+                paginator = KeysetPaginator(Author.objects.all(), 4, ordering)
+                expected = list(paginator.queryset.values_list("pk", flat=True))
+                forward, backward = walk(paginator)
+                self.assertEqual(sum(forward, []), expected)
+                self.assertEqual(forward, backward)
+                self.assertTrue(all(len(page) == 4 for page in forward[:-1]))
+
+    def test_nulls_sort_greatest(self):
+        paginator = KeysetPaginator(Author.objects.all(), 100, ["birth_date", "pk"])
+        dates = [author.birth_date for author in paginator.page(None)]
+        self.assertEqual(dates[-6:], [None] * 6)
+        paginator = KeysetPaginator(Author.objects.all(), 100, ["-birth_date", "pk"])
+        dates = [author.birth_date for author in paginator.page(None)]
+        self.assertEqual(dates[:6], [None] * 6)
+
+    def test_tampered_cursor(self):
+        paginator = KeysetPaginator(Author.objects.all(), 4, ["birth_date", "pk"])
+        cursor = paginator.page(None).next_cursor
+        with self.assertRaises(InvalidCursor):
+            paginator.page(cursor[:-2] + ("AA" if not cursor.endswith("AA") else "BB"))
+        with self.assertRaises(InvalidCursor):
+            paginator.page("not-a-cursor")
+        # validly signed, but for another ordering
+        wrong_length = signing.dumps({"v": [1], "f": True}, salt=CURSOR_SALT, serializer=CursorSerializer)
+        with self.assertRaises(InvalidCursor):
+            paginator.page(wrong_length)
+
+    def test_view_pages_by_cursor(self):
+        with mock.patch.object(AuthorCRUDView, "pagination_mode", "keyset"):
+            url = "/sample/author/?sort=birth_date"
+            names = []
+            while url:
+                response = self.client.get(url, headers=HTMX)
+                self.assertEqual(response.status_code, 200)
+                html = response.content.decode()
+                names += re.findall(r">\s*(Author \d+)\s*</td>", html)
+                next_url = re.search(r'class="page-link" href="(\?[^"]*cursor=[^"]*)"[^>]*>\s*Next', html)
+                url = "/sample/author/" + unescape(next_url.group(1)) if next_url else None
+            self.assertEqual(len(names), 23)
+            self.assertEqual(len(set(names)), 23)
+
+            response = self.client.get("/sample/author/", {"cursor": "tampered"}, headers=HTMX)
+            self.assertEqual(response.status_code, 404)
+
+
+class SubMillisecondKeysetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # three users per millisecond, 100µs apart
+        start = timezone.now().replace(microsecond=0)
+        User.objects.bulk_create(
+            User(username=f"user{i}", date_joined=start + datetime.timedelta(microseconds=100 * i))
+            for i in range(12)
+        )
+
+    def test_round_trip(self):
+        for ordering in (["date_joined", "pk"], ["-date_joined", "pk"]):
+            with self.subTest(ordering=ordering):
+                paginator = KeysetPaginator(User.objects.all(), 5, ordering)
+                expected = list(paginator.queryset.values_list("pk", flat=True))
+                forward, backward = walk(paginator)
+                self.assertEqual(sum(forward, []), expected)
+                self.assertEqual(forward, backward)
+
+
+class CursorSerializerTests(SimpleTestCase):
+    def test_values_are_decoded_exactly(self):
+        values = [
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 7),
+            datetime.date(2024, 1, 2),
+            datetime.time(3, 4, 5, 999),
+            datetime.timedelta(days=2, microseconds=3),
+            decimal.Decimal("1.10"),
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            {"dt": 1},
+            "text", 1, None,
+        ]
+        serializer = CursorSerializer()
+        decoded = serializer.loads(serializer.dumps({"v": values}))["v"]
+        self.assertEqual(decoded, values)
+        self.assertEqual([type(value) for value in decoded], [type(value) for value in values])
+
+
+class CountStrategyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Author.objects.bulk_create(Author(name=f"Author {i:02d}") for i in range(60))
+
+    def setUp(self):
+        cache.clear()
+
+    def queryset(self):
+        return Author.objects.order_by("pk")
+
+    def test_exact(self):
+        paginator = AsyncPaginator(self.queryset(), 5)
+        self.assertEqual(paginator.count, 60)
+        self.assertEqual(paginator.num_pages, 12)
+        with self.assertRaises(EmptyPage):
+            paginator.page(13)
+
+    def test_cached(self):
+        paginator = CachedCountPaginator(self.queryset(), 5, cache, "authors", timeout=60)
+        self.assertEqual(paginator.count, 60)
+        Author.objects.create(name="Author 60")
+        # the stale count is served from the cache without a query
+        paginator = CachedCountPaginator(self.queryset(), 5, cache, "authors", timeout=60)
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.count, 60)
+        cache.delete("authors")
+        paginator = CachedCountPaginator(self.queryset(), 5, cache, "authors", timeout=60)
+        self.assertEqual(paginator.count, 61)
+
+    def test_estimated_below_cap_is_exact(self):
+        paginator = EstimatedCountPaginator(self.queryset(), 5, cap=100)
+        self.assertEqual(paginator.count, 60)
+        self.assertFalse(paginator.count_is_estimate)
+        with self.assertRaises(EmptyPage):
+            paginator.page(13)
+
+    def test_estimated_above_cap(self):
+        # SQLite has no planner estimate, so the count is cap + 1: 31 rows, 7 pages
+        paginator = EstimatedCountPaginator(self.queryset(), 5, cap=30)
+        self.assertEqual(paginator.count, 31)
+        self.assertTrue(paginator.count_is_estimate)
+        # pages past the estimated last page are served while they have rows
+        page = paginator.page(12)
+        self.assertEqual([author.name for author in page], [f"Author {i}" for i in range(55, 60)])
+        self.assertFalse(page.has_next())
+        with self.assertRaises(EmptyPage):
+            EstimatedCountPaginator(self.queryset(), 5, cap=30).page(13)
+
+    async def test_estimated_above_cap_async(self):
+        page = await EstimatedCountPaginator(self.queryset(), 5, cap=30).apage(12)
+        self.assertEqual(len(page), 5)
+        with self.assertRaises(EmptyPage):
+            await EstimatedCountPaginator(self.queryset(), 5, cap=30).apage(13)
+
+    def test_estimated_view_returns_404_past_the_end(self):
+        with mock.patch.multiple(AuthorCRUDView, count_strategy="estimated", count_estimate_cap=30):
+            self.assertEqual(self.client.get("/sample/author/", {"page": 12}, headers=HTMX).status_code, 200)
+            self.assertEqual(self.client.get("/sample/author/", {"page": 13}, headers=HTMX).status_code, 404)
+
+    def test_uncounted(self):
+        paginator = UncountedPaginator(self.queryset(), 5)
+        with self.assertNumQueries(1):
+            page = paginator.page(3)
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+        self.assertIsNone(paginator.count)
+        self.assertEqual(paginator.num_pages, 4)
+        self.assertFalse(paginator.page(12).has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(13)
+
+    def test_view_pages_with_each_strategy(self):
+        for strategy in AuthorCRUDView.COUNT_STRATEGIES:
+            with self.subTest(strategy=strategy), mock.patch.object(AuthorCRUDView, "count_strategy", strategy):
+                cache.clear()
+                response = self.client.get("/sample/author/", {"page": 2, "sort": "name"}, headers=HTMX)
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, "Author 05")
+                self.assertNotContains(response, "Author 10")
@@ -0,0 +1,86 @@
+import datetime
+import re
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path
+from neapolitan.views import CRUDView
+
+from nominopolitan.mixins import NominopolitanMixin
+from sample.models import Author, Book
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+
+
+class TitleAuthorView(NominopolitanMixin, CRUDView):
+    model = Book
+    url_base = "titleauthor"
+    fields = ["title", "author"]
+    related_only = {"author": ["name"]}
+    use_htmx = True
+
+
+class PropertyView(NominopolitanMixin, CRUDView):
+    model = Author
+    url_base = "authorbio"
+    fields = ["name"]
+    properties = ["has_bio"]
+    property_fields = {"has_bio": ["bio"]}
+    use_htmx = True
+
+
+urlpatterns = TitleAuthorView.get_urls() + PropertyView.get_urls() + [
+    path("sample/", include("sample.urls", namespace="sample")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class ProjectionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(
+            title="One", author=Author.objects.create(name="Ann", bio="Long"),
+            published_date=datetime.date(2000, 1, 1), isbn="1", pages=100, description="Very long",
+        ).save()
+
+    def selected_columns(self, url):
+        """Get the columns the list query of a request selects, as (table, column) pairs."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, headers=HTMX)
+        self.assertEqual(response.status_code, 200)
+        table = response.wsgi_request.resolver_match.func.view_class.model._meta.db_table
+        select = next(
+            query["sql"] for query in queries
+            if re.search(rf'FROM "{table}"( |$)', query["sql"]) and "COUNT(" not in query["sql"]
+        )
+        return set(re.findall(r'"(\w+)"\."(\w+)"', select.split(" FROM ")[0]))
+
+    def test_only_displayed_columns_are_loaded(self):
+        self.assertEqual(self.selected_columns("/titleauthor/"), {
+            ("sample_book", "id"), ("sample_book", "title"), ("sample_book", "author_id"),
+            ("sample_author", "id"), ("sample_author", "name"),
+        })
+
+    def test_property_fields_are_loaded(self):
+        self.assertEqual(
+            self.selected_columns("/authorbio/"),
+            {("sample_author", "id"), ("sample_author", "name"), ("sample_author", "bio")},
+        )
+        with mock.patch.object(PropertyView, "property_fields", {}):
+            self.assertIn(("sample_author", "birth_date"), self.selected_columns("/authorbio/"))
+
+    def test_opting_out(self):
+        with mock.patch.object(TitleAuthorView, "use_column_projection", False):
+            self.assertIn(("sample_book", "description"), self.selected_columns("/titleauthor/"))
+
+    def test_hidden_columns_are_not_loaded(self):
+        self.assertIn(("sample_book", "description"), self.selected_columns("/sample/book/"))
+        self.client.cookies["nominopolitan_columns_sample_book"] = "description.author"
+        columns = self.selected_columns("/sample/book/")
+        self.assertNotIn(("sample_book", "description"), columns)
+        self.assertIn(("sample_book", "title"), columns)
+        # nor are the columns of hidden relations
+        self.assertFalse(any(table == "sample_author" for table, _ in columns))
@@ -0,0 +1,58 @@
+import datetime
+import re
+from unittest import mock
+
+from django.test import TestCase
+
+from nominopolitan.tests.test_templatetags import make_view
+from sample.models import Author, Book
+from sample.views import BookCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+
+
+def unevaluated(book):
+    raise AssertionError("the property was evaluated in Python")
+
+
+class PropertyAnnotationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = Author.objects.create(name="Ann")
+        for i, pages in enumerate([5, 50, 10, 500]):
+            # Book.save() takes no arguments, so objects.create() cannot be used
+            Book(
+                title=f"Book {pages}", author=author, published_date=datetime.date(2000, 1, 1),
+                isbn=f"{i:013d}", pages=pages,
+            ).save()
+
+    def titles(self, query):
+        with mock.patch.object(Book, "many_pages", property(unevaluated)):
+            response = self.client.get(f"/sample/book/{query}", headers=HTMX)
+        self.assertEqual(response.status_code, 200)
+        return re.findall(r">\s*(Book \d+)\s*<", response.content.decode())
+
+    def test_column_reads_the_annotation(self):
+        view = make_view(BookCRUDView, "/sample/book/")
+        queryset = view.apply_property_annotations(view.get_queryset(), view.properties)
+        self.assertEqual(
+            [(book.pages, book.many_pages_annotation) for book in queryset],
+            [(5, False), (50, True), (10, False), (500, True)],
+        )
+        self.assertEqual(self.titles(""), ["Book 5", "Book 50", "Book 10", "Book 500"])
+
+    def test_filter(self):
+        self.assertEqual(self.titles("?many_pages=true"), ["Book 50", "Book 500"])
+        self.assertEqual(self.titles("?many_pages=false"), ["Book 5", "Book 10"])
+
+    def test_sort(self):
+        with (
+            mock.patch.object(BookCRUDView, "sortable_fields", ["pages", "many_pages"]),
+            mock.patch.object(BookCRUDView, "max_sort_columns", 2),
+        ):
+            self.assertEqual(self.titles("?sort=many_pages,pages"), ["Book 5", "Book 10", "Book 50", "Book 500"])
+            self.assertEqual(self.titles("?sort=-many_pages,-pages"), ["Book 500", "Book 50", "Book 10", "Book 5"])
+
+    def test_not_sortable_unless_listed(self):
+        # the sample view leaves many_pages out of sortable_fields
+        self.assertEqual(self.titles("?sort=-many_pages"), ["Book 5", "Book 50", "Book 10", "Book 500"])
@@ -0,0 +1,76 @@
+import datetime
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from neapolitan.views import CRUDView, Role
+
+from nominopolitan.mixins import NominopolitanMixin
+from nominopolitan.tests.test_templatetags import make_view
+from sample.models import Author, Book
+from sample.views import BookCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+MODAL = {"HX-Request": "true", "HX-Target": "nominopolitanModalContent"}
+
+
+class AuthorBooksView(NominopolitanMixin, CRUDView):
+    model = Author
+    url_base = "authorbooks"
+    fields = ["name"]
+    extra_related = ["books__author"]
+
+
+class BookAuthorView(NominopolitanMixin, CRUDView):
+    model = Book
+    url_base = "bookauthor"
+    fields = ["title"]
+    properties = ["many_pages"]
+    property_relations = {"many_pages": ["author"]}
+
+
+def add_books(count):
+    start = Book.objects.count()
+    for i in range(start, start + count):
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(
+            title=f"Book {i}", author=Author.objects.create(name=f"Author {i}"),
+            published_date=datetime.date(2000, 1, 1), isbn=f"{i:013d}", pages=i,
+        ).save()
+
+
+class RelatedLookupTests(TestCase):
+    def test_lookups(self):
+        self.assertEqual(make_view(BookCRUDView).get_related_lookups(["title", "author"]), (["author"], []))
+        # reverse ForeignKeys are prefetched, with everything past them
+        self.assertEqual(make_view(AuthorBooksView).get_related_lookups(["name"]), ([], ["books__author"]))
+        view = make_view(BookAuthorView)
+        self.assertEqual(view.get_related_lookups(view.fields, view.properties), (["author"], []))
+        self.assertEqual(make_view(BookAuthorView, role=Role.DETAIL).get_related_lookups(["title"]), ([], []))
+
+    def count_list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("sample:book-list"), headers=HTMX)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_list_queries_do_not_grow_with_the_rows(self):
+        add_books(2)
+        # the first request also checks the size of the authors table for autocomplete
+        self.count_list_queries()
+        few = self.count_list_queries()
+        add_books(8)
+        self.assertEqual(self.count_list_queries(), few)
+
+        # without the plan each row's author is a query of its own
+        with mock.patch.object(BookCRUDView, "use_related_optimization", False):
+            self.assertGreaterEqual(self.count_list_queries(), few + Book.objects.count())
+
+    def test_detail_loads_the_relations_with_the_object(self):
+        add_books(1)
+        book = Book.objects.get()
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("sample:book-detail", args=[book.pk]), headers=MODAL)
+        self.assertContains(response, "Author 0")
@@ -0,0 +1,81 @@
+import datetime
+import io
+import re
+import unittest
+from html import unescape
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+
+from nominopolitan import search
+from nominopolitan.search import build_search_index, drop_search_index, search_queryset
+from sample.models import Author, Book
+
+FILTER = {"HX-Request": "true", "HX-Target": "filtered_results", "X-Filter-Request": "true"}
+
+
+def add_book(title, author, isbn):
+    # Book.save() takes no arguments, so objects.create() cannot be used
+    return Book(
+        title=title, author=author, published_date=datetime.date(2000, 1, 1), isbn=isbn, pages=100,
+    ).save()
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "the test database is not SQLite")
+class SearchTests(TransactionTestCase):
+    # SQLite cannot roll an FTS5 table back to a savepoint, so each test commits
+    # and drops the index it built
+    def setUp(self):
+        self.author = Author.objects.create(name="Ann Bookman")
+        add_book("Notebook", self.author, "1")
+        add_book("Booking a Trip", Author.objects.create(name="Bob"), "2")
+        add_book("Gardens", Author.objects.create(name="Cy"), "3")
+        search._index_checks.clear()
+        self.addCleanup(search._index_checks.clear)
+        self.addCleanup(drop_search_index, Book)
+
+    def titles(self, query, search_fields=("title",)):
+        queryset = search_queryset(Book.objects.all(), list(search_fields), query)
+        return sorted(queryset.values_list("title", flat=True))
+
+    def test_icontains_until_the_index_is_built(self):
+        # icontains matches inside words, full-text search only at their start
+        self.assertEqual(self.titles("book"), ["Booking a Trip", "Notebook"])
+        build_search_index(Book, ["title"])
+        self.assertEqual(self.titles("book"), ["Booking a Trip"])
+        self.assertEqual(self.titles("trip book"), ["Booking a Trip"])
+
+        # the index follows changes to the table
+        add_book("Bookshelves", self.author, "4")
+        self.assertEqual(self.titles("book"), ["Booking a Trip", "Bookshelves"])
+
+        drop_search_index(Book)
+        self.assertEqual(self.titles("book"), ["Booking a Trip", "Bookshelves", "Notebook"])
+
+    def test_relation_paths_use_icontains_alongside_the_index(self):
+        build_search_index(Book, ["title", "author__name"])
+        # "Notebook" is found through its author's name
+        self.assertEqual(self.titles("book", ["title", "author__name"]), ["Booking a Trip", "Notebook"])
+        self.assertEqual(self.titles("ookm", ["title", "author__name"]), ["Notebook"])
+
+    def test_terms_can_match_different_fields(self):
+        # the title matches one term and the author's name the other, with or without the index
+        search_fields = ["title", "author__name"]
+        self.assertEqual(self.titles("bookman note", search_fields), ["Notebook"])
+        build_search_index(Book, ["title"])
+        self.assertEqual(self.titles("bookman note", search_fields), ["Notebook"])
+        self.assertEqual(self.titles("bob trip", search_fields), ["Booking a Trip"])
+        self.assertEqual(self.titles("bob note", search_fields), [])
+
+    def test_search_box_with_and_without_the_index(self):
+        def search_titles(query):
+            html = self.client.get(reverse("sample:book-list"), {"q": query}, headers=FILTER).content.decode()
+            cells = {unescape(cell) for cell in re.findall(r">\s*([^<>]*?)\s*</td>", html)}
+            return cells & {"Notebook", "Booking a Trip", "Gardens"}
+
+        self.assertEqual(search_titles("otebo"), {"Notebook"})
+        call_command("nm_search_index", "sample.book", stdout=io.StringIO())
+        self.assertEqual(search_titles("otebo"), set())
+        self.assertEqual(search_titles("gard"), {"Gardens"})
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from django_htmx.middleware import HtmxDetails
+from neapolitan.views import CRUDView, Role
+
+from nominopolitan.mixins import NominopolitanMixin
+from nominopolitan.templatetags.nominopolitan import compile_action_links
+from sample.models import Book
+
+
+class PathPkBookView(NominopolitanMixin, CRUDView):
+    model = Book
+    url_base = "pathbook"
+    path_converter = "path"
+    fields = ["title"]
+    use_htmx = True
+
+
+urlpatterns = PathPkBookView.get_urls()
+
+
+def make_view(view_class, path="/", role=Role.LIST, **headers):
+    request = RequestFactory().get(path, headers=headers)
+    request.htmx = HtmxDetails(request)
+    view = view_class(**role.extra_initkwargs())
+    view.role = role
+    view.setup(request)
+    return view
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class ActionLinkTests(SimpleTestCase):
+    def test_string_pks_are_quoted_as_reverse_quotes_them(self):
+        view = make_view(PathPkBookView)
+        render = compile_action_links(view, SimpleNamespace(pk="first"))
+        for pk in ["plain", "with space", "a/b?c#d", "50%&x=1", "café", "it's"]:
+            with self.subTest(pk=pk):
+                html = render(SimpleNamespace(pk=pk))
+                for role in ("detail", "update", "delete"):
+                    url = reverse(f"pathbook-{role}", kwargs={"pk": pk})
+                    self.assertIn(f"href='{url}'", html)
+                    self.assertIn(f"hx-get='{url}'", html)
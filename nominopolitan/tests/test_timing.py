@@ -0,0 +1,105 @@
+import datetime
+import re
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from nominopolitan.timing import PhaseTimer, PhaseTiming, format_server_timing, phases_timed
+from sample.models import Author, Book
+from sample.views import AuthorCRUDView, BookCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+
+
+class PhaseTimerTests(SimpleTestCase):
+    def test_phases_are_listed_in_the_order_they_started(self):
+        timer = PhaseTimer()
+        with timer.phase("outer"):
+            with timer.phase("inner"):
+                pass
+            with timer.phase("second"):
+                pass
+        with timer.phase("inner"):
+            pass
+        self.assertEqual([timing.name for timing in timer.get_timings()], ["outer", "inner", "second", "total"])
+
+    def test_nested_phases_are_excluded(self):
+        timer = PhaseTimer()
+        with mock.patch("nominopolitan.timing.time.perf_counter", side_effect=[0, 1, 2, 5, 7]):
+            timer.started = 0
+            with timer.phase("outer"):
+                with timer.phase("inner"):
+                    pass
+            timings = timer.get_timings()
+        self.assertEqual(
+            [(timing.name, timing.duration) for timing in timings],
+            [("outer", 4000), ("inner", 1000), ("total", 7000)],
+        )
+
+    def test_format_server_timing(self):
+        timings = [PhaseTiming("queryset", 1.25, 1), PhaseTiming("total", 8.44, 3)]
+        self.assertEqual(
+            format_server_timing(timings),
+            'queryset;dur=1.2;desc="queryset (1 query)", total;dur=8.4;desc="total (3 queries)"',
+        )
+
+
+class ViewTimingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = Author.objects.create(name="Ann")
+        for i in range(3):
+            # Book.save() takes no arguments, so objects.create() cannot be used
+            Book(
+                title=f"Book {i}", author=author, published_date=datetime.date(2000, 1, 1),
+                isbn=f"{i:013d}", pages=i,
+            ).save()
+        # two pages of authors
+        Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(AuthorCRUDView.paginate_by))
+
+    def get_phases(self, response):
+        return [
+            (match[1], int(match[2]))
+            for match in re.finditer(r'(\w+);dur=[\d.]+;desc="\w+ \((\d+) quer', response["Server-Timing"])
+        ]
+
+    def test_server_timing_header(self):
+        with mock.patch.object(AuthorCRUDView, "use_server_timing", True):
+            response = self.client.get("/sample/author/?page=2", headers=HTMX)
+        phases = self.get_phases(response)
+        self.assertEqual(
+            [name for name, _ in phases],
+            ["queryset", "filter", "paginate", "fetch", "context", "render", "rows", "actions", "total"],
+        )
+        # paginating and fetching the page are the queries of a list request
+        queries = dict(phases)
+        self.assertEqual((queries["paginate"], queries["fetch"]), (1, 1))
+        self.assertEqual(sum(count for name, count in phases if name != "total"), queries["total"])
+
+    def test_no_header_or_timer_by_default(self):
+        response = self.client.get("/sample/author/", headers=HTMX)
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    def test_phases_timed_signal(self):
+        calls = []
+        def receiver(sender, **kwargs):
+            calls.append((sender, kwargs))
+
+        phases_timed.connect(receiver, sender=BookCRUDView)
+        self.addCleanup(phases_timed.disconnect, receiver, sender=BookCRUDView)
+        response = self.client.get("/sample/book/", headers=HTMX)
+        self.client.get("/sample/author/", headers=HTMX)
+
+        # only the sender's requests are timed, and without the header
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(response.has_header("Server-Timing"))
+        sender, kwargs = calls[0]
+        self.assertIs(sender, BookCRUDView)
+        self.assertEqual(set(kwargs), {"signal", "view", "request", "timings"})
+        self.assertIsInstance(kwargs["view"], BookCRUDView)
+        self.assertEqual(kwargs["request"].path, "/sample/book/")
+        timings = kwargs["timings"]
+        self.assertTrue(all(isinstance(timing, PhaseTiming) for timing in timings))
+        self.assertEqual([timing.name for timing in timings][0], "queryset")
+        self.assertEqual(timings[-1].name, "total")
+        self.assertGreaterEqual(timings[-1].duration, sum(timing.duration for timing in timings[:-1]))
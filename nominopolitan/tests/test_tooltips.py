@@ -0,0 +1,94 @@
+import datetime
+import json
+import re
+import shutil
+import subprocess
+import unittest
+
+from django.test import TestCase
+
+from sample.models import Author, Book
+
+# just enough of the DOM and bootstrap for the tooltip script, which is run twice
+# as it is when the content partial is swapped in again
+HARNESS = """
+const listeners = {};
+globalThis.window = globalThis;
+globalThis.document = {
+    addEventListener: (type, listener) => (listeners[type] ||= []).push(listener),
+};
+const dispatch = (type, event) => (listeners[type] || []).forEach(listener => listener(event));
+const created = [];
+globalThis.bootstrap = {Tooltip: class {
+    static instances = new Map();
+    static getInstance(cell) { return this.instances.get(cell) || null; }
+    static getOrCreateInstance(cell) {
+        if (!this.instances.has(cell)) { this.instances.set(cell, new this(cell)); created.push(cell.name); }
+        return this.instances.get(cell);
+    }
+    constructor(cell) { this.cell = cell; this.shown = 0; }
+    show() { this.shown++; }
+    dispose() { bootstrap.Tooltip.instances.delete(this.cell); }
+}};
+const cell = (name, scrollWidth) => {
+    const cell = {name, scrollWidth, clientWidth: 100};
+    cell.closest = () => cell;
+    return cell;
+};
+const list = {cells: [cell("cut", 150), cell("fits", 100)]};
+list.contains = cell => list.cells.includes(cell);
+const other = cell("other", 150);
+
+SCRIPT
+SCRIPT
+
+list.cells.forEach(target => dispatch("mouseover", {target}));
+dispatch("focusin", {target: list.cells[0]});
+dispatch("mouseover", {target: other});
+const live = () => [...bootstrap.Tooltip.instances.keys()].map(cell => cell.name).sort();
+const result = {
+    listeners: Object.fromEntries(Object.entries(listeners).map(([type, added]) => [type, added.length])),
+    created: [...created],
+    shown: bootstrap.Tooltip.getInstance(list.cells[0]).shown,
+    live: live(),
+};
+dispatch("htmx:beforeSwap", {detail: {target: list}});
+result.afterSwap = live();
+
+let prevented = false;
+other.scrollWidth = 100;
+dispatch("show.bs.tooltip", {target: other, preventDefault: () => prevented = true});
+result.preventedWhenFitting = prevented;
+console.log(JSON.stringify(result));
+"""
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class LazyTooltipTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(
+            title="One", author=Author.objects.create(name="Ann"), published_date=datetime.date(2000, 1, 1),
+            isbn="1", pages=1,
+        ).save()
+
+    def test_tooltips_are_created_on_hover_and_disposed_on_swap(self):
+        html = self.client.get("/sample/book/").content.decode()
+        self.assertNotIn("getComputedStyle", html)
+        script = re.search(r"    // Creates a cell's tooltip.*?\n    }\n(?=\n    // Handles)", html, re.S)[0]
+        result = subprocess.run(
+            ["node", "-e", HARNESS.replace("SCRIPT", script)],
+            capture_output=True, text=True, check=True, timeout=30,
+        )
+        result = json.loads(result.stdout)
+        self.assertEqual(
+            result["listeners"], {"mouseover": 1, "focusin": 1, "show.bs.tooltip": 1, "htmx:beforeSwap": 1}
+        )
+        # only cells that are cut off get a tooltip, once
+        self.assertEqual(result["created"], ["cut", "other"])
+        self.assertEqual(result["shown"], 1)
+        self.assertEqual(result["live"], ["cut", "other"])
+        # swapping the list out disposes only its tooltips
+        self.assertEqual(result["afterSwap"], ["other"])
+        self.assertTrue(result["preventedWhenFitting"])
@@ -0,0 +1,55 @@
+import datetime
+
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+from neapolitan.views import CRUDView
+
+from nominopolitan.mixins import AsyncNominopolitanMixin, NominopolitanMixin
+from sample.models import Author, Book
+
+
+class ExportBookView(NominopolitanMixin, CRUDView):
+    model = Book
+    url_base = "exportbook"
+    fields = ["title", "pages"]
+    export_formats = ["csv"]
+
+
+class AsyncExportBookView(AsyncNominopolitanMixin, ExportBookView):
+    url_base = "asyncexportbook"
+
+
+urlpatterns = (
+    ExportBookView.get_urls(fields=["title"])
+    + AsyncExportBookView.get_urls(fields=["title"])
+)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class InitkwargsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Book.save() takes no arguments, so objects.create() cannot be used
+        Book(
+            title="One", author=Author.objects.create(name="Ann"), published_date=datetime.date(2000, 1, 1),
+            isbn="1", pages=100,
+        ).save()
+
+    def export(self, url_base):
+        response = self.client.get(reverse(f"{url_base}-export", kwargs={"export_format": "csv"}))
+        return b"".join(response.streaming_content).decode().splitlines()
+
+    def test_endpoints_get_the_initkwargs_of_get_urls(self):
+        self.assertEqual(self.export("exportbook"), ["Title", "One"])
+        view = resolve(reverse("exportbook-bulk")).func
+        self.assertEqual(view.view_initkwargs, {"fields": ["title"]})
+
+    async def test_async_endpoints_get_the_initkwargs_of_get_urls(self):
+        response = await self.async_client.get(reverse("asyncexportbook-export", kwargs={"export_format": "csv"}))
+        content = b"".join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual(content.splitlines(), ["Title", "One"])
+
+    def test_invalid_initkwargs(self):
+        for key in ("no_such_attribute", "get"):
+            with self.subTest(key=key), self.assertRaises(TypeError):
+                ExportBookView.as_endpoint_view({"get": "export"}, **{key: 1})
@@ -0,0 +1,141 @@
+"""
+This module provides the per-phase timing of list requests, reported in a
+Server-Timing header and by a signal.
+
+Each phase records its own time and queries, excluding those of the phases
+nested in it (eg the object_list tag's phases within template rendering), so
+the phases of a request add up to at most its total. When timing is off, views
+use NULL_TIMER, whose phases are a shared no-op context manager.
+
+Key Components:
+- PhaseTimer: Times the phases of a request and counts their queries
+- NULL_TIMER: The timer used when timing is off
+- PhaseTiming: The time and queries of one phase
+- phases_timed: Signal sent with the timings of each timed request
+"""
+
+import contextlib
+import functools
+import time
+from typing import NamedTuple
+
+from django.dispatch import Signal
+
+# sent after each timed list request, with the arguments view, request and timings
+# (a list of PhaseTiming ending with the "total")
+phases_timed = Signal()
+
+
+class PhaseTiming(NamedTuple):
+    """
+    The time and queries of one phase of a request.
+
+    Attributes:
+        name (str): The phase, eg "queryset", "paginate" or "render"
+        duration (float): Milliseconds spent in the phase, excluding nested phases
+        queries (int): Queries run in the phase, excluding nested phases
+    """
+    name: str
+    duration: float
+    queries: int
+
+
+class PhaseTimer:
+    """
+    Times the phases of a request, and counts their queries.
+
+    Phases of the same name (eg the action links of each row) are added up.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        # name -> [seconds, queries], in the order the phases were first entered
+        self.phases = {}
+        # [started, seconds and queries of nested phases, queries when started] of each open phase
+        self.open = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time the block as the phase called name."""
+        # added when entered, so phases are listed in the order they started
+        totals = self.phases.setdefault(name, [0.0, 0])
+        current = [time.perf_counter(), 0.0, 0, self.queries]
+        self.open.append(current)
+        try:
+            yield
+        finally:
+            self.open.pop()
+            started, nested_seconds, nested_queries, queries = current
+            seconds = time.perf_counter() - started
+            queries = self.queries - queries
+            totals[0] += seconds - nested_seconds
+            totals[1] += queries - nested_queries
+            if self.open:
+                self.open[-1][1] += seconds
+                self.open[-1][2] += queries
+
+    def timed(self, name, func):
+        """Wrap func so that each call is timed as the phase called name."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def count_queries(self, connection):
+        """Count the queries run on a database connection, as a context manager."""
+        return connection.execute_wrapper(self._count_query)
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def get_timings(self):
+        """
+        Get the timings of the phases so far, in the order they were first entered.
+
+        Returns:
+            list[PhaseTiming]: The phases, followed by the "total" since the timer was created
+        """
+        timings = [
+            PhaseTiming(name, seconds * 1000, queries)
+            for name, (seconds, queries) in self.phases.items()
+        ]
+        timings.append(PhaseTiming("total", (time.perf_counter() - self.started) * 1000, self.queries))
+        return timings
+
+
+class NullTimer:
+    """A timer which does nothing, used when timing is off."""
+
+    enabled = False
+    _phase = contextlib.nullcontext()
+
+    def phase(self, name):
+        return self._phase
+
+    def timed(self, name, func):
+        return func
+
+
+NULL_TIMER = NullTimer()
+
+
+def format_server_timing(timings):
+    """
+    Format timings as the value of a Server-Timing header.
+
+    Args:
+        timings (list[PhaseTiming]): The timings of a request
+
+    Returns:
+        str: eg 'queryset;dur=1.2;desc="queryset (1 query)", total;dur=8.4;desc="total (3 queries)"'
+    """
+    return ", ".join(
+        f'{timing.name};dur={timing.duration:.1f};'
+        f'desc="{timing.name} ({timing.queries} {"query" if timing.queries == 1 else "queries"})"'
+        for timing in timings
+    )
@@ -0,0 +1,71 @@
+"""
+Form widgets used by nominopolitan views.
+
+Key Components:
+- AutocompleteSelect: htmx search widget for ForeignKey fields with large related tables
+"""
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+
+class AutocompleteSelect(forms.Widget):
+    """
+    Widget for a ForeignKey choice that renders only the selected value and a search box.
+
+    Matching options are fetched from the view's autocomplete endpoint with htmx as
+    the user types, so the related table is never loaded into a <select>. The chosen
+    value is stored in a hidden input, which fires a `change` event when updated so
+    that htmx filter triggers behave as they do for a <select>.
+
+    Attributes:
+        url (str): URL of the autocomplete endpoint for this field
+        queryset (QuerySet): Related objects, used to look up the selected value's label
+        to_field_name (str | None): Related field holding the value (defaults to pk)
+    """
+
+    template_name = f"nominopolitan/{getattr(settings, 'NOMINOPOLITAN_CSS_FRAMEWORK', 'bootstrap5')}/widgets/autocomplete.html"
+
+    # attributes applied to the visible search box rather than the hidden input
+    SEARCH_ATTRS: tuple[str, ...] = ('class', 'style', 'placeholder')
+
+    def __init__(self, url, queryset, to_field_name=None, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+        self.queryset = queryset
+        self.to_field_name = to_field_name
+
+    def get_label(self, value):
+        """
+        Get the display text for the selected value.
+
+        Args:
+            value: The selected value (usually the related object's pk)
+
+        Returns:
+            str: str() of the selected object, or '' if nothing valid is selected
+        """
+        if value in (None, ''):
+            return ''
+        try:
+            obj = self.queryset.filter(**{self.to_field_name or 'pk': value}).first()
+        except (ValueError, TypeError, ValidationError):
+            return ''
+        return str(obj) if obj is not None else ''
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        widget_attrs = context['widget']['attrs']
+        context['widget'].update({
+            'url': self.url,
+            'label': self.get_label(value),
+            'search_id': f"{widget_attrs.get('id', name)}_search",
+            'search_attrs': {k: v for k, v in widget_attrs.items() if k in self.SEARCH_ATTRS},
+            'hidden_attrs': {k: v for k, v in widget_attrs.items() if k not in self.SEARCH_ATTRS},
+        })
+        return context
+
+    def id_for_label(self, id_):
+        # point labels at the search box
+        return f"{id_}_search" if id_ else id_
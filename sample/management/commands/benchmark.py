@@ -0,0 +1,264 @@
+import contextlib
+import datetime
+import itertools
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import django
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from sample.models import Author, Book
+from sample.views import AuthorCRUDView, BookCRUDView
+
+HTMX = {"HX-Request": "true", "HX-Target": "content"}
+FILTER = {"HX-Request": "true", "HX-Target": "filtered_results", "X-Filter-Request": "true", "X-Original-Target": "#content"}
+MODAL = {"HX-Request": "true", "HX-Target": "nominopolitanModalContent", "X-Original-Target": "#content"}
+
+# a cache of the command's own, so the site's cache is neither cleared nor measured
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "benchmark"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the sample BookCRUDView and AuthorCRUDView: list pages, htmx filters, deep pages, "
+        "detail modals, form POSTs and cached list partials, at one or more table sizes. Wall time, "
+        "query count, response bytes and peak Python memory are reported per scenario and can be "
+        "written to a JSON report. Requests use a local-memory cache of the command's own. "
+        "The sample rows are created in a transaction that is rolled back, so run it against a "
+        "database without other books for comparable numbers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, nargs="+", default=[1000],
+            help="Numbers of books to benchmark with (with a tenth as many authors), eg 1000 100000 1000000.",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Timed requests per scenario.")
+        parser.add_argument(
+            "--paginate-by", type=int, default=25,
+            help="Page size for views that do not paginate, as a full list of every row is not a useful benchmark.",
+        )
+        parser.add_argument("--output", help="Write the report as JSON to this file.")
+        parser.add_argument("--compare", help="A previous JSON report to compare the median wall times with.")
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1")
+        baseline = self.load_report(options["compare"]) if options["compare"] else {}
+
+        # log records from every request would be timed along with the views
+        logging.getLogger("nominopolitan").setLevel(logging.WARNING)
+        for view_class in (BookCRUDView, AuthorCRUDView):
+            if view_class.paginate_by is None:
+                view_class.paginate_by = options["paginate_by"]
+
+        results = []
+        for rows in options["rows"]:
+            with override_settings(CACHES=CACHES, NOMINOPOLITAN_CACHE_ALIAS="default"), transaction.atomic():
+                start = time.perf_counter()
+                self.create_rows(rows)
+                self.stdout.write(f"{rows} books created in {time.perf_counter() - start:.1f} s")
+                for name, method, path, data, headers, view_attrs in self.get_scenarios(rows):
+                    with self.view_attributes(view_attrs):
+                        result = self.measure(
+                            name, method, path, data, headers, options["repeat"], clear_cache=not view_attrs
+                        )
+                    result["rows"] = rows
+                    results.append(result)
+                    self.write_result(result, baseline.get((rows, name)))
+                transaction.set_rollback(True)
+
+        if options["output"]:
+            with open(options["output"], "w") as report:
+                json.dump({"meta": self.get_meta(options), "results": results}, report, indent=2)
+            self.stdout.write(f"Report written to {options['output']}")
+
+    def create_rows(self, count, batch_size=5000):
+        authors = [
+            Author(
+                name=f"Author {i}",
+                bio="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * (i % 4),
+                birth_date=datetime.date(1930, 1, 1) + datetime.timedelta(days=i % 25000),
+            )
+            for i in range(max(count // 10, 1))
+        ]
+        Author.objects.bulk_create(authors, batch_size=batch_size)
+        books = (
+            Book(
+                title=f"Book {i}",
+                author=authors[i % len(authors)],
+                published_date=datetime.date(1950, 1, 1) + datetime.timedelta(days=i % 25000),
+                isbn=f"{i:013d}",
+                pages=i % 1000,
+                description="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * (i % 3),
+            )
+            for i in range(count)
+        )
+        while batch := list(itertools.islice(books, batch_size)):
+            Book.objects.bulk_create(batch)
+
+    @contextlib.contextmanager
+    def view_attributes(self, view_attrs):
+        """Set class attributes of the sample views for the duration of a scenario."""
+        saved = [
+            (view_class, name, name in view_class.__dict__, view_class.__dict__.get(name))
+            for view_class, attrs in view_attrs.items() for name in attrs
+        ]
+        for view_class, attrs in view_attrs.items():
+            for name, value in attrs.items():
+                setattr(view_class, name, value)
+        try:
+            yield
+        finally:
+            for view_class, name, was_set, value in saved:
+                if was_set:
+                    setattr(view_class, name, value)
+                else:
+                    delattr(view_class, name)
+
+    def get_scenarios(self, rows):
+        """
+        Return (name, method, path, data, headers, view_attrs) for each request to benchmark.
+
+        view_attrs maps view classes to attributes set for the scenario. Scenarios
+        with view_attrs keep the cache between requests, so the timed requests are
+        served from the fragment cache the first request filled.
+        """
+        book = Book.objects.filter(isbn=f"{rows // 2:013d}").select_related("author").get()
+        author = book.author
+        book_list = reverse("sample:book-list")
+        author_list = reverse("sample:author-list")
+        book_pages = -(-Book.objects.count() // BookCRUDView.paginate_by)
+        author_pages = -(-Author.objects.count() // AuthorCRUDView.paginate_by)
+        new_isbns = (f"N{i:012d}" for i in itertools.count())
+
+        return [
+            ("book_list", "get", book_list, {}, {}, {}),
+            ("book_list_htmx", "get", book_list, {}, HTMX, {}),
+            ("author_list", "get", author_list, {}, {}, {}),
+            ("book_filter_author", "get", book_list, {"author": author.pk}, FILTER, {}),
+            ("book_filter_title", "get", book_list, {"title": book.title}, FILTER, {}),
+            ("book_search", "get", book_list, {"q": book.title}, FILTER, {}),
+            ("book_sort", "get", book_list, {"sort": "-published_date"}, FILTER, {}),
+            ("book_page_middle", "get", book_list, {"page": max(book_pages // 2, 1)}, HTMX, {}),
+            ("book_page_last", "get", book_list, {"page": "last"}, HTMX, {}),
+            (
+                "book_list_cached", "get", book_list, {"sort": "title"}, FILTER,
+                {BookCRUDView: {"fragment_cache_timeout": 300}},
+            ),
+            ("author_page_middle", "get", author_list, {"page": max(author_pages // 2, 1)}, HTMX, {}),
+            ("book_detail", "get", reverse("sample:book-detail", args=[book.pk]), {}, MODAL, {}),
+            ("author_detail", "get", reverse("sample:author-detail", args=[author.pk]), {}, MODAL, {}),
+            ("book_update_form", "get", reverse("sample:book-update", args=[book.pk]), {}, MODAL, {}),
+            (
+                "book_create", "post", reverse("sample:book-create"),
+                lambda: {
+                    "title": "New book", "author": author.pk, "published_date": "2001-01-01",
+                    "isbn": next(new_isbns), "pages": 100,
+                },
+                MODAL, {},
+            ),
+            (
+                "book_update", "post", reverse("sample:book-update", args=[book.pk]),
+                {
+                    "title": book.title, "author": author.pk, "published_date": book.published_date.isoformat(),
+                    "isbn": book.isbn, "pages": book.pages + 1, "description": book.description,
+                },
+                MODAL, {},
+            ),
+            (
+                "author_update", "post", reverse("sample:author-update", args=[author.pk]),
+                {"name": author.name, "bio": author.bio, "birth_date": author.birth_date.isoformat()},
+                MODAL, {},
+            ),
+        ]
+
+    def request(self, client, method, path, data, headers, clear_cache=True):
+        if clear_cache:
+            cache.clear()
+        response = getattr(client, method)(path, data() if callable(data) else data, headers=headers)
+        if getattr(response, "streaming", False):
+            return response, b"".join(response.streaming_content)
+        return response, response.content
+
+    def measure(self, name, method, path, data, headers, repeat, clear_cache=True):
+        client = Client(SERVER_NAME="localhost")
+        # a first request fills the per-class caches, which every later request reuses
+        self.request(client, method, path, data, headers)
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            self.request(client, method, path, data, headers, clear_cache)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        # counting queries and tracing allocations slow the request down, so they get a run of their own
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                response, content = self.request(client, method, path, data, headers, clear_cache)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        if response.status_code >= 400:
+            self.stderr.write(self.style.WARNING(f"{name}: {method.upper()} {path} returned {response.status_code}"))
+        return {
+            "scenario": name,
+            "method": method.upper(),
+            "path": path,
+            "status": response.status_code,
+            "wall_ms": {
+                "min": round(min(timings), 3),
+                "median": round(statistics.median(timings), 3),
+                "max": round(max(timings), 3),
+            },
+            "queries": len(queries),
+            "bytes": len(content),
+            "peak_memory_kib": round(peak_memory / 1024, 1),
+        }
+
+    def write_result(self, result, baseline=None):
+        line = (
+            f"{result['rows']:>8}  {result['scenario']:<20} {result['status']}  "
+            f"{result['wall_ms']['median']:9.2f} ms  {result['queries']:3d} queries  "
+            f"{result['bytes']:8d} bytes  {result['peak_memory_kib']:9.1f} KiB"
+        )
+        if baseline:
+            line += f"  {result['wall_ms']['median'] / baseline['wall_ms']['median']:5.2f}x"
+        self.stdout.write(line)
+
+    def load_report(self, path):
+        try:
+            with open(path) as report:
+                results = json.load(report)["results"]
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f"Could not read the report {path}: {exc}")
+        return {(result["rows"], result["scenario"]): result for result in results}
+
+    def get_meta(self, options):
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "commit": commit,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "repeat": options["repeat"],
+            "paginate_by": {"book": BookCRUDView.paginate_by, "author": AuthorCRUDView.paginate_by},
+        }
@@ -0,0 +1,88 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django_htmx.middleware import HtmxDetails
+from neapolitan.views import Role
+
+from nominopolitan.templatetags.nominopolitan import object_list as object_list_tag
+from sample.models import Author, Book
+from sample.views import BookCRUDView
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rendering the list's table rows with the rows template and with "
+        "use_fast_rows, checking that both give the same HTML. Sample books are "
+        "created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[25, 100, 500], help="Page sizes to render.")
+        parser.add_argument("--repeat", type=int, default=20, help="Renders per measurement; the fastest is reported.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_books(max(options["rows"]))
+            for rows in options["rows"]:
+                self.benchmark(rows, options["repeat"])
+            transaction.set_rollback(True)
+
+    def create_books(self, count):
+        authors = Author.objects.bulk_create(
+            Author(name=f"Benchmark author {i}", birth_date=datetime.date(1970, 1, 1)) for i in range(50)
+        )
+        Book.objects.bulk_create(
+            Book(
+                title=f"Benchmark book {i} <{i}> & \"{i}\"",
+                author=authors[i % len(authors)],
+                published_date=datetime.date(2000, 1, 1) + datetime.timedelta(days=i),
+                isbn=f"B{i:012d}",
+                pages=i,
+                description="Lorem ipsum dolor sit amet " * 3,
+            )
+            for i in range(count)
+        )
+
+    def get_view(self):
+        request = RequestFactory().get("/sample/book/", headers={"HX-Request": "true", "HX-Target": "content"})
+        request.htmx = HtmxDetails(request)
+        view = BookCRUDView(**Role.LIST.extra_initkwargs())
+        view.role = Role.LIST
+        view.setup(request)
+        return view
+
+    def render(self, objects, fast):
+        view = self.get_view()
+        view.use_fast_rows = fast
+        context = {"page_obj": None}
+        context.update(object_list_tag(context, objects, view))
+        return render_to_string(f"{view.templates_path}/partial/list.html#rows", context)
+
+    def measure(self, objects, fast, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            html = self.render(objects, fast)
+            timings.append(time.perf_counter() - start)
+        return min(timings), html
+
+    def benchmark(self, rows, repeat):
+        view = self.get_view()
+        queryset, _ = view.get_list_queryset()
+        objects = list(queryset.filter(isbn__startswith="B")[:rows])
+
+        template_time, template_html = self.measure(objects, False, repeat)
+        fast_time, fast_html = self.measure(objects, True, repeat)
+        identical = template_html == fast_html
+
+        self.stdout.write(
+            f"{len(objects):>5} rows  template {template_time * 1000:8.2f} ms  "
+            f"fast {fast_time * 1000:8.2f} ms  speedup {template_time / fast_time:5.1f}x  "
+            f"identical {identical}"
+        )
+        if not identical:
+            self.stderr.write(self.style.ERROR("The fast row renderer's output differs from the template's"))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample', '0003_book_isbn_empty'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='author',
+            name='birth_date',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='author',
+            name='name',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='pages',
+            field=models.IntegerField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='published_date',
+            field=models.DateField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='title',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+    ]
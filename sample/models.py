@@ -2,9 +2,9 @@ from django.db import models
 
 
 class Author(models.Model):
-    name = models.CharField(max_length=200)
+    name = models.CharField(max_length=200, db_index=True)
     bio = models.TextField(blank=True)
-    birth_date = models.DateField(null=True, blank=True)
+    birth_date = models.DateField(null=True, blank=True, db_index=True)
 
     @property
     def has_bio(self):
@@ -15,9 +15,9 @@ class Author(models.Model):
 
 
 class Book(models.Model):
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, db_index=True)
     author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="books")
-    published_date = models.DateField()
+    published_date = models.DateField(db_index=True)
     isbn = models.CharField(max_length=13, unique=True)
     isbn_empty=models.GeneratedField(
         expression=(
@@ -31,7 +31,7 @@ class Book(models.Model):
         output_field=models.BooleanField(),
         db_persist=True
     )
-    pages = models.IntegerField()
+    pages = models.IntegerField(db_index=True)
     description = models.TextField(blank=True)
     uneditable_field = models.CharField(max_length=200, blank=True, null=True, editable=False)
 
@@ -4,12 +4,14 @@ from neapolitan.views import CRUDView
 from nominopolitan.mixins import NominopolitanMixin
 
 from django import forms
+from django.db.models import Q
 from . import models
 from . import forms
 from . import filters
 
 class BookCRUDView(NominopolitanMixin, CRUDView):
     model = models.Book
+    queryset = models.Book.objects.order_by("pk") # pages need a stable order
     namespace = "sample"
     base_template_path = "django_nominopolitan/base.html"
     use_htmx = True
@@ -20,10 +22,20 @@ class BookCRUDView(NominopolitanMixin, CRUDView):
     fields =  "__all__"
     # exclude = ['pages','description']
     # properties = '__all__'
+    properties = ["many_pages"]
+    property_annotations = {"many_pages": Q(pages__gt=10)} # loaded, filtered and sorted in SQL
     detail_fields = '__all__'
     detail_properties = '__all__'
+    related_only = {"author": ["name"]} # Author.__str__ only needs name
+    use_column_toggles = True
+    export_formats = ["csv", "jsonl"]
+    sortable_fields = ["title", "published_date", "isbn", "pages"] # each has an index
+    search_fields = ["title", "description", "author__name"]
+    bulk_actions = ["delete", "update"]
+    bulk_update_fields = ["author", "pages", "published_date"]
+    use_import = True
 
-    filterset_fields = ['author', 'title', 'published_date','isbn', 'isbn_empty','pages', 'description', 'uneditable_field']
+    filterset_fields = ['author', 'title', 'published_date','isbn', 'isbn_empty','pages', 'description', 'uneditable_field', 'many_pages']
     # filterset_class = filters.BookFilterSet
 
     form_class = forms.BookForm
@@ -33,6 +45,7 @@ class BookCRUDView(NominopolitanMixin, CRUDView):
 
 class AuthorCRUDView(NominopolitanMixin, CRUDView):
     model = models.Author
+    queryset = models.Author.objects.order_by("pk")
     namespace = "sample"
     base_template_path = "django_nominopolitan/base.html"
     use_htmx = True
@@ -49,6 +62,9 @@ class AuthorCRUDView(NominopolitanMixin, CRUDView):
     properties_exclude = ['has_bio',]
     detail_fields = '__fields__'
     detail_properties = '__properties__'
+    property_fields = {"has_bio": ["bio"]}
+    sortable_fields = ["name", "birth_date"] # each has an index
+    max_sort_columns = 2
 
     # filterset_class = filters.AuthorFilterSet
     filterset_fields = ['name', 'birth_date', 'bio']